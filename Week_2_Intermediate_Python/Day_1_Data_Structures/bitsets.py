@@ -0,0 +1,492 @@
+"""
+Python Bitset Set Algebra Tutorial
+
+sets.py answers questions such as
+    common_elements = set(list1) & set(list2)
+    has_required_skills = required_skills <= candidate_skills
+with Python sets of strings. Every set stores a hash table of object
+pointers, and rebuilding sets from lists on each call repeats that work.
+This file stores sets of integers as compressed bitsets instead:
+1. Interning strings to small integer ids
+2. Roaring-style bitmaps: values are split into 65536-wide chunks, each
+   stored as a bitmap (dense) or a sorted array of 16-bit values (sparse)
+3. AND / OR / XOR / difference and subset checks as whole-word bit operations
+4. Bulk operations over many sets at once
+5. A word matrix that checks a subset against many bitmaps in one NumPy call
+6. Serialising bitmaps and interners to bytes for caching
+
+Run this file to see the examples and the benchmark.
+"""
+
+import json
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+from collections import defaultdict
+from functools import reduce
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import np  # np is None without NumPy; BitmapMatrix rows are Python ints instead
+
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+VALUE_LIMIT = 1 << 64  # values must fit in 64 bits, so keys fit in to_bytes' '<Q'
+
+# Bit positions set in each byte value, used to turn a bitmap back into values
+_BYTE_BITS = [tuple(j for j in range(8) if byte >> j & 1) for byte in range(256)]
+
+
+def _bits_from_values(values):
+    """Build an int bitmap from 16-bit values"""
+    buffer = bytearray((max(values) >> 3) + 1)
+    for value in values:
+        buffer[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def _values_from_bits(bits):
+    """Return the positions of the set bits in ascending order"""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+    values = array('H')
+    for offset, byte in enumerate(data):
+        if byte:
+            base = offset << 3
+            values.extend(base + j for j in _BYTE_BITS[byte])
+    return values
+
+
+def _as_bits(container):
+    return container if isinstance(container, int) else _bits_from_values(container)
+
+
+def _pack(bits):
+    """
+    Choose the smaller representation for one chunk.
+
+    A bitmap costs one bit per position up to the highest value, an array
+    costs two bytes per value plus about 64 bytes of object overhead.
+    Returns None for an empty chunk.
+    """
+    count = bits.bit_count()
+    if not count:
+        return None
+    if (bits.bit_length() + 7) // 8 <= 2 * count + 64:
+        return bits
+    return _values_from_bits(bits)
+
+
+class RoaringBitmap:
+    """
+    A compressed set of non-negative integers.
+
+    Values are grouped by their high 16 bits. Each group (container) is a
+    Python int used as a bitmap or an array('H') of low bits, whichever is
+    smaller. Set operations work container by container, so for dense
+    data they are bitwise operations on machine words.
+    """
+
+    __slots__ = ('_containers',)
+
+    def __init__(self, values=()):
+        chunks = defaultdict(list)
+        for value in values:
+            if not 0 <= value < VALUE_LIMIT:
+                raise ValueError("RoaringBitmap stores integers from 0 to 2**64 - 1")
+            chunks[value >> CHUNK_BITS].append(value & CHUNK_MASK)
+        self._containers = {key: _pack(_bits_from_values(low))
+                            for key, low in sorted(chunks.items())}
+
+    @classmethod
+    def _from_containers(cls, containers):
+        bitmap = cls.__new__(cls)
+        bitmap._containers = {key: c for key, c in sorted(containers.items()) if c is not None}
+        return bitmap
+
+    def __len__(self):
+        return sum(c.bit_count() if isinstance(c, int) else len(c)
+                   for c in self._containers.values())
+
+    def __iter__(self):
+        for key, container in self._containers.items():
+            base = key << CHUNK_BITS
+            low_values = _values_from_bits(container) if isinstance(container, int) else container
+            for low in low_values:
+                yield base + low
+
+    def __contains__(self, value):
+        container = self._containers.get(value >> CHUNK_BITS)
+        if container is None:
+            return False
+        low = value & CHUNK_MASK
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        return low in container
+
+    def __eq__(self, other):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        return ({k: _as_bits(c) for k, c in self._containers.items()}
+                == {k: _as_bits(c) for k, c in other._containers.items()})
+
+    def __repr__(self):
+        return f"RoaringBitmap({len(self)} values, {len(self._containers)} containers)"
+
+    # Set operations --------------------------------------------------------
+
+    def __and__(self, other):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        shared = self._containers.keys() & other._containers.keys()
+        return RoaringBitmap._from_containers({
+            key: _pack(_as_bits(self._containers[key]) & _as_bits(other._containers[key]))
+            for key in shared})
+
+    def __or__(self, other):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        result = dict(self._containers)
+        for key, container in other._containers.items():
+            if key in result:
+                result[key] = _pack(_as_bits(result[key]) | _as_bits(container))
+            else:
+                result[key] = container
+        return RoaringBitmap._from_containers(result)
+
+    def __xor__(self, other):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        result = dict(self._containers)
+        for key, container in other._containers.items():
+            if key in result:
+                result[key] = _pack(_as_bits(result[key]) ^ _as_bits(container))
+            else:
+                result[key] = container
+        return RoaringBitmap._from_containers(result)
+
+    def __sub__(self, other):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        result = dict(self._containers)
+        for key, container in other._containers.items():
+            if key in result:
+                result[key] = _pack(_as_bits(result[key]) & ~_as_bits(container))
+        return RoaringBitmap._from_containers(result)
+
+    def issubset(self, other):
+        """True if every value of self is in other (a & ~b == 0 per container)"""
+        if not isinstance(other, RoaringBitmap):
+            other = RoaringBitmap(other)  # like set.issubset, accept any iterable
+        for key, container in self._containers.items():
+            theirs = other._containers.get(key)
+            if theirs is None:
+                return False
+            mine = _as_bits(container)
+            if mine & _as_bits(theirs) != mine:
+                return False
+        return True
+
+    def issuperset(self, other):
+        if not isinstance(other, RoaringBitmap):
+            other = RoaringBitmap(other)
+        return other.issubset(self)
+
+    def __le__(self, other):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        return self.issubset(other)
+
+    def __ge__(self, other):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        return other.issubset(self)
+
+    # Serialisation ---------------------------------------------------------
+
+    def to_bytes(self):
+        """
+        Layout: container count, then per container its key (8 bytes), kind
+        (0 = array, 1 = bitmap), payload length and payload.
+        """
+        parts = [struct.pack('<I', len(self._containers))]
+        for key, container in self._containers.items():
+            if isinstance(container, int):
+                payload = container.to_bytes((container.bit_length() + 7) // 8, 'little')
+                kind = 1
+            else:
+                values = array('H', container)
+                if sys.byteorder == 'big':
+                    values.byteswap()  # always store little-endian
+                payload = values.tobytes()
+                kind = 0
+            parts.append(struct.pack('<QBI', key, kind, len(payload)))
+            parts.append(payload)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        (count,), offset = struct.unpack_from('<I', data), 4
+        containers = {}
+        header = struct.calcsize('<QBI')
+        for _ in range(count):
+            key, kind, length = struct.unpack_from('<QBI', data, offset)
+            offset += header
+            payload = data[offset:offset + length]
+            offset += length
+            if kind == 1:
+                containers[key] = int.from_bytes(payload, 'little')
+            else:
+                values = array('H', payload)
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                containers[key] = values
+        return cls._from_containers(containers)
+
+
+def intersect_all(bitmaps):
+    """Intersect many bitmaps, smallest first so the result shrinks quickly"""
+    bitmaps = sorted(bitmaps, key=len)
+    if not bitmaps:
+        return RoaringBitmap()
+    result = bitmaps[0]
+    for bitmap in bitmaps[1:]:
+        result = result & bitmap
+        if not result._containers:
+            break
+    return result
+
+
+def union_all(bitmaps):
+    """OR many bitmaps together, one bitwise OR per container key"""
+    merged = defaultdict(int)
+    for bitmap in bitmaps:
+        for key, container in bitmap._containers.items():
+            merged[key] |= _as_bits(container)
+    return RoaringBitmap._from_containers({key: _pack(bits) for key, bits in merged.items()})
+
+
+def xor_all(bitmaps):
+    return reduce(lambda a, b: a ^ b, bitmaps, RoaringBitmap())
+
+
+class BitmapMatrix:
+    """
+    Many bitmaps stored as the rows of one matrix of 64-bit words.
+
+    Every container key used by any row gets a block of columns just wide
+    enough for the highest bit set under that key, so 200 interned skills
+    take 4 words per row. Building the matrix loops over the bitmaps once;
+    after that superset_rows() checks every row with a single NumPy AND
+    and comparison. Without NumPy each row is one Python int.
+    """
+
+    def __init__(self, bitmaps):
+        bitmaps = list(bitmaps)
+        widths = defaultdict(int)  # key -> words needed for that key's bits
+        for bitmap in bitmaps:
+            for key, container in bitmap._containers.items():
+                words = (_as_bits(container).bit_length() + 63) // 64
+                widths[key] = max(widths[key], words)
+        self._offsets = {}  # key -> (first word, number of words)
+        start = 0
+        for key in sorted(widths):
+            self._offsets[key] = (start, widths[key])
+            start += widths[key]
+        self.words = start
+        self.rows = len(bitmaps)
+        rows = [self._row_bits(bitmap) for bitmap in bitmaps]
+        if np is not None:
+            size = 8 * self.words
+            data = b''.join(bits.to_bytes(size, 'little') for bits in rows)
+            self._matrix = np.frombuffer(data, dtype='<u8').reshape(self.rows, self.words)
+        else:
+            self._matrix = rows
+
+    def __len__(self):
+        return self.rows
+
+    def _row_bits(self, bitmap):
+        """Lay a bitmap's containers out as one int in the matrix's column order"""
+        bits = 0
+        for key, container in bitmap._containers.items():
+            first, _ = self._offsets[key]
+            bits |= _as_bits(container) << (64 * first)
+        return bits
+
+    def superset_rows(self, required):
+        """Return the positions of the rows that contain every value of required"""
+        for key, container in required._containers.items():
+            _, words = self._offsets.get(key, (0, 0))
+            if _as_bits(container).bit_length() > 64 * words:
+                return []  # no row has a bit that high under this key
+        needed = self._row_bits(required)
+        if np is None:
+            return [position for position, row in enumerate(self._matrix)
+                    if row & needed == needed]
+        wanted = np.frombuffer(needed.to_bytes(8 * self.words, 'little'), dtype='<u8')
+        columns = np.flatnonzero(wanted)  # only words with a required bit matter
+        block, wanted = self._matrix[:, columns], wanted[columns]
+        return np.flatnonzero(((block & wanted) == wanted).all(axis=1)).tolist()
+
+
+def superset_indices(required, candidates):
+    """
+    Return the positions of the candidates that contain every required value.
+
+    candidates is a list of bitmaps or a BitmapMatrix. For a list the
+    required containers are converted to bitmaps once and each candidate
+    check is one AND and one comparison per container, in a Python loop;
+    build a BitmapMatrix once to answer repeated queries in a single
+    vectorized step.
+    """
+    if isinstance(candidates, BitmapMatrix):
+        return candidates.superset_rows(required)
+    needed = [(key, _as_bits(container)) for key, container in required._containers.items()]
+    if len(needed) == 1:
+        # Common case (small domains such as skills): one AND per candidate
+        key, bits = needed[0]
+        return [position for position, candidate in enumerate(candidates)
+                if bits & _as_bits(candidate._containers.get(key, 0)) == bits]
+    matches = []
+    for position, candidate in enumerate(candidates):
+        containers = candidate._containers
+        for key, bits in needed:
+            theirs = containers.get(key)
+            if theirs is None or bits & _as_bits(theirs) != bits:
+                break
+        else:
+            matches.append(position)
+    return matches
+
+
+class Interner:
+    """Map hashable items (usually strings) to dense integer ids and back"""
+
+    def __init__(self, items=()):
+        self.ids = {}
+        self.items = []
+        for item in items:
+            self.intern(item)
+
+    def __len__(self):
+        return len(self.items)
+
+    def intern(self, item):
+        item_id = self.ids.get(item)
+        if item_id is None:
+            item_id = self.ids[item] = len(self.items)
+            self.items.append(item)
+        return item_id
+
+    def lookup(self, item_id):
+        return self.items[item_id]
+
+    def to_bytes(self):
+        return json.dumps(self.items).encode()
+
+    @classmethod
+    def from_bytes(cls, data):
+        return cls(json.loads(data))
+
+
+class SetEngine:
+    """
+    Build and decode bitmaps for sets of arbitrary hashable items.
+
+    engine.make({"Python", "SQL"}) interns the strings and returns a
+    RoaringBitmap of their ids; engine.decode(bitmap) turns it back into
+    a Python set.
+    """
+
+    def __init__(self, interner=None):
+        self.interner = interner or Interner()
+
+    def make(self, items):
+        intern = self.interner.intern
+        return RoaringBitmap(intern(item) for item in items)
+
+    def make_many(self, collections):
+        return [self.make(items) for items in collections]
+
+    def decode(self, bitmap):
+        items = self.interner.items
+        return {items[item_id] for item_id in bitmap}
+
+
+def benchmark():
+    """Compare Python sets with bitmaps for entitlement checks and big intersections"""
+    skills = [f"skill{i}" for i in range(200)]
+    users = [set(random.sample(skills, random.randint(5, 40))) for _ in range(200_000)]
+    required = {"skill1", "skill2", "skill3"}
+    engine = SetEngine(Interner(skills))
+    user_bitmaps = engine.make_many(users)
+    required_bitmap = engine.make(required)
+
+    start = time.perf_counter()
+    expected = [i for i, user in enumerate(users) if required <= user]
+    set_time = time.perf_counter() - start
+    start = time.perf_counter()
+    found = superset_indices(required_bitmap, user_bitmaps)
+    bitmap_time = time.perf_counter() - start
+    start = time.perf_counter()
+    matrix = BitmapMatrix(user_bitmaps)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    matrix_found = superset_indices(required_bitmap, matrix)
+    matrix_time = time.perf_counter() - start
+    print(f"Subset checks over {len(users):,} users: set {set_time:.3f} s, "
+          f"bitmap list {bitmap_time:.3f} s, "
+          f"word matrix {matrix_time:.4f} s ({'NumPy' if np else 'Python ints'}, "
+          f"built once in {build_time:.3f} s) "
+          f"(same: {found == expected and matrix_found == expected})")
+
+    list1 = random.sample(range(10_000_000), 1_000_000)
+    list2 = random.sample(range(10_000_000), 1_000_000)
+    start = time.perf_counter()
+    common = set(list1) & set(list2)
+    set_time = time.perf_counter() - start
+    a, b = RoaringBitmap(list1), RoaringBitmap(list2)
+    start = time.perf_counter()
+    common_bitmap = a & b
+    bitmap_time = time.perf_counter() - start
+    print(f"Intersect two 1M-value lists: set(list1) & set(list2) {set_time:.3f} s, "
+          f"prebuilt bitmaps {bitmap_time:.4f} s (same size: {len(common_bitmap) == len(common)})")
+    print(f"Serialised bitmap of 1M values: {len(a.to_bytes()) / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    print("\n=== Interning and Bitmaps ===")
+    engine = SetEngine()
+    required = engine.make({"Python", "SQL", "Git"})
+    candidate = engine.make({"Python", "JavaScript", "Git", "SQL", "HTML"})
+    print("Interned ids:", engine.interner.ids)
+    print("Candidate bitmap:", candidate, sorted(candidate))
+
+    print("\n=== Set Operations ===")
+    A, B = RoaringBitmap([1, 2, 3, 4, 5]), RoaringBitmap([4, 5, 6, 7, 8])
+    print("A | B:", list(A | B))
+    print("A & B:", list(A & B))
+    print("A - B:", list(A - B))
+    print("A ^ B:", list(A ^ B))
+    print("Candidate has all required skills:", required <= candidate)
+    print("Decoded required skills:", engine.decode(required))
+
+    print("\n=== Bulk Operations ===")
+    teams = [engine.make(team) for team in (
+        {"Python", "SQL", "Git", "Docker"}, {"Python", "Git"}, {"SQL", "Git", "Python"})]
+    print("Skills every team has:", engine.decode(intersect_all(teams)))
+    print("Skills any team has:", engine.decode(union_all(teams)))
+    print("Teams with all required skills:", superset_indices(required, teams))
+    print("Same answer from a word matrix:", superset_indices(required, BitmapMatrix(teams)))
+
+    print("\n=== Sparse and Dense Containers ===")
+    mixed = RoaringBitmap(list(range(0, 65536, 2)) + [10 ** 6, 10 ** 9])
+    print(mixed, {key: type(c).__name__ for key, c in mixed._containers.items()})
+    restored = RoaringBitmap.from_bytes(mixed.to_bytes())
+    print("Round trip equal:", restored == mixed, f"({len(mixed.to_bytes())} bytes)")
+    print("Interner round trip:", Interner.from_bytes(engine.interner.to_bytes()).ids == engine.interner.ids)
+
+    print("\n=== Benchmark ===")
+    benchmark()
@@ -0,0 +1,296 @@
+"""
+Python Streaming Deduplication Tutorial
+
+data_structures_exercises.py removes duplicates with
+    list(dict.fromkeys(items))
+and sets.py uses set(numbers_with_duplicates). Both need the whole input
+and every distinct value in memory at once. This file removes duplicates
+from streams of any length, keeping the first occurrence in order:
+1. Generators that work over any iterator, with key functions
+2. Exact mode that keeps fixed-size fingerprints and spills them to an
+   on-disk SQLite table when memory runs out
+3. Approximate mode with a Bloom filter sized for a target false-positive rate
+4. Benchmarking against dict.fromkeys()
+
+Run this file to see the examples and the benchmark.
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import tempfile
+import time
+from itertools import islice
+
+BATCH_SIZE = 10_000
+SQLITE_MAX_VARIABLES = 999  # the default limit before SQLite 3.32
+
+
+def _framed(parts):
+    """Join byte strings with length prefixes, so the split is unambiguous"""
+    return b"".join(b"%d:%s" % (len(part), part) for part in parts)
+
+
+def _canonical(key):
+    """
+    Encode key as bytes so that keys comparing equal encode the same.
+
+    This mirrors ==, which a set relies on: 1, 1.0 and True are one key,
+    and dicts (or sets) with the same entries are equal whatever order
+    they were built in. Supported: None, bool, int, float, str, bytes,
+    tuples, lists, dicts, sets and frozensets of those. Anything else
+    raises TypeError - pass a key function that returns a supported value.
+    """
+    if isinstance(key, str):
+        return b"s" + key.encode('utf-8', 'surrogatepass')
+    if isinstance(key, int):  # includes bool
+        return b"i%d" % key
+    if isinstance(key, float):
+        return b"i%d" % key if key.is_integer() else b"f" + key.hex().encode()
+    if isinstance(key, (bytes, bytearray)):
+        return b"b" + key
+    if key is None:
+        return b"n"
+    if isinstance(key, tuple):
+        return b"t" + _framed(map(_canonical, key))
+    if isinstance(key, list):
+        return b"l" + _framed(map(_canonical, key))
+    if isinstance(key, dict):
+        return b"d" + _framed(sorted(_framed((_canonical(k), _canonical(v)))
+                                     for k, v in key.items()))
+    if isinstance(key, (set, frozenset)):
+        return b"e" + _framed(sorted(map(_canonical, key)))
+    raise TypeError(f"Cannot fingerprint {type(key).__name__!r} keys; "
+                    f"use key= to map items to str, bytes, numbers or tuples")
+
+
+def _fingerprint(key):
+    """
+    Return a 16-byte digest of key's canonical encoding.
+
+    Equal keys get equal fingerprints, and the type tags keep 1 and '1'
+    apart. With 128 bits, a collision between two different keys is far
+    less likely than a hardware error.
+    """
+    return hashlib.blake2b(_canonical(key), digest_size=16).digest()
+
+
+def unique(iterable, key=None):
+    """Yield items whose key has not been seen before (everything in memory)"""
+    seen = set()
+    for item in iterable:
+        marker = item if key is None else key(item)
+        if marker not in seen:
+            seen.add(marker)
+            yield item
+
+
+class ExactDeduper:
+    """
+    Exact order-preserving dedup with bounded memory.
+
+    Up to max_memory_keys fingerprints are kept in a set. When the set is
+    full it is written to a SQLite table on disk and cleared. Items are
+    handled in batches so the disk is asked about a whole batch with one
+    query instead of once per item.
+    """
+
+    def __init__(self, key=None, max_memory_keys=1_000_000, directory=None):
+        self.key = key
+        self.max_memory_keys = max_memory_keys
+        self.directory = directory
+        self.memory = set()
+        self.spilled = 0
+        self._db = None
+        self._path = None
+
+    def _open_db(self):
+        handle, self._path = tempfile.mkstemp(suffix='.sqlite', dir=self.directory)
+        os.close(handle)
+        self._db = sqlite3.connect(self._path)
+        self._db.execute("PRAGMA journal_mode = OFF")
+        self._db.execute("PRAGMA synchronous = OFF")
+        self._db.execute("CREATE TABLE seen (fingerprint BLOB PRIMARY KEY) WITHOUT ROWID")
+
+    def _spill(self):
+        if self._db is None:
+            self._open_db()
+        with self._db:
+            self._db.executemany("INSERT OR IGNORE INTO seen VALUES (?)",
+                                 ((f,) for f in self.memory))
+        self.spilled += len(self.memory)
+        self.memory.clear()
+
+    def _on_disk(self, fingerprints):
+        """Return the subset of fingerprints already stored on disk"""
+        if self._db is None or not fingerprints:
+            return set()
+        found = set()
+        fingerprints = list(fingerprints)
+        for start in range(0, len(fingerprints), SQLITE_MAX_VARIABLES):
+            part = fingerprints[start:start + SQLITE_MAX_VARIABLES]
+            query = f"SELECT fingerprint FROM seen WHERE fingerprint IN ({','.join('?' * len(part))})"
+            found.update(row[0] for row in self._db.execute(query, part))
+        return found
+
+    def filter(self, iterable, batch_size=BATCH_SIZE):
+        """Yield the first occurrence of every key, in input order"""
+        key = self.key
+        iterator = iter(iterable)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            prints = [_fingerprint(item if key is None else key(item)) for item in batch]
+            on_disk = self._on_disk({f for f in prints if f not in self.memory})
+            memory = self.memory
+            for item, fingerprint in zip(batch, prints):
+                if fingerprint in memory or fingerprint in on_disk:
+                    continue
+                memory.add(fingerprint)
+                yield item
+            if len(memory) >= self.max_memory_keys:
+                self._spill()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            os.remove(self._path)
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def unique_exact(iterable, key=None, max_memory_keys=1_000_000, directory=None):
+    """Generator form of ExactDeduper; the spill file is removed at the end"""
+    with ExactDeduper(key, max_memory_keys, directory) as deduper:
+        yield from deduper.filter(iterable)
+
+
+class BloomFilter:
+    """
+    A set that may answer "maybe present" for items never added.
+
+    For capacity n and false-positive rate p it uses
+        m = -n * ln(p) / ln(2)**2 bits and k = m / n * ln(2) hash functions.
+    Items that were added are always reported as present. Adding more than
+    capacity items makes the false-positive rate climb above p.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        # Double hashing: positions h1 + i*h2 from the two halves of one digest
+        digest = int.from_bytes(_fingerprint(key), 'little')
+        size = self.size
+        h1, h2 = digest % size, (digest >> 64) % size or 1
+        return [p % size for p in range(h1, h1 + self.hashes * h2, h2)]
+
+    def __contains__(self, key):
+        bits = self.bits
+        return all(bits[p >> 3] >> (p & 7) & 1 for p in self._positions(key))
+
+    def add(self, key):
+        """Add key; return True if it was (probably) not there before"""
+        bits = self.bits
+        new = False
+        for p in self._positions(key):
+            byte, mask = p >> 3, 1 << (p & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                new = True
+        self.count += new
+        return new
+
+    def memory_bytes(self):
+        return len(self.bits)
+
+
+def unique_approx(iterable, capacity, error_rate=0.001, key=None):
+    """
+    Yield items whose key is probably new, using a fixed-size Bloom filter.
+
+    Never yields a duplicate; about error_rate of the distinct items are
+    wrongly dropped as duplicates (while under capacity).
+    """
+    bloom = BloomFilter(capacity, error_rate)
+    for item in iterable:
+        if bloom.add(item if key is None else key(item)):
+            yield item
+
+
+def event_stream(n, distinct):
+    """Generate n fake events drawn from `distinct` different user ids"""
+    for i in range(n):
+        yield {'user_id': (i * 7919) % distinct, 'seq': i}
+
+
+def benchmark(n=2_000_000, distinct=500_000):
+    """Dedup n events by user_id; run benchmark(100_000_000, ...) for the full-size test"""
+    by_user = lambda event: event['user_id']
+
+    start = time.perf_counter()
+    first = {}
+    for event in list(event_stream(n, distinct)):
+        first.setdefault(event['user_id'], event)
+    expected = list(first.values())
+    print(f"Whole list + dict (all in memory):   {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    count = sum(1 for _ in unique(event_stream(n, distinct), key=by_user))
+    print(f"unique() generator:                  {time.perf_counter() - start:.2f} s, {count:,} kept")
+
+    start = time.perf_counter()
+    with ExactDeduper(key=by_user, max_memory_keys=100_000) as deduper:
+        kept = [event['seq'] for event in deduper.filter(event_stream(n, distinct))]
+        spilled = deduper.spilled
+    print(f"Exact with disk spill (100k in RAM): {time.perf_counter() - start:.2f} s, "
+          f"{len(kept):,} kept, {spilled:,} fingerprints spilled, "
+          f"same as in-memory: {kept == [event['seq'] for event in expected]}")
+
+    start = time.perf_counter()
+    bloom_kept = sum(1 for _ in unique_approx(event_stream(n, distinct), distinct, 0.001, key=by_user))
+    bloom_size = BloomFilter(distinct, 0.001).memory_bytes()
+    print(f"Bloom filter (p=0.001):              {time.perf_counter() - start:.2f} s, "
+          f"{bloom_kept:,} kept ({distinct - bloom_kept} false positives), "
+          f"{bloom_size / 1e6:.2f} MB of bits")
+
+
+if __name__ == "__main__":
+    print("\n=== Order-Preserving Dedup ===")
+    items = ['apple', 'banana', 'apple', 'cherry', 'banana', 'date']
+    print("dict.fromkeys:", list(dict.fromkeys(items)))
+    print("unique():     ", list(unique(iter(items))))
+
+    print("\n=== Dedup Records by Field ===")
+    events = [{'user': 'alice', 'page': '/home'}, {'user': 'bob', 'page': '/cart'},
+              {'user': 'alice', 'page': '/cart'}, {'user': 'carol', 'page': '/home'}]
+    print("First event per user:", list(unique_exact(events, key=lambda e: e['user'])))
+
+    print("\n=== Exact Mode with Disk Spill ===")
+    numbers = (i % 1000 for i in range(10_000))
+    with ExactDeduper(max_memory_keys=100) as deduper:
+        result = list(deduper.filter(numbers, batch_size=250))
+        print(f"Kept {len(result)} values, in order: {result == list(range(1000))}, "
+              f"{deduper.spilled} fingerprints spilled to disk")
+
+    print("\n=== Approximate Mode (Bloom Filter) ===")
+    bloom = BloomFilter(capacity=1_000_000, error_rate=0.01)
+    print(f"{bloom.size:,} bits, {bloom.hashes} hash functions, {bloom.memory_bytes() / 1e6:.2f} MB")
+    print("Approximate unique:", list(unique_approx(items, capacity=100, error_rate=0.01)))
+
+    print("\n=== Benchmark ===")
+    benchmark()
@@ -0,0 +1,105 @@
+"""
+Python Geometry Kernels Tutorial
+
+tuples.py's calculate_circle(radius) returns an (area, circumference)
+tuple and basic_functions.py's calculate_area(length, width) returns a
+single number, each for one shape per call. For millions of shapes, the
+cost is in the calls and the tuples, not in the math.
+This file works on whole columns of shapes instead:
+1. Columns of radii and dimensions stored in arrays
+2. Results as structured arrays (one named field per measurement)
+3. math.pi precision instead of 3.14159
+4. NumPy vectorisation when installed, array.array otherwise
+5. Benchmarking against one call per shape
+
+Run this file to see the examples and the benchmark.
+"""
+
+import math
+import os
+import sys
+import time
+from array import array
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import np  # np is None without NumPy; array.array columns are used instead
+
+if np is not None:
+    CIRCLE_DTYPE = np.dtype([('area', 'f8'), ('circumference', 'f8')])
+    RECTANGLE_DTYPE = np.dtype([('area', 'f8'), ('perimeter', 'f8')])
+
+
+def calculate_circle(radius):
+    """The single-shape version from tuples.py (with math.pi)"""
+    area = math.pi * radius * radius
+    circumference = 2 * math.pi * radius
+    return (area, circumference)
+
+
+def circle_metrics(radii):
+    """
+    Return the area and circumference of every circle in radii.
+
+    With NumPy the result is a structured array, so result['area'] is a
+    column and result[0] is one (area, circumference) record. Without
+    NumPy it is a dictionary of array('d') columns, so result['area']
+    works the same way.
+    """
+    if np is not None:
+        r = np.asarray(radii, dtype=float)
+        result = np.empty(len(r), dtype=CIRCLE_DTYPE)
+        np.multiply(r * r, math.pi, out=result['area'])
+        np.multiply(r, 2 * math.pi, out=result['circumference'])
+        return result
+    pi, two_pi = math.pi, 2 * math.pi
+    return {'area': array('d', [pi * r * r for r in radii]),
+            'circumference': array('d', [two_pi * r for r in radii])}
+
+
+def rectangle_metrics(lengths, widths):
+    """Return the area and perimeter of every rectangle"""
+    if np is not None:
+        length = np.asarray(lengths, dtype=float)
+        width = np.asarray(widths, dtype=float)
+        result = np.empty(len(length), dtype=RECTANGLE_DTYPE)
+        np.multiply(length, width, out=result['area'])
+        np.multiply(length + width, 2, out=result['perimeter'])
+        return result
+    return {'area': array('d', [l * w for l, w in zip(lengths, widths)]),
+            'perimeter': array('d', [2 * (l + w) for l, w in zip(lengths, widths)])}
+
+
+def benchmark(n=10_000_000):
+    """Compare one call per circle with circle_metrics on n radii"""
+    radii = array('d', (1 + (i % 1000) / 10 for i in range(n)))
+
+    start = time.perf_counter()
+    [calculate_circle(r) for r in radii]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    circle_metrics(radii)
+    batch_time = time.perf_counter() - start
+
+    print(f"{n:,} circles ({'NumPy' if np else 'array.array'} backend)")
+    print(f"  calculate_circle per shape: {loop_time:.3f} s")
+    print(f"  circle_metrics:             {batch_time:.3f} s ({loop_time / batch_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    print("\n=== Circle Columns ===")
+    circles = circle_metrics([1, 2.5, 5])
+    print("Areas:", list(circles['area']))
+    print("Single shape (tuple version):", calculate_circle(5))
+
+    print("\n=== Rectangle Columns ===")
+    rectangles = rectangle_metrics([5, 10, 2], [3, 4, 8])
+    print("Areas:", list(rectangles['area']))
+    print("Perimeters:", list(rectangles['perimeter']))
+
+    print("\n=== Precision ===")
+    print("Circumference of r=1e6 with 3.14159:", 2 * 3.14159 * 1e6)
+    print("Circumference of r=1e6 with math.pi:", 2 * math.pi * 1e6)
+
+    print("\n=== Benchmark ===")
+    benchmark(1_000_000)  # call benchmark() for the full 10,000,000 shapes
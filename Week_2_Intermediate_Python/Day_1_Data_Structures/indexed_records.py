@@ -0,0 +1,199 @@
+"""
+Python Indexed Collections Tutorial
+
+map_filter_lambda.py finds records with filter(), dictionaries.py loops
+over items() and sorts with sorted(..., key=lambda item: item[1]). Each
+query looks at every record. Databases avoid this with indexes, and we
+can do the same with plain dicts, sets and sorted lists:
+1. Hash indexes (value -> record ids) for equality lookups
+2. Sorted indexes (kept with bisect) for range and top-n queries
+3. Updating indexes incrementally on insert and delete
+4. Combining several conditions by intersecting id sets
+5. Benchmarking indexed queries against full scans
+
+Run this file to see the examples and the benchmark.
+"""
+
+import bisect
+import random
+import time
+from collections import defaultdict
+from itertools import count, islice
+
+
+class IndexedCollection:
+    """
+    A collection of dict records with secondary indexes.
+
+    hash_fields get a dict mapping each value to the set of record ids
+    that have it. sorted_fields get a sorted list of (value, id) pairs.
+    Every insert and delete updates all indexes, so queries never scan.
+    """
+
+    def __init__(self, records=(), hash_fields=(), sorted_fields=()):
+        self.records = {}
+        self._ids = count()
+        self.hash_indexes = {field: defaultdict(set) for field in hash_fields}
+        self.sorted_indexes = {field: [] for field in sorted_fields}
+        self._bulk_load(records)
+
+    def _bulk_load(self, records):
+        """Load many records, sorting each sorted index once at the end"""
+        for record in records:
+            record_id = next(self._ids)
+            self.records[record_id] = record
+            for field, index in self.hash_indexes.items():
+                index[record.get(field)].add(record_id)
+            for field, index in self.sorted_indexes.items():
+                if record.get(field) is not None:
+                    index.append((record[field], record_id))
+        for index in self.sorted_indexes.values():
+            index.sort()
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records.values())
+
+    def insert(self, record):
+        """Add a record and return its id"""
+        record_id = next(self._ids)
+        self._add(record_id, record)
+        return record_id
+
+    def _add(self, record_id, record):
+        self.records[record_id] = record
+        for field, index in self.hash_indexes.items():
+            index[record.get(field)].add(record_id)
+        for field, index in self.sorted_indexes.items():
+            if record.get(field) is not None:
+                bisect.insort(index, (record[field], record_id))
+
+    def delete(self, record_id):
+        """Remove a record by id and return it"""
+        record = self.records.pop(record_id)
+        for field, index in self.hash_indexes.items():
+            ids = index[record.get(field)]
+            ids.discard(record_id)
+            if not ids:
+                del index[record.get(field)]
+        for field, index in self.sorted_indexes.items():
+            if record.get(field) is not None:
+                position = bisect.bisect_left(index, (record[field], record_id))
+                del index[position]
+        return record
+
+    def update(self, record_id, **changes):
+        """Change fields of a record, keeping the indexes in sync"""
+        record = dict(self.delete(record_id))
+        record.update(changes)
+        self._add(record_id, record)  # same id, so callers can keep using it
+        return record
+
+    # Queries ---------------------------------------------------------------
+
+    def find_ids(self, **conditions):
+        """Return the ids of records matching every field=value condition"""
+        id_sets = []
+        for field, value in conditions.items():
+            if field not in self.hash_indexes:
+                raise KeyError(f"No hash index on {field!r}")
+            id_sets.append(self.hash_indexes[field].get(value, set()))
+        if not id_sets:
+            return set(self.records)
+        id_sets.sort(key=len)  # intersect starting from the smallest set
+        return set.intersection(*id_sets)
+
+    def find(self, **conditions):
+        """Return records matching every field=value condition"""
+        return [self.records[i] for i in sorted(self.find_ids(**conditions))]
+
+    def _range_slice(self, field, low, high):
+        if field not in self.sorted_indexes:
+            raise KeyError(f"No sorted index on {field!r}")
+        index = self.sorted_indexes[field]
+        start = 0 if low is None else bisect.bisect_left(index, (low,))
+        # (high, inf) sorts after every (high, id) pair, so high is inclusive
+        stop = len(index) if high is None else bisect.bisect_right(index, (high, float('inf')))
+        return index, start, stop
+
+    def range(self, field, low=None, high=None):
+        """Return records with low <= record[field] <= high, in field order"""
+        index, start, stop = self._range_slice(field, low, high)
+        return [self.records[record_id] for _, record_id in islice(index, start, stop)]
+
+    def count_range(self, field, low=None, high=None):
+        _, start, stop = self._range_slice(field, low, high)
+        return stop - start
+
+    def top_n(self, field, n, largest=True):
+        """Return the n records with the largest (or smallest) field values"""
+        if field not in self.sorted_indexes:
+            raise KeyError(f"No sorted index on {field!r}")
+        index = self.sorted_indexes[field]
+        if n <= 0:  # index[-0:] would be the whole index
+            return []
+        pairs = reversed(index[-n:]) if largest else index[:n]
+        return [self.records[record_id] for _, record_id in pairs]
+
+
+def benchmark():
+    """Compare point and range queries with full scans"""
+    cities = [f"city{i}" for i in range(500)]
+    data = [{'id': i, 'city': random.choice(cities), 'age': random.randrange(100),
+             'score': random.random()} for i in range(200_000)]
+
+    start = time.perf_counter()
+    collection = IndexedCollection(data, hash_fields=['city', 'age'], sorted_fields=['score'])
+    print(f"Building indexes for {len(data):,} records: {time.perf_counter() - start:.3f} s")
+
+    queries = 200
+    start = time.perf_counter()
+    for i in range(queries):
+        scan = list(filter(lambda r: r['city'] == cities[i] and r['age'] == 30, data))
+    scan_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(queries):
+        found = collection.find(city=cities[i], age=30)
+    index_time = time.perf_counter() - start
+    print(f"{queries} point queries: scan {scan_time:.3f} s, index {index_time:.4f} s")
+
+    start = time.perf_counter()
+    for i in range(queries):
+        scan = [r for r in data if 0.5 <= r['score'] <= 0.501]
+    scan_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(queries):
+        found = collection.range('score', 0.5, 0.501)
+    index_time = time.perf_counter() - start
+    print(f"{queries} range queries: scan {scan_time:.3f} s, index {index_time:.4f} s")
+    print("Same answer:", sorted(r['id'] for r in scan) == sorted(r['id'] for r in found))
+
+
+if __name__ == "__main__":
+    print("\n=== Building Indexes ===")
+    people = [
+        {'name': 'Alice', 'age': 25, 'city': 'New York'},
+        {'name': 'Bob', 'age': 17, 'city': 'Boston'},
+        {'name': 'Charlie', 'age': 30, 'city': 'New York'},
+        {'name': 'David', 'age': 15, 'city': 'Boston'}
+    ]
+    collection = IndexedCollection(people, hash_fields=['city'], sorted_fields=['age'])
+
+    print("\n=== Equality, Range and Top-n Queries ===")
+    print("In New York:", collection.find(city='New York'))
+    print("Adults (age 18+):", collection.range('age', low=18))
+    print("Two oldest:", collection.top_n('age', 2))
+    print("Youngest:", collection.top_n('age', 1, largest=False))
+
+    print("\n=== Incremental Updates ===")
+    eve_id = collection.insert({'name': 'Eve', 'age': 42, 'city': 'Boston'})
+    print("Oldest after insert:", collection.top_n('age', 1))
+    collection.update(eve_id, city='New York')
+    print("New York after update:", [p['name'] for p in collection.find(city='New York')])
+    collection.delete(eve_id)
+    print("Oldest after delete:", collection.top_n('age', 1))
+
+    print("\n=== Benchmark ===")
+    benchmark()
@@ -0,0 +1,269 @@
+"""
+Python Lazy Streams Tutorial
+
+list_operations.py and map_filter_lambda.py build a full list at every step:
+    squares = [x * x for x in range(10)]
+    fahrenheit = [((9/5) * temp + 32) for temp in celsius]
+    doubled = list(map(double, numbers))
+For billions of elements those lists do not fit in memory. A Stream
+describes the same steps lazily and runs them chunk by chunk:
+1. Chaining map / filter / take / batch without intermediate lists
+2. Processing numeric chunks as NumPy arrays (when installed)
+3. Fanning chunks out to a process pool with a bounded number in flight
+4. Terminal operations: to_list(), sum(), count()
+5. Peak memory that stays flat however long the input is
+
+Run this file to see the examples and the benchmark.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import np  # np is None without NumPy; chunks are processed as lists
+
+CHUNK_SIZE = 65_536
+INT64_RANGE = range(-2 ** 63, 2 ** 63)
+
+
+def _as_chunk(items, numeric):
+    """Turn a list into a NumPy array when the stages can use one"""
+    if numeric and np is not None:
+        array = np.asarray(items)
+        if array.dtype.kind in 'iuf':
+            return array
+    return items
+
+
+def _run_stages(chunk, stages):
+    """Apply map/filter stages to one chunk (a list or a NumPy array)"""
+    for kind, func, vectorized in stages:
+        if np is not None and isinstance(chunk, np.ndarray):
+            if vectorized:
+                chunk = func(chunk) if kind == 'map' else chunk[func(chunk)]
+                continue
+            chunk = chunk.tolist()
+        chunk = list(map(func, chunk)) if kind == 'map' else list(filter(func, chunk))
+    return chunk
+
+
+def _chunk_sum(chunk):
+    """
+    Sum one chunk exactly, as a Python number.
+
+    NumPy adds integers in int64 and wraps around silently. When the
+    largest magnitude times the length could leave int64, the chunk is
+    summed as Python ints instead (like pipelines.py's _fits check).
+    """
+    if np is None or not isinstance(chunk, np.ndarray):
+        return sum(chunk)
+    if chunk.dtype.kind in 'iu' and chunk.size:
+        largest = max(abs(int(chunk.min())), abs(int(chunk.max())))
+        if largest * chunk.size not in INT64_RANGE:
+            return sum(chunk.tolist())
+    return chunk.sum().item()
+
+
+def _take(chunks, n):
+    for chunk in chunks:
+        if n <= 0:
+            return
+        if len(chunk) > n:
+            chunk = chunk[:n]
+        n -= len(chunk)
+        yield chunk
+
+
+class Stream:
+    """
+    A lazy sequence of transformations over an iterable.
+
+    Nothing runs until the stream is iterated or a terminal operation such
+    as sum() is called. Items flow through in chunks of chunk_size, so at
+    most a few chunks are in memory at any time.
+
+    map(..., vectorized=True) and filter(..., vectorized=True) promise that
+    the function also works on a whole NumPy array (x * 2, x % 3 == 0, ...).
+    Numeric chunks then skip the per-element Python call. NumPy uses
+    fixed-size integers, so a vectorized function whose results leave
+    int64 can overflow in that mode. Stream.range() and sum() check their
+    own bounds and fall back to Python ints instead of wrapping.
+    """
+
+    def __init__(self, iterable, chunk_size=CHUNK_SIZE):
+        self._source = lambda numeric: self._chunk_iterable(iterable, numeric)
+        self.chunk_size = chunk_size
+        self.stages = []
+        self.workers = None
+
+    @classmethod
+    def range(cls, *args, chunk_size=CHUNK_SIZE):
+        """
+        Like range(), but numeric chunks are generated without Python ints.
+
+        Ranges that reach outside int64 are produced as lists of Python ints.
+        """
+        stream = cls((), chunk_size)
+        numbers = range(*args)
+        fits = not numbers or (numbers[0] in INT64_RANGE and numbers[-1] in INT64_RANGE)
+
+        def chunks(numeric):
+            for start in range(0, len(numbers), chunk_size):
+                part = numbers[start:start + chunk_size]
+                if np is not None and fits:
+                    yield np.arange(part.start, part.stop, part.step, dtype=np.int64)
+                else:
+                    yield list(part)
+        stream._source = chunks
+        return stream
+
+    def _chunk_iterable(self, iterable, numeric):
+        iterator = iter(iterable)
+        while True:
+            items = list(islice(iterator, self.chunk_size))
+            if not items:
+                return
+            yield _as_chunk(items, numeric)
+
+    def _derive(self, source=None, stages=None, workers=None):
+        stream = Stream.__new__(Stream)
+        stream._source = source or self._source
+        stream.chunk_size = self.chunk_size
+        stream.stages = self.stages if stages is None else stages
+        stream.workers = self.workers if workers is None else workers
+        return stream
+
+    # Lazy operations -------------------------------------------------------
+
+    def map(self, func, vectorized=False):
+        return self._derive(stages=self.stages + [('map', func, vectorized)])
+
+    def filter(self, predicate, vectorized=False):
+        return self._derive(stages=self.stages + [('filter', predicate, vectorized)])
+
+    def take(self, n):
+        """Keep only the first n items; later stages see at most n items"""
+        return self._derive(source=lambda numeric: _take(self.chunks(), n), stages=[], workers=0)
+
+    def parallel(self, workers=None):
+        """
+        Run the stages in a process pool, one chunk per task.
+
+        Functions must be picklable (defined at module level, not lambdas).
+        At most 2 * workers chunks are in flight, so memory stays bounded.
+        """
+        return self._derive(workers=workers or os.cpu_count() or 1)
+
+    # Running ---------------------------------------------------------------
+
+    def chunks(self):
+        """Yield processed chunks (lists or NumPy arrays)"""
+        # Build NumPy chunks only if the first stage can use them
+        numeric = bool(self.stages) and self.stages[0][2]
+        if not self.workers:
+            for chunk in self._source(numeric):
+                yield _run_stages(chunk, self.stages)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for chunk in self._source(numeric):
+                pending.append(executor.submit(_run_stages, chunk, self.stages))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from (chunk.tolist() if np is not None and isinstance(chunk, np.ndarray)
+                        else chunk)
+
+    def batch(self, size):
+        """Yield lists of `size` items (the last one may be shorter)"""
+        iterator = iter(self)
+        while True:
+            group = list(islice(iterator, size))
+            if not group:
+                return
+            yield group
+
+    def to_list(self):
+        return list(self)
+
+    def sum(self):
+        """Exact total: chunk sums are added as Python numbers"""
+        return sum(_chunk_sum(chunk) for chunk in self.chunks())
+
+    def count(self):
+        return sum(len(chunk) for chunk in self.chunks())
+
+
+def to_fahrenheit(celsius):
+    return (9 / 5) * celsius + 32
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+def square(x):
+    return x * x
+
+
+def peak_memory(func):
+    """Run func and return (result, peak traced memory in MB)"""
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak / 1e6
+
+
+def benchmark(n=2_000_000):
+    """Sum of squares of the even numbers below n: lists vs streams"""
+    def eager():
+        numbers = list(range(n))
+        evens = [x for x in numbers if x % 2 == 0]
+        squares = [x * x for x in evens]
+        return sum(squares)
+
+    def lazy():
+        return (Stream.range(n)
+                .filter(lambda x: x % 2 == 0, vectorized=True)
+                .map(lambda x: x * x, vectorized=True)
+                .sum())
+
+    for name, func in [("Eager lists", eager), ("Lazy stream", lazy)]:
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        _, peak = peak_memory(func)
+        print(f"{name}: {elapsed:.2f} s, peak memory {peak:7.1f} MB, result {result}")
+
+    start = time.perf_counter()
+    result = Stream.range(n).filter(is_even).map(square).parallel(4).sum()
+    print(f"Process pool (4 workers): {time.perf_counter() - start:.2f} s, result {result}")
+    print(f"Backend: {'NumPy chunks' if np else 'pure Python chunks'}")
+
+
+if __name__ == "__main__":
+    print("\n=== Lazy Map and Filter ===")
+    squares = Stream(range(10)).map(lambda x: x * x)
+    print("Squares 0-9:", squares.to_list())
+    celsius = [0, 10, 20, 30, 40]
+    print("Fahrenheit:", Stream(celsius).map(to_fahrenheit, vectorized=True).to_list())
+    print("Even squares:", Stream(range(10)).filter(is_even).map(square).to_list())
+
+    print("\n=== Take and Batch ===")
+    endless = Stream(iter(lambda: 1, None)).map(lambda x: x * 2)  # never ends
+    print("First 5 of an endless stream:", endless.take(5).to_list())
+    print("Batches of 4:", list(Stream(range(10)).batch(4)))
+    print("Take, then filter:", Stream.range(100).take(10).filter(is_even).to_list())
+
+    print("\n=== Benchmark ===")
+    benchmark()
@@ -0,0 +1,375 @@
+"""
+Python Matrices Tutorial
+
+Nested lists are the usual first way to write a matrix:
+    matrix = [[1, 2, 3], [4, 5, 6]]
+    transposed = [list(row) for row in zip(*matrix)]
+Every element is a separate Python float behind a pointer, each row is a
+separate list, and multiplication walks those pointers in the slowest
+order. This file converts the nested list once into a contiguous buffer:
+1. Matrix - row-major array('d') storage with shape (rows, cols)
+2. Transpose by gathering strided slices (each column is copied in C)
+3. Blocked matrix multiplication over contiguous rows and columns
+4. Element-wise operations in a single pass over the flat buffer
+5. CSRMatrix - compressed sparse rows for mostly-zero data
+6. Benchmarks against list-comprehension implementations
+
+Run this file to see the examples and the benchmark.
+"""
+
+import operator
+import os
+import random
+import sys
+from array import array
+from itertools import repeat
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import benchmark as best_time, np, timed  # np is None without NumPy; pure-Python kernels are used instead
+
+BLOCK_SIZE = 64
+
+
+def _to_array(values, typecode='d'):
+    """
+    array(typecode, values), but NumPy results are copied as raw bytes.
+
+    array('d', ndarray) would iterate the ndarray and box every element
+    into a Python float first; frombytes() is a single memcpy.
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        result = array(typecode)
+        result.frombytes(np.ascontiguousarray(values, dtype=typecode).tobytes())
+        return result
+    return array(typecode, values)
+
+
+class Matrix:
+    """A dense matrix stored row by row in one array('d')"""
+
+    __slots__ = ('rows', 'cols', 'data')
+
+    def __init__(self, rows, cols, data=None):
+        self.rows = rows
+        self.cols = cols
+        self.data = _to_array(data) if data is not None else array('d', bytes(8 * rows * cols))
+        if len(self.data) != rows * cols:
+            raise ValueError(f"Expected {rows * cols} values, got {len(self.data)}")
+
+    @classmethod
+    def from_lists(cls, nested):
+        """Convert a list of equal-length rows (done once, then reused)"""
+        rows = len(nested)
+        cols = len(nested[0]) if rows else 0
+        data = array('d')
+        for row in nested:
+            if len(row) != cols:
+                raise ValueError("All rows must have the same length")
+            data.extend(row)
+        return cls(rows, cols, data)
+
+    @classmethod
+    def identity(cls, n):
+        matrix = cls(n, n)
+        matrix.data[::n + 1] = array('d', repeat(1.0, n))
+        return matrix
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    def to_lists(self):
+        cols = self.cols
+        return [self.data[i * cols:(i + 1) * cols].tolist() for i in range(self.rows)]
+
+    def row(self, i):
+        return self.data[i * self.cols:(i + 1) * self.cols]
+
+    def column(self, j):
+        return self.data[j::self.cols]
+
+    def __getitem__(self, position):
+        i, j = position
+        return self.data[i * self.cols + j]
+
+    def __setitem__(self, position, value):
+        i, j = position
+        self.data[i * self.cols + j] = value
+
+    def __eq__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.shape == other.shape and self.data == other.data
+
+    def __repr__(self):
+        return f"Matrix({self.to_lists()})"
+
+    def _numpy(self):
+        return np.frombuffer(self.data, dtype='d').reshape(self.rows, self.cols)
+
+    # Transpose -------------------------------------------------------------
+
+    def transpose(self):
+        """
+        Return the transpose as a new contiguous Matrix.
+
+        Column j of the original is the strided slice data[j::cols]; copying
+        it is a single C loop, so each output row is written sequentially.
+        """
+        if np is not None:
+            return Matrix(self.cols, self.rows, np.ascontiguousarray(self._numpy().T).ravel())
+        data = array('d')
+        for j in range(self.cols):
+            data.extend(self.data[j::self.cols])
+        return Matrix(self.cols, self.rows, data)
+
+    T = property(transpose)
+
+    # Multiplication --------------------------------------------------------
+
+    def matmul(self, other, block_size=BLOCK_SIZE):
+        """
+        Multiply two matrices.
+
+        The right operand is transposed once so that every dot product reads
+        two contiguous slices. Output is computed in block_size x block_size
+        tiles so the rows and columns used by one tile are reused while they
+        are still hot, and each dot product is sum(map(mul, row, col)),
+        which runs in C.
+        """
+        if self.cols != other.rows:
+            raise ValueError(f"Shapes {self.shape} and {other.shape} do not align")
+        if np is not None:
+            return Matrix(self.rows, other.cols, (self._numpy() @ other._numpy()).ravel())
+        # Lists of already-boxed floats: map() then skips re-boxing array items
+        rows = [self.row(i).tolist() for i in range(self.rows)]
+        other_t = other.transpose()
+        cols = [other_t.row(j).tolist() for j in range(other.cols)]
+        out = array('d', bytes(8 * self.rows * other.cols))
+        width = other.cols
+        mul = operator.mul
+        for i0 in range(0, self.rows, block_size):
+            row_block = rows[i0:i0 + block_size]
+            for j0 in range(0, width, block_size):
+                col_block = cols[j0:j0 + block_size]
+                for i, row in enumerate(row_block, i0):
+                    base = i * width + j0
+                    out[base:base + len(col_block)] = array(
+                        'd', [sum(map(mul, row, col)) for col in col_block])
+        return Matrix(self.rows, width, out)
+
+    def __matmul__(self, other):
+        if isinstance(other, CSRMatrix):
+            return other.transpose().matmul(self.transpose()).transpose()
+        return self.matmul(other)
+
+    # Element-wise operations -----------------------------------------------
+
+    def _elementwise(self, other, op):
+        """
+        Apply op to every element (with a matching Matrix or a scalar).
+
+        With NumPy this is one vectorised pass. Without it every result is
+        still boxed as a float and stored back into the array, so it runs
+        at about the speed of a list comprehension; the win is memory.
+        """
+        if isinstance(other, Matrix):
+            if self.shape != other.shape:
+                raise ValueError(f"Shapes {self.shape} and {other.shape} differ")
+            if np is not None:
+                return Matrix(self.rows, self.cols, op(self._numpy(), other._numpy()).ravel())
+            return Matrix(self.rows, self.cols, list(map(op, self.data, other.data)))
+        if np is not None:
+            return Matrix(self.rows, self.cols, op(self._numpy(), other).ravel())
+        return Matrix(self.rows, self.cols, list(map(op, self.data, repeat(other))))
+
+    def __add__(self, other):
+        return self._elementwise(other, operator.add)
+
+    def __sub__(self, other):
+        return self._elementwise(other, operator.sub)
+
+    def __mul__(self, other):
+        """Element-wise (Hadamard) product; use @ for matrix multiplication"""
+        return self._elementwise(other, operator.mul)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+
+class CSRMatrix:
+    """
+    A sparse matrix in compressed sparse row form.
+
+    Only non-zero values are stored: data holds them row by row, indices
+    holds their column numbers, and row i occupies positions
+    indptr[i]:indptr[i + 1] of both arrays.
+    """
+
+    __slots__ = ('rows', 'cols', 'data', 'indices', 'indptr')
+
+    def __init__(self, rows, cols, data, indices, indptr):
+        self.rows = rows
+        self.cols = cols
+        self.data = _to_array(data)
+        self.indices = _to_array(indices, 'q')
+        self.indptr = _to_array(indptr, 'q')
+
+    @classmethod
+    def from_lists(cls, nested):
+        data, indices, indptr = array('d'), array('q'), array('q', [0])
+        for row in nested:
+            for j, value in enumerate(row):
+                if value:
+                    data.append(value)
+                    indices.append(j)
+            indptr.append(len(data))
+        return cls(len(nested), len(nested[0]) if nested else 0, data, indices, indptr)
+
+    @classmethod
+    def from_dense(cls, matrix):
+        return cls.from_lists(matrix.to_lists())
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def to_dense(self):
+        dense = Matrix(self.rows, self.cols)
+        for i in range(self.rows):
+            base = i * self.cols
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                dense.data[base + self.indices[k]] = self.data[k]
+        return dense
+
+    def __repr__(self):
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz})"
+
+    def transpose(self):
+        """Transpose by counting the entries in each column (no dense copy)"""
+        counts = [0] * (self.cols + 1)
+        for j in self.indices:
+            counts[j + 1] += 1
+        for j in range(self.cols):
+            counts[j + 1] += counts[j]
+        indptr = array('q', counts)
+        position = counts[:-1]
+        data = array('d', bytes(8 * self.nnz))
+        indices = array('q', bytes(8 * self.nnz))
+        for i in range(self.rows):
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                j = self.indices[k]
+                data[position[j]] = self.data[k]
+                indices[position[j]] = i
+                position[j] += 1
+        return CSRMatrix(self.cols, self.rows, data, indices, indptr)
+
+    def matvec(self, vector):
+        """Multiply by a vector, touching only the non-zero entries"""
+        if len(vector) != self.cols:
+            raise ValueError("Vector length does not match the number of columns")
+        data, indices, indptr = self.data, self.indices, self.indptr
+        return array('d', [
+            sum(data[k] * vector[indices[k]] for k in range(indptr[i], indptr[i + 1]))
+            for i in range(self.rows)])
+
+    def matmul(self, other):
+        """Sparse x dense: each non-zero scales one row of the dense matrix"""
+        if self.cols != other.rows:
+            raise ValueError(f"Shapes {self.shape} and {other.shape} do not align")
+        out = array('d')
+        mul, add = operator.mul, operator.add
+        for i in range(self.rows):
+            accumulator = [0.0] * other.cols
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                scaled = map(mul, repeat(self.data[k]), other.row(self.indices[k]))
+                accumulator = list(map(add, accumulator, scaled))
+            out.extend(accumulator)
+        return Matrix(self.rows, other.cols, out)
+
+    def __matmul__(self, other):
+        if isinstance(other, CSRMatrix):
+            other = other.to_dense()
+        return self.matmul(other)
+
+    def __mul__(self, scalar):
+        return CSRMatrix(self.rows, self.cols, [v * scalar for v in self.data],
+                         self.indices, self.indptr)
+
+    __rmul__ = __mul__
+
+
+# List-comprehension versions, for comparison ------------------------------
+
+def transpose_lists(matrix):
+    return [list(row) for row in zip(*matrix)]
+
+
+def matmul_lists(a, b):
+    columns = list(zip(*b))
+    return [[sum(x * y for x, y in zip(row, col)) for col in columns] for row in a]
+
+
+def add_lists(a, b):
+    return [[x + y for x, y in zip(row_a, row_b)] for row_a, row_b in zip(a, b)]
+
+
+def benchmark(sizes=(50, 100, 200)):
+    """Compare nested-list code with Matrix and CSRMatrix across sizes"""
+    print(f"Backend: {'NumPy' if np else 'pure Python'}")
+    print(f"{'n':>5} {'op':<10} {'lists':>9} {'Matrix':>9}")
+    for n in sizes:
+        a = [[random.random() for _ in range(n)] for _ in range(n)]
+        b = [[random.random() for _ in range(n)] for _ in range(n)]
+        ma, mb = Matrix.from_lists(a), Matrix.from_lists(b)
+        for name, list_op, matrix_op in [
+                ("transpose", lambda: transpose_lists(a), lambda: ma.transpose()),
+                ("add", lambda: add_lists(a, b), lambda: ma + mb),
+                ("matmul", lambda: matmul_lists(a, b), lambda: ma @ mb)]:
+            expected, result = list_op(), matrix_op()
+            list_time, matrix_time = best_time(list_op, repeat=5), best_time(matrix_op, repeat=5)
+            assert all(abs(x - y) < 1e-9 for x, y in
+                       zip(result.data, (v for row in expected for v in row)))
+            print(f"{n:>5} {name:<10} {list_time:9.4f} {matrix_time:9.4f}")
+
+    n, density = 1000, 0.01
+    sparse_lists = [[random.random() if random.random() < density else 0.0 for _ in range(n)]
+                    for _ in range(n)]
+    vector = [random.random() for _ in range(n)]
+    csr = CSRMatrix.from_lists(sparse_lists)
+    expected, list_time = timed(lambda: [sum(x * y for x, y in zip(row, vector))
+                                         for row in sparse_lists])
+    result, csr_time = timed(csr.matvec, vector)
+    assert all(abs(x - y) < 1e-9 for x, y in zip(result, expected))
+    print(f"Sparse {n}x{n} ({density:.0%} non-zero) matrix-vector: lists {list_time:.4f} s, "
+          f"CSR {csr_time:.4f} s, storage {csr.nnz * 16 / 1e3:.0f} KB vs {n * n * 8 / 1e6:.0f} MB dense")
+
+
+if __name__ == "__main__":
+    print("\n=== Nested Lists to Matrix ===")
+    matrix = Matrix.from_lists([[1, 2, 3], [4, 5, 6]])
+    print("Shape:", matrix.shape, "| element (1, 2):", matrix[1, 2])
+    print("Flat buffer:", matrix.data.tolist())
+    print("Transposed:", matrix.T.to_lists())
+
+    print("\n=== Multiplication and Element-wise Operations ===")
+    other = Matrix.from_lists([[7, 8], [9, 10], [11, 12]])
+    print("Matrix product:", (matrix @ other).to_lists())
+    print("Matrix + 1:", (matrix + 1).to_lists())
+    print("Hadamard product with itself:", (matrix * matrix).to_lists())
+    print("Times identity unchanged:", matrix @ Matrix.identity(3) == matrix)
+
+    print("\n=== Sparse Matrices (CSR) ===")
+    sparse = CSRMatrix.from_lists([[0, 0, 3], [4, 0, 0], [0, 0, 0]])
+    print(sparse, "data:", sparse.data.tolist(), "indices:", sparse.indices.tolist(),
+          "indptr:", sparse.indptr.tolist())
+    print("Times [1, 2, 3]:", sparse.matvec([1, 2, 3]).tolist())
+    print("Transposed back to dense:", sparse.transpose().to_dense().to_lists())
+    print("Sparse @ dense:", (sparse @ Matrix.identity(3)).to_lists())
+
+    print("\n=== Benchmark ===")
+    benchmark()
@@ -0,0 +1,425 @@
+"""
+Python Numeric Arrays Tutorial
+
+list_operations.py keeps numbers in lists such as
+    numbers = [1, 2, 3, 4, 5]
+    squares = [x * x for x in range(10)]
+and recursion.py searches sorted_numbers = [1, 3, 5, 7, ...]. A list
+stores an 8-byte pointer per element and every int is a separate object
+of 28+ bytes. NumericList stores the raw values in one array.array buffer:
+1. The list methods the tutorials use (append, extend, insert, pop, remove)
+2. Slices that are zero-copy views into the same buffer
+3. Element-wise arithmetic on whole sequences (NumPy when installed)
+4. Sharing the buffer with other code through memoryview
+5. Measuring memory per element against a list
+
+Note: + - * / are element-wise, as in NumPy. Use extend() to concatenate.
+
+Run this file to see the examples and the benchmark.
+"""
+
+import operator
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+from itertools import repeat
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import np  # np is None without NumPy; arithmetic falls back to map()
+
+
+def _typecode_for(values):
+    """'q' (64-bit int) if every value is an int, otherwise 'd' (double)"""
+    return 'q' if all(type(v) is int or type(v) is bool for v in values) else 'd'
+
+
+def _rsub(a, b):
+    return b - a
+
+
+def _rtruediv(a, b):
+    return b / a
+
+
+def _fits_int64(estimate):
+    """
+    True if float estimates of integer results are well inside int64.
+
+    NumPy integers wrap around silently where array('q', ...) raises
+    OverflowError, so results that come anywhere near the limit are
+    recomputed with Python ints to fail the same way on both backends.
+    """
+    return estimate.size == 0 or float(np.abs(estimate).max()) < 2.0 ** 62
+
+
+def _elementwise(left, right, op, typecode):
+    """Apply op to two sequences (or a sequence and a number), return a NumericList"""
+    if isinstance(right, (NumericList, NumericView)) and len(right) != len(left):
+        raise ValueError("Sequences must have the same length")
+    if op is operator.truediv or op is _rtruediv or isinstance(right, float) or \
+            getattr(right, 'typecode', 'q') == 'd':
+        typecode = 'd'
+    if np is not None:
+        a = left._numpy()
+        b = right._numpy() if isinstance(right, (NumericList, NumericView)) else right
+        # NumPy would return inf or nan; raise like the map() fallback does
+        if op is operator.truediv and np.any(np.asarray(b) == 0) or \
+                op is _rtruediv and np.any(a == 0):
+            raise ZeroDivisionError("division by zero")
+        with np.errstate(over='ignore', invalid='ignore'):
+            fits = typecode == 'd' or _fits_int64(op(a.astype('float64'), b))
+        if fits:
+            result = op(a, b).astype('int64' if typecode == 'q' else 'float64')
+            return NumericList._from_array(array(typecode, result.tobytes()))
+    # map() with an operator function runs the loop in C
+    values = map(op, left, right if isinstance(right, (NumericList, NumericView)) else repeat(right))
+    return NumericList._from_array(array(typecode, values))
+
+
+class _ArithmeticMixin:
+    """Element-wise operators shared by NumericList and NumericView"""
+
+    __slots__ = ()
+
+    def __add__(self, other):
+        return _elementwise(self, other, operator.add, self.typecode)
+
+    def __sub__(self, other):
+        return _elementwise(self, other, operator.sub, self.typecode)
+
+    def __mul__(self, other):
+        return _elementwise(self, other, operator.mul, self.typecode)
+
+    def __truediv__(self, other):
+        return _elementwise(self, other, operator.truediv, 'd')
+
+    def __rsub__(self, other):
+        return _elementwise(self, other, _rsub, self.typecode)
+
+    def __rtruediv__(self, other):
+        return _elementwise(self, other, _rtruediv, 'd')
+
+    def __pow__(self, other):
+        return _elementwise(self, other, operator.pow, self.typecode)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def sum(self):
+        if np is not None:
+            values = self._numpy()
+            # An int64 total could wrap around; Python's sum() cannot
+            if self.typecode == 'd' or _fits_int64(np.abs(values).sum(dtype='float64')):
+                return values.sum().item()
+        return sum(self)
+
+    def __eq__(self, other):
+        if isinstance(other, (NumericList, NumericView, list, tuple, array)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.tolist()})"
+
+
+class NumericList(_ArithmeticMixin):
+    """
+    A list of numbers stored in a typed array.array buffer.
+
+    Every element costs 8 bytes ('q' for ints, 'd' for floats) instead of
+    a pointer plus a boxed object. array.array over-allocates like list
+    does, so append() is amortised O(1). Ints must fit in 64 bits, and
+    integer arithmetic that overflows raises OverflowError with or without
+    NumPy; division by zero raises ZeroDivisionError on both backends.
+
+    _version counts the changes that move elements to other positions
+    (insert, pop, remove, del, reverse, resizing slice assignment), so
+    views taken before such a change can tell that they are stale.
+    """
+
+    __slots__ = ('_data', '_version')
+
+    def __init__(self, values=(), typecode=None):
+        values = values if isinstance(values, (array, range)) else list(values)
+        self._data = array(typecode or getattr(values, 'typecode', None) or _typecode_for(values),
+                           values)
+        self._version = 0
+
+    @classmethod
+    def _from_array(cls, data):
+        sequence = cls.__new__(cls)
+        sequence._data = data
+        sequence._version = 0
+        return sequence
+
+    @property
+    def typecode(self):
+        return self._data.typecode
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __contains__(self, value):
+        return value in self._data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return NumericView(self, range(len(self._data))[index])
+        return self._data[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            size = len(self._data)
+            self._data[index] = array(self.typecode, value)
+            if len(self._data) != size:
+                self._version += 1
+        else:
+            self._data[index] = value
+
+    def __delitem__(self, index):
+        del self._data[index]
+        self._version += 1
+
+    # List methods ----------------------------------------------------------
+
+    def append(self, value):
+        self._data.append(value)
+
+    def extend(self, values):
+        if isinstance(values, NumericList) and values.typecode == self.typecode:
+            self._data.extend(values._data)
+        else:
+            self._data.extend(values)
+
+    def insert(self, index, value):
+        self._data.insert(index, value)
+        self._version += 1
+
+    def pop(self, index=-1):
+        value = self._data.pop(index)
+        self._version += 1
+        return value
+
+    def remove(self, value):
+        self._data.remove(value)
+        self._version += 1
+
+    def index(self, value):
+        return self._data.index(value)
+
+    def count(self, value):
+        return self._data.count(value)
+
+    def reverse(self):
+        self._data.reverse()
+        self._version += 1
+
+    def clear(self):
+        del self._data[:]
+        self._version += 1
+
+    def copy(self):
+        return NumericList._from_array(array(self.typecode, self._data))
+
+    def tolist(self):
+        return self._data.tolist()
+
+    # Buffers ---------------------------------------------------------------
+
+    def memoryview(self):
+        """
+        Return a memoryview of the raw values.
+
+        While any memoryview (or NumPy array made from it) is alive the
+        list cannot grow or shrink; array.array raises BufferError.
+        """
+        return memoryview(self._data)
+
+    def _numpy(self):
+        return np.frombuffer(self._data, dtype=self.typecode)
+
+    def memory_bytes(self):
+        return sys.getsizeof(self._data)
+
+    def __iadd__(self, other):
+        self._data = (self + other)._data
+        return self
+
+    def __imul__(self, other):
+        self._data = (self * other)._data
+        return self
+
+
+def _as_slice(positions):
+    """
+    The slice that selects the positions of a range with step != 0.
+
+    range(n)[...] may end at -1 for a negative step, which as a slice stop
+    would mean "the last element", so that stop becomes None. An empty
+    range needs an explicit empty slice: range(10)[-20:-30:-1] is empty,
+    but slice(-1, None, -1) would select everything.
+    """
+    if not positions:
+        return slice(0, 0)
+    stop = positions.stop
+    return slice(positions.start, None if stop < 0 else stop, positions.step)
+
+
+class NumericView(_ArithmeticMixin):
+    """
+    A zero-copy slice of a NumericList.
+
+    The view stores only its parent and a range of positions, so creating
+    one costs the same for 10 or 10 million elements. Writes go through
+    to the parent, exactly like NumPy slices. Use copy() for an independent
+    NumericList.
+
+    Appending to the parent leaves a view valid, but once the parent
+    inserts, pops, removes or reverses elements the positions point at
+    different values, so every later use of the view raises RuntimeError
+    (like a dict changed during iteration). Slice the parent again.
+    """
+
+    __slots__ = ('parent', 'positions', 'version')
+
+    def __init__(self, parent, positions, version=None):
+        self.parent = parent
+        self.positions = positions
+        self.version = parent._version if version is None else version
+
+    @property
+    def typecode(self):
+        return self.parent.typecode
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _data(self):
+        """The parent's buffer, after checking that this view is still valid"""
+        if self.version != self.parent._version:
+            raise RuntimeError("NumericList elements moved after this view was taken; "
+                               "slice the list again")
+        return self.parent._data
+
+    def _slice(self):
+        return _as_slice(self.positions)
+
+    def __iter__(self):
+        return iter(self._data()[self._slice()])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return NumericView(self.parent, self.positions[index], self.version)
+        return self._data()[self.positions[index]]
+
+    def __setitem__(self, index, value):
+        if not isinstance(index, slice):
+            self._data()[self.positions[index]] = value
+            return
+        positions = self.positions[index]
+        if isinstance(value, NumericList) and value.typecode == self.typecode:
+            values = value._data
+        else:
+            values = array(self.typecode, value)
+        if len(values) != len(positions):
+            raise ValueError(f"Cannot assign {len(values)} values to a view of {len(positions)}")
+        self._data()[_as_slice(positions)] = values
+
+    def copy(self):
+        return NumericList._from_array(self._data()[self._slice()])
+
+    def tolist(self):
+        return self._data()[self._slice()].tolist()
+
+    def memoryview(self):
+        """A memoryview of just this slice (same caveat as NumericList.memoryview)"""
+        return memoryview(self._data())[self._slice()]
+
+    def _numpy(self):
+        return np.frombuffer(self._data(), dtype=self.typecode)[self._slice()]
+
+
+def memory_per_element(build, n):
+    """Bytes allocated by build(n), divided by n"""
+    tracemalloc.start()
+    result = build(n)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size / n
+
+
+def benchmark(n=1_000_000):
+    """Compare lists and NumericList for memory, slicing and bulk arithmetic"""
+    offset = 1000  # values above 256 so CPython's small-int cache does not help lists
+    list_bytes = memory_per_element(lambda n: [i + offset for i in range(n)], n)
+    array_bytes = memory_per_element(lambda n: NumericList(range(offset, n + offset)), n)
+    print(f"Memory per element: list {list_bytes:.1f} bytes, NumericList {array_bytes:.1f} bytes")
+
+    numbers = list(range(n))
+    values = NumericList(range(n))
+    start = time.perf_counter()
+    every_second = numbers[::2]
+    list_time = time.perf_counter() - start
+    start = time.perf_counter()
+    view = values[::2]
+    view_time = time.perf_counter() - start
+    print(f"Slice [::2]: list copy {list_time * 1000:.2f} ms, view {view_time * 1000:.4f} ms")
+
+    start = time.perf_counter()
+    fahrenheit = [(9 / 5) * c + 32 for c in numbers]
+    list_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fahrenheit_array = values * (9 / 5) + 32
+    array_time = time.perf_counter() - start
+    print(f"Celsius -> Fahrenheit on {n:,} values: list comprehension {list_time:.3f} s, "
+          f"NumericList {array_time:.3f} s ({'NumPy' if np else 'pure Python'} backend)")
+    print("Same values:", fahrenheit_array == fahrenheit, "| same slice:", view == every_second)
+
+
+if __name__ == "__main__":
+    print("\n=== List Methods ===")
+    numbers = NumericList([1, 2, 3, 4, 5])
+    numbers.append(6)
+    numbers.insert(0, 0)
+    numbers.extend([7, 8, 9])
+    print("After append, insert and extend:", numbers)
+    print("Popped:", numbers.pop())
+    numbers.remove(5)
+    print("After removing 5:", numbers)
+
+    print("\n=== Zero-Copy Slices ===")
+    print("First three:", numbers[:3], "| last three:", numbers[-3:])
+    print("Every second:", numbers[::2], "| reversed:", numbers[::-1])
+    evens = numbers[::2]
+    evens[0] = 100
+    print("Writing through a view changes the parent:", numbers)
+    numbers[0] = 0
+
+    print("\n=== Bulk Arithmetic ===")
+    squares = NumericList(range(10)) ** 2
+    print("Squares 0-9:", squares)
+    celsius = NumericList([0, 10, 20, 30, 40])
+    print("Fahrenheit:", celsius * (9 / 5) + 32)
+    print("Element-wise sum:", NumericList([1, 2, 3]) + NumericList([4, 5, 6]))
+    print("Sum of squares:", squares.sum())
+
+    print("\n=== Sharing the Buffer ===")
+    sorted_numbers = NumericList([1, 3, 5, 7, 9, 11, 13, 15])
+    buffer = sorted_numbers.memoryview()
+    print(f"{buffer.nbytes} bytes, format {buffer.format!r}, itemsize {buffer.itemsize}")
+    try:
+        sorted_numbers.append(17)
+    except BufferError as error:
+        print("Cannot resize while a memoryview is alive:", error)
+    buffer.release()
+    sorted_numbers.append(17)
+    print("After releasing the view:", sorted_numbers)
+
+    print("\n=== Benchmark ===")
+    benchmark()
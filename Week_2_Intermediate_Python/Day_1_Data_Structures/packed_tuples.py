@@ -0,0 +1,304 @@
+"""
+Python Packed Tuples Tutorial
+
+tuples.py represents small fixed-size records as tuples:
+    point = (10, 20)
+    color = (255, 128, 0)
+A list of a million such tuples stores a million tuple objects, each
+holding pointers to separate int or float objects. This file packs
+fixed-arity numeric tuples into flat typed arrays instead:
+1. PackedTuples - one array.array with k values per tuple
+2. Tuple-like access: indexing returns a tuple, so x, y = points[i] works
+3. Column access and vectorised distances (NumPy when installed)
+4. InternedTuples - each distinct tuple stored once, plus a small code
+   per element (ideal for colours and other low-cardinality data)
+5. Colour conversions done once per distinct colour
+6. Measuring memory against a list of tuples
+
+Run this file to see the examples and the benchmark.
+"""
+
+import colorsys
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import namedtuple
+from itertools import chain, repeat
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import np  # np is None without NumPy; array.array and map() are used instead
+
+
+class PackedTuples:
+    """
+    A sequence of k-tuples stored in one flat array.array.
+
+    Tuple i occupies data[i * k:(i + 1) * k]. Indexing returns a plain
+    tuple; named(i) returns a namedtuple with the field names.
+    """
+
+    __slots__ = ('fields', 'arity', 'data', 'row_type')
+
+    def __init__(self, fields, typecode='d', values=()):
+        self.fields = tuple(fields)
+        self.arity = len(self.fields)
+        self.row_type = namedtuple('Row', self.fields)
+        self.data = array(typecode)
+        self.extend(values)
+
+    @property
+    def typecode(self):
+        return self.data.typecode
+
+    def __len__(self):
+        return len(self.data) // self.arity
+
+    def __getitem__(self, index):
+        k = self.arity
+        if isinstance(index, slice):
+            result = PackedTuples(self.fields, self.typecode)
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                result.data = self.data[start * k:stop * k]
+            else:
+                result.extend(self[i] for i in range(start, stop, step))
+            return result
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PackedTuples index out of range")
+        return tuple(self.data[index * k:(index + 1) * k])
+
+    def __setitem__(self, index, value):
+        if len(value) != self.arity:
+            raise ValueError(f"Expected a {self.arity}-tuple")
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PackedTuples assignment index out of range")
+        self.data[index * self.arity:(index + 1) * self.arity] = array(self.typecode, value)
+
+    def __iter__(self):
+        # zip over k references to one iterator regroups the flat values in C
+        return zip(*[iter(self.data)] * self.arity)
+
+    def __repr__(self):
+        preview = ", ".join(map(str, (self[i] for i in range(min(len(self), 5)))))
+        more = ", ..." if len(self) > 5 else ""
+        return f"PackedTuples({self.fields}, [{preview}{more}])"
+
+    def named(self, index):
+        return self.row_type(*self[index])
+
+    def append(self, value):
+        if len(value) != self.arity:
+            raise ValueError(f"Expected a {self.arity}-tuple")
+        self.extend((value,))
+
+    def extend(self, values):
+        # array.extend keeps the values it stored before an error, so roll
+        # back to the old length if any value is rejected
+        start = len(self.data)
+        try:
+            self.data.extend(chain.from_iterable(values))
+        except (OverflowError, TypeError):
+            del self.data[start:]
+            raise
+        if (len(self.data) - start) % self.arity:
+            del self.data[start:]
+            raise ValueError(f"Every tuple must have {self.arity} values")
+
+    def column(self, field):
+        """All values of one field, e.g. points.column('x')"""
+        return self.data[self.fields.index(field)::self.arity]
+
+    def memory_bytes(self):
+        return self.data.buffer_info()[1] * self.data.itemsize
+
+    def _numpy(self):
+        return np.frombuffer(self.data, dtype=self.typecode).reshape(-1, self.arity)
+
+    def distances_to(self, point):
+        """Euclidean distance from every tuple to one point, as array('d')"""
+        if len(point) != self.arity:
+            raise ValueError(f"Expected a {self.arity}-tuple")
+        if np is not None:
+            diff = self._numpy().astype('f8') - np.asarray(point, dtype='f8')
+            return array('d', np.sqrt((diff * diff).sum(axis=1)).tobytes())
+        return array('d', map(math.dist, iter(self), repeat(tuple(point))))
+
+
+class InternedTuples:
+    """
+    A sequence of tuples where each distinct tuple is stored only once.
+
+    palette holds the distinct tuples (a PackedTuples), and codes holds one
+    small integer per element. For 256 or fewer distinct values each
+    element costs a single byte; the code width grows automatically.
+    """
+
+    __slots__ = ('palette', 'codes', '_lookup')
+
+    def __init__(self, fields, typecode='d', values=()):
+        self.palette = PackedTuples(fields, typecode)
+        self.codes = array('B')
+        self._lookup = {}
+        self.extend(values)
+
+    def _code(self, value):
+        if type(value) is not tuple:
+            value = tuple(value)
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.palette)
+            self.palette.append(value)  # may raise, e.g. 300 in a 'B' palette
+            self._lookup[value] = code
+            limit = 1 << (8 * self.codes.itemsize)
+            if code >= limit:
+                self.codes = array('H' if limit == 256 else 'I', self.codes)
+        return code
+
+    def append(self, value):
+        code = self._code(value)  # may replace self.codes with a wider array
+        self.codes.append(code)
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        return self.palette[self.codes[index]]
+
+    def __iter__(self):
+        distinct = list(self.palette)
+        return map(distinct.__getitem__, self.codes)
+
+    def __repr__(self):
+        return f"InternedTuples({len(self)} items, {len(self.palette)} distinct)"
+
+    def memory_bytes(self):
+        return (self.codes.buffer_info()[1] * self.codes.itemsize
+                + self.palette.memory_bytes())
+
+    def map_palette(self, func, fields, typecode='d'):
+        """
+        Apply func to each distinct tuple only, then translate the codes.
+
+        Converting a million pixels drawn from 16 colours calls func 16 times.
+        Tuples that func maps to the same result share one palette entry
+        (e.g. two colours with the same gray level), so the palette stays
+        free of duplicates.
+        """
+        result = InternedTuples(fields, typecode)
+        remap = [result._code(func(value)) for value in self.palette]
+        if np is not None and self.codes:
+            old = np.frombuffer(self.codes, dtype=self.codes.typecode)
+            result.codes.frombytes(np.asarray(remap, dtype=result.codes.typecode)[old].tobytes())
+        else:
+            result.codes.extend(map(remap.__getitem__, self.codes))
+        return result
+
+    def values_by_code(self, func):
+        """Compute func once per distinct tuple and expand to one value per element"""
+        per_code = [func(value) for value in self.palette]
+        if np is not None:
+            return np.asarray(per_code)[np.frombuffer(self.codes, dtype=self.codes.typecode)]
+        return list(map(per_code.__getitem__, self.codes))
+
+
+# Colour conversions (per tuple; use them with map_palette) ----------------
+
+def rgb_to_hsv(rgb):
+    r, g, b = rgb
+    return colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
+
+
+def rgb_to_gray(rgb):
+    """Luma from ITU-R BT.601 weights"""
+    r, g, b = rgb
+    return 0.299 * r + 0.587 * g + 0.114 * b
+
+
+def rgb_to_hex(rgb):
+    return "#{:02x}{:02x}{:02x}".format(*rgb)
+
+
+def traced_bytes(build):
+    """Memory allocated by build() and still alive afterwards"""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def benchmark(n=1_000_000):
+    """Compare lists of tuples with PackedTuples and InternedTuples"""
+    coordinates = [(random.random() * 100, random.random() * 100) for _ in range(n)]
+    points_list, list_bytes = traced_bytes(lambda: [(x, y) for x, y in coordinates])
+    packed, packed_bytes = traced_bytes(lambda: PackedTuples('xy', 'd', coordinates))
+    print(f"{n:,} points: list of tuples {list_bytes / 1e6:.1f} MB, "
+          f"PackedTuples {packed_bytes / 1e6:.1f} MB ({list_bytes / packed_bytes:.1f}x less)")
+
+    origin = (50.0, 50.0)
+    start = time.perf_counter()
+    expected = [math.dist(point, origin) for point in points_list]
+    list_time = time.perf_counter() - start
+    start = time.perf_counter()
+    distances = packed.distances_to(origin)
+    packed_time = time.perf_counter() - start
+    print(f"Distances: list comprehension {list_time:.3f} s, PackedTuples {packed_time:.3f} s, "
+          f"same: {all(abs(a - b) < 1e-9 for a, b in zip(distances, expected))}")
+
+    palette = [(random.randrange(256), random.randrange(256), random.randrange(256))
+               for _ in range(16)]
+    pixels = [palette[random.randrange(16)] for _ in range(n)]
+    # Parsed data (files, network) creates a new tuple object per pixel
+    colours_list, list_bytes = traced_bytes(lambda: [tuple(list(p)) for p in pixels])
+    interned, interned_bytes = traced_bytes(lambda: InternedTuples('rgb', 'B', pixels))
+    print(f"{n:,} colours: list of tuples {list_bytes / 1e6:.1f} MB, "
+          f"InternedTuples {interned_bytes / 1e6:.1f} MB ({list_bytes / interned_bytes:.0f}x less)")
+
+    start = time.perf_counter()
+    gray_list = [rgb_to_gray(c) for c in colours_list]
+    list_time = time.perf_counter() - start
+    start = time.perf_counter()
+    gray = interned.values_by_code(rgb_to_gray)
+    interned_time = time.perf_counter() - start
+    print(f"Grayscale: list comprehension {list_time:.3f} s, per distinct colour "
+          f"{interned_time:.3f} s, same: {list(gray) == gray_list}")
+
+
+if __name__ == "__main__":
+    print("\n=== Packed Points ===")
+    points = PackedTuples(('x', 'y'), 'd', [(10, 20), (3, 4), (-1, 7)])
+    print(points)
+    x, y = points[0]  # unpacking works like a tuple
+    print("Point coordinates (x, y):", (x, y), "| named:", points.named(1))
+    points.append((6, 8))
+    print("All x values:", points.column('x').tolist())
+    print("Distances to origin:", points.distances_to((0, 0)).tolist())
+
+    print("\n=== 3D Points ===")
+    points_3d = PackedTuples('xyz', 'd', [(1, 2, 3), (2, 3, 6)])
+    for x, y, z in points_3d:
+        print(f"({x}, {y}, {z}) is {math.sqrt(x * x + y * y + z * z):.2f} from the origin")
+
+    print("\n=== Interned Colours ===")
+    orange, white = (255, 128, 0), (255, 255, 255)
+    image = InternedTuples('rgb', 'B', [orange, white, orange, orange, white])
+    print(image, "| codes:", image.codes.tolist(), "| palette:", list(image.palette))
+    print("RGB color values:", image[0])
+    print("Hex:", image.values_by_code(rgb_to_hex))
+    hsv = image.map_palette(rgb_to_hsv, ('h', 's', 'v'))
+    print("HSV of pixel 0:", tuple(round(v, 3) for v in hsv[0]))
+
+    print("\n=== Benchmark ===")
+    benchmark()
@@ -0,0 +1,283 @@
+"""
+Python Ranking Tutorial
+
+dictionaries.py sorts a dictionary by value with
+    dict(sorted(person.items(), key=lambda item: item[1]))
+which builds a list of every (key, value) pair and calls a Python lambda
+per key, even when only the best few entries are needed. For score maps
+with millions of keys this file shows cheaper ways to rank:
+1. Top-n with heapq (no full sort)
+2. Full sorts with operator.itemgetter or an argsort over the values
+3. Sorting chunks in parallel processes and k-way merging with heapq.merge
+4. SortedView - a dict that keeps its entries ordered by value as it changes
+
+Run this file to see the examples and the benchmark.
+"""
+
+import bisect
+import heapq
+import os
+import random
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice
+from operator import itemgetter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import np, timed  # np is None without NumPy; argsort falls back to sorted(range(n))
+
+by_value = itemgetter(1)
+
+
+def top_n(scores, n, largest=True):
+    """
+    Return the n (key, value) pairs with the largest (or smallest) values.
+
+    heapq keeps only n candidates while scanning, so this is O(len * log n)
+    instead of sorting everything. Entries are built as (value, ticket, key)
+    so the heap compares floats directly instead of calling a key function.
+    The ticket counts insertion order (downwards for largest), so equal
+    values keep their first-seen order like sorted() and keys are never
+    compared.
+    """
+    pick = heapq.nlargest if largest else heapq.nsmallest
+    tickets = count(0, -1) if largest else count()
+    return [(key, value) for value, _, key in pick(n, zip(scores.values(), tickets, scores))]
+
+
+def sort_by_value(scores, reverse=False):
+    """dictionaries.py's sorted_by_values, with itemgetter instead of a lambda"""
+    return dict(sorted(scores.items(), key=by_value, reverse=reverse))
+
+
+def argsort_values(values, reverse=False):
+    """
+    Return the positions that would sort values (stable).
+
+    With reverse=True equal values still keep their original order, as in
+    sorted(..., reverse=True); reversing an ascending argsort would flip them.
+    """
+    if np is None:
+        return sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+    array = np.asarray(values)
+    if not reverse:
+        return np.argsort(array, kind='stable').tolist()
+    # Sort the reversed values ascending, then read that order backwards:
+    # ties come out in their original order and no value is negated
+    backwards = np.argsort(array[::-1], kind='stable')[::-1]
+    return (len(array) - 1 - backwards).tolist()
+
+
+def sort_by_value_argsort(scores, reverse=False):
+    """
+    Sort by value through an argsort of the values alone.
+
+    Only the values are compared (as a NumPy array when installed); keys
+    are reordered afterwards with one indexing pass.
+    """
+    keys = list(scores)
+    values = list(scores.values())
+    order = argsort_values(values, reverse)
+    return {keys[i]: values[i] for i in order}
+
+
+def _argsort_chunk(task):
+    """Worker: return the positions (offset by start) that sort one chunk of values"""
+    start, values = task
+    return array('q', [start + i for i in sorted(range(len(values)), key=values.__getitem__)])
+
+
+def parallel_sort_items(scores, workers=None, chunks=None):
+    """
+    Sort (key, value) pairs by value using several processes.
+
+    Only the values are sent to the workers (as a compact array('d') when
+    they are all floats), each worker returns the argsort of its chunk as
+    an array of positions, and the runs are combined with heapq.merge, a
+    k-way merge that yields the result lazily. Returns an iterator of
+    (key, value) pairs; ties keep their original order.
+
+    The merge itself runs in the parent process, one Python comparison per
+    item, so on a typical machine this is not faster than sort_by_value or
+    sort_by_value_argsort (with NumPy, argsort is far faster). It is
+    useful when the workers do more per item than compare floats, or to
+    keep the parent responsive; see benchmark() for measured numbers.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = chunks or workers
+    keys = list(scores)
+    values = list(scores.values())
+    size = -(-len(values) // chunks) or 1
+    if len(values) <= size:
+        order = sorted(range(len(values)), key=values.__getitem__)
+        return ((keys[i], values[i]) for i in order)
+    floats = all(type(value) is float for value in values)
+    tasks = [(start, array('d', values[start:start + size]) if floats
+              else values[start:start + size]) for start in range(0, len(values), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        runs = list(executor.map(_argsort_chunk, tasks))
+    merged = heapq.merge(*runs, key=values.__getitem__)
+    return ((keys[i], values[i]) for i in merged)
+
+
+class SortedView:
+    """
+    A dictionary whose entries are also kept sorted by value.
+
+    (value, key) pairs live in sorted chunks of about chunk_size entries,
+    with _maxes holding the last pair of each chunk (the layout used by
+    Functions/sorted_index.py). A change bisects _maxes, then inserts into
+    or deletes from one small chunk, so top(), bottom() and rank() never
+    re-sort. Keys must be comparable with each other; they break ties
+    between equal values.
+    """
+
+    def __init__(self, scores=(), chunk_size=1000):
+        self.chunk_size = chunk_size
+        self._scores = dict(scores)
+        order = sorted(zip(self._scores.values(), self._scores))
+        self._chunks = [order[i:i + chunk_size] for i in range(0, len(order), chunk_size)]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+
+    def __len__(self):
+        return len(self._scores)
+
+    def __contains__(self, key):
+        return key in self._scores
+
+    def __getitem__(self, key):
+        return self._scores[key]
+
+    def __setitem__(self, key, value):
+        if key in self._scores:
+            self._remove(key)
+        self._scores[key] = value
+        self._insert((value, key))
+
+    def __delitem__(self, key):
+        self._remove(key)
+        del self._scores[key]
+
+    def _insert(self, entry):
+        if not self._chunks:
+            self._chunks.append([entry])
+            self._maxes.append(entry)
+            return
+        position = min(bisect.bisect_left(self._maxes, entry), len(self._chunks) - 1)
+        chunk = self._chunks[position]
+        bisect.insort(chunk, entry)
+        self._maxes[position] = chunk[-1]
+        if len(chunk) > 2 * self.chunk_size:
+            half = len(chunk) // 2
+            self._chunks[position:position + 1] = [chunk[:half], chunk[half:]]
+            self._maxes[position:position + 1] = [chunk[half - 1], chunk[-1]]
+
+    def _remove(self, key):
+        entry = (self._scores[key], key)
+        position = bisect.bisect_left(self._maxes, entry)
+        chunk = self._chunks[position]
+        del chunk[bisect.bisect_left(chunk, entry)]
+        if chunk:
+            self._maxes[position] = chunk[-1]
+        else:
+            del self._chunks[position]
+            del self._maxes[position]
+
+    def update(self, scores):
+        for key, value in dict(scores).items():
+            self[key] = value
+
+    def _ascending(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def _descending(self):
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+    def __iter__(self):
+        """Keys in ascending value order"""
+        return (key for _, key in self._ascending())
+
+    def items(self):
+        return [(key, value) for value, key in self._ascending()]
+
+    def top(self, n):
+        return [(key, value) for value, key in islice(self._descending(), n)]
+
+    def bottom(self, n):
+        return [(key, value) for value, key in islice(self._ascending(), n)]
+
+    def rank(self, key):
+        """Position of key counted from the highest value (0 = best)"""
+        entry = (self._scores[key], key)
+        position = bisect.bisect_left(self._maxes, entry)
+        chunk = self._chunks[position]
+        above = len(chunk) - 1 - bisect.bisect_left(chunk, entry)
+        return above + sum(len(c) for c in self._chunks[position + 1:])
+
+    def __repr__(self):
+        return f"SortedView({dict(self.items())})"
+
+
+def benchmark(n=1_000_000):
+    """Rank a score map of n keys in several ways"""
+    scores = {f"user{i}": random.random() for i in range(n)}
+
+    expected, lambda_time = timed(lambda: dict(sorted(scores.items(), key=lambda item: item[1])))
+    print(f"sorted(..., key=lambda) on {n:,} keys: {lambda_time:.3f} s")
+    result, serial_time = timed(lambda: sort_by_value(scores))
+    print(f"sorted(..., key=itemgetter(1)):      {serial_time:.3f} s, same: {list(result) == list(expected)}")
+    result, argsort_time = timed(lambda: sort_by_value_argsort(scores))
+    print(f"argsort of the values:               {argsort_time:.3f} s, same: {list(result) == list(expected)} "
+          f"({'NumPy' if np else 'pure Python'})")
+    result, parallel_time = timed(lambda: list(parallel_sort_items(scores, workers=4)))
+    print(f"4 processes + heapq.merge:           {parallel_time:.3f} s, "
+          f"same: {[k for k, _ in result] == list(expected)}")
+    fastest = min(serial_time, argsort_time)
+    if parallel_time > fastest:
+        print(f"  -> the merge in the parent costs more than it saves: "
+              f"{parallel_time / fastest:.1f}x slower than one process, "
+              f"so use sort_by_value_argsort for plain numeric values")
+
+    best, elapsed = timed(lambda: top_n(scores, 10))
+    print(f"Top 10 with heapq:                   {elapsed:.3f} s, "
+          f"same: {[k for k, _ in best] == list(expected)[::-1][:10]}")
+
+    view = SortedView(scores)
+    keys = list(scores)
+    updates = [(random.choice(keys), random.random()) for _ in range(10_000)]
+    _, elapsed = timed(lambda: [view.__setitem__(k, v) or view.top(10) for k, v in updates])
+    print(f"10,000 updates + top 10 (SortedView): {elapsed:.3f} s")
+    _, elapsed = timed(lambda: [scores.__setitem__(k, v) or top_n(scores, 10)
+                                for k, v in updates[:20]])
+    print(f"heapq top 10 after each update:      {elapsed / 20 * 10_000:.0f} s (estimated from 20)")
+
+
+if __name__ == "__main__":
+    print("\n=== Sorting by Value ===")
+    person = {"name": "John", "city": "New York", "job": "Developer"}
+    print("Sorted by values:", sort_by_value(person))
+    scores = {"alice": 91, "bob": 78, "carol": 85, "dave": 97, "erin": 62}
+    print("Scores, highest first:", sort_by_value(scores, reverse=True))
+    print("Via argsort:", sort_by_value_argsort(scores))
+
+    print("\n=== Top-n Without a Full Sort ===")
+    print("Best two:", top_n(scores, 2))
+    print("Worst two:", top_n(scores, 2, largest=False))
+
+    print("\n=== Parallel Sort and k-way Merge ===")
+    print("Merged runs:", list(parallel_sort_items(scores, workers=2)))
+
+    print("\n=== Incrementally Sorted View ===")
+    view = SortedView(scores)
+    print("Top three:", view.top(3))
+    view["erin"] = 99
+    view["frank"] = 80
+    del view["dave"]
+    print("After updates:", view.top(3), "| erin's rank:", view.rank("erin"))
+    print("Lowest two:", view.bottom(2))
+
+    print("\n=== Benchmark ===")
+    benchmark()
@@ -0,0 +1,287 @@
+"""
+Python Compact Records Tutorial
+
+dictionaries.py stores records as nested dictionaries, for example
+    students["student1"]["grades"]["math"]
+and map_filter_lambda.py keeps people as [{'name': ..., 'age': ...}].
+Every one of those dicts carries its own hash table, which costs far more
+memory than the data inside it. This file shows two compact layouts
+generated from a field specification:
+1. Record classes with __slots__ (one small object per record)
+2. Struct-of-arrays containers (one typed column per field)
+3. Dict-style access (record["name"], .get(), .keys()) for compatibility
+4. Fast conversion to and from the dict form
+5. Measuring bytes per record against plain dicts
+
+Run this file to see the examples and the benchmark.
+"""
+
+import tracemalloc
+from array import array
+
+# Column typecodes for the struct-of-arrays layout; other types use a list
+TYPECODES = {int: 'q', float: 'd', bool: 'b'}
+INT64_RANGE = range(-2 ** 63, 2 ** 63)
+
+
+class RecordBase:
+    """Dict-like behaviour shared by every generated record class"""
+
+    __slots__ = ()
+    _fields = ()
+    _nested = {}
+
+    def __getitem__(self, key):
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self._fields:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __eq__(self, other):
+        if isinstance(other, RecordBase):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self):
+        return list(self._fields)
+
+    def values(self):
+        return [getattr(self, field) for field in self._fields]
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in self._fields]
+
+    def to_dict(self):
+        """Convert back to (nested) plain dictionaries"""
+        result = {}
+        for field in self._fields:
+            value = getattr(self, field)
+            result[field] = value.to_dict() if field in self._nested else value
+        return result
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a (nested) dictionary; missing fields become None"""
+        values = []
+        for field in cls._fields:
+            value = data.get(field)
+            if field in cls._nested and value is not None:
+                value = cls._nested[field].from_dict(value)
+            values.append(value)
+        return cls(*values)
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+def make_record_type(name, spec):
+    """
+    Generate a __slots__ record class from a field specification.
+
+    spec maps field names to types; a nested dict becomes a nested record
+    type, e.g. {'name': str, 'grades': {'math': int, 'science': int}}.
+    """
+    nested = {}
+    for field, kind in spec.items():
+        if isinstance(kind, dict):
+            nested[field] = make_record_type(f"{name}_{field}", kind)
+    fields = tuple(spec)
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(fields):
+            raise TypeError(f"{name} takes at most {len(fields)} values")
+        values = dict(zip(fields, args))
+        for key, value in kwargs.items():
+            if key not in fields:
+                raise TypeError(f"{name} has no field {key!r}")
+            values[key] = value
+        for field in fields:
+            setattr(self, field, values.get(field))
+
+    return type(name, (RecordBase,), {
+        '__slots__': fields,
+        '_fields': fields,
+        '_nested': nested,
+        '_spec': spec,
+        '__init__': __init__,
+    })
+
+
+class ColumnStore:
+    """
+    Struct-of-arrays container: one column per field.
+
+    Numeric fields live in array.array columns (8 bytes per value), other
+    fields in lists. Nested specs are flattened into dotted column names
+    such as "grades.math". Indexing returns a plain dict for that row.
+
+    Values are checked against the spec on append, so rows read back as
+    they went in: bools stay bools, ints in float columns become floats,
+    and a missing field or None is remembered as a null and returned as
+    None (array columns store 0 there and record the position in _nulls).
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.columns = {}
+        self._types = {}
+        self._nulls = {}  # path -> set of row numbers holding None (array columns)
+        self._flatten(spec, "")
+        self._length = 0
+
+    def _flatten(self, spec, prefix):
+        for field, kind in spec.items():
+            path = prefix + field
+            if isinstance(kind, dict):
+                self._flatten(kind, path + ".")
+            else:
+                typecode = TYPECODES.get(kind)
+                self.columns[path] = array(typecode) if typecode else []
+                self._types[path] = kind
+                if typecode:
+                    self._nulls[path] = set()
+
+    def __len__(self):
+        return self._length
+
+    def _checked(self, path, data):
+        """Look up path in a nested dict and check the value against the spec"""
+        value = data
+        for part in path.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value is None:
+            return None
+        kind = self._types[path]
+        if kind is float and type(value) is int:
+            return float(value)
+        # bool is a subclass of int, but True in an int column would read back as 1
+        if not isinstance(value, kind) or (kind is not bool and isinstance(value, bool)):
+            raise TypeError(f"{path!r} expects {kind.__name__}, got {type(value).__name__}")
+        if kind is int and value not in INT64_RANGE:
+            raise OverflowError(f"{path!r} value {value} does not fit in 64 bits")
+        return value
+
+    def append(self, data):
+        """Append one record given as a (nested) dictionary"""
+        values = [self._checked(path, data) for path in self.columns]  # all or nothing
+        for (path, column), value in zip(self.columns.items(), values):
+            if value is None and isinstance(column, array):
+                self._nulls[path].add(self._length)
+                value = 0
+            column.append(value)
+        self._length += 1
+
+    def extend(self, records):
+        for data in records:
+            self.append(data)
+
+    @classmethod
+    def from_dicts(cls, spec, records):
+        store = cls(spec)
+        store.extend(records)
+        return store
+
+    def column(self, path):
+        """Return a whole column, e.g. store.column("grades.math") (nulls are 0 in arrays)"""
+        return self.columns[path]
+
+    def row(self, index):
+        """Return one record as a nested dictionary"""
+        result = {}
+        for path, column in self.columns.items():
+            target = result
+            *parents, last = path.split(".")
+            for part in parents:
+                target = target.setdefault(part, {})
+            value = column[index]
+            if path in self._nulls:
+                if index in self._nulls[path]:
+                    value = None
+                elif self._types[path] is bool:
+                    value = bool(value)
+            target[last] = value
+        return result
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ColumnStore index out of range")
+        return self.row(index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self.row(index)
+
+    def to_dicts(self):
+        return list(self)
+
+
+def bytes_per_record(build, n):
+    """Measure the memory allocated by build(n) divided by n"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return (after - before) / n
+
+
+if __name__ == "__main__":
+    print("\n=== Generated Record Classes ===")
+    student_spec = {'name': str, 'grades': {'math': int, 'science': int}}
+    Student = make_record_type('Student', student_spec)
+    alice = Student.from_dict({"name": "Alice", "grades": {"math": 95, "science": 98}})
+    print(alice)
+    print("Dict-style access:", alice["grades"]["math"], alice.get("email", "Not found"))
+    print("Back to dict:", alice.to_dict())
+
+    print("\n=== Struct-of-Arrays ===")
+    people = [
+        {'name': 'Alice', 'age': 25},
+        {'name': 'Bob', 'age': 17},
+        {'name': 'Charlie', 'age': 30},
+        {'name': 'David', 'age': 15}
+    ]
+    store = ColumnStore.from_dicts({'name': str, 'age': int}, people)
+    print("Ages column:", store.column("age"))
+    print("Row 2:", store[2])
+    print("Round trip equal:", store.to_dicts() == people)
+
+    print("\n=== Memory per Record ===")
+    n = 200_000
+    make_dict = lambda i: {'name': f"person{i}", 'age': i % 90,
+                           'grades': {'math': i % 100, 'science': (i * 7) % 100}}
+    spec = {'name': str, 'age': int, 'grades': {'math': int, 'science': int}}
+    Record = make_record_type('Record', spec)
+
+    dict_bytes = bytes_per_record(lambda n: [make_dict(i) for i in range(n)], n)
+    slot_bytes = bytes_per_record(
+        lambda n: [Record(f"person{i}", i % 90, Record._nested['grades'](i % 100, (i * 7) % 100))
+                   for i in range(n)], n)
+    column_bytes = bytes_per_record(
+        lambda n: ColumnStore.from_dicts(spec, (make_dict(i) for i in range(n))), n)
+    print(f"Nested dicts:      {dict_bytes:6.0f} bytes per record")
+    print(f"__slots__ records: {slot_bytes:6.0f} bytes per record")
+    print(f"Column store:      {column_bytes:6.0f} bytes per record")
+    print("(all three include the name strings, about 57 bytes each)")
@@ -0,0 +1,343 @@
+"""
+Python Probabilistic Counting (Sketches) Tutorial
+
+dictionaries.py counts items exactly with Counter and defaultdict(int).
+An exact counter needs one entry per distinct item, so on an endless
+stream with millions of distinct values it keeps growing. Sketches trade
+a small, known error for a fixed amount of memory:
+1. Count-Min Sketch - approximate count of any item
+2. Space-Saving - the top-k most frequent items (heavy hitters)
+3. HyperLogLog - approximate number of distinct items
+4. Merging sketches built by different workers
+5. Serialising sketches to bytes
+6. Comparing memory and speed with Counter
+
+Run this file to see the examples and the benchmark.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import random
+import struct
+import sys
+import time
+from array import array
+from collections import Counter
+from itertools import count as tickets
+
+from dedup import _canonical  # type-tagged bytes: 1, 1.0 and True encode alike, "1" does not
+
+
+def _hash64(item, seed=0):
+    """
+    Return a 64-bit hash of item that is the same in every process.
+
+    Items are encoded like dedup.py's fingerprints, so items that compare
+    equal hash alike and 1 and "1" stay apart. Unsupported types raise
+    TypeError instead of being hashed through str().
+    """
+    digest = hashlib.blake2b(_canonical(item), digest_size=8, salt=seed.to_bytes(8, 'little')).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class CountMinSketch:
+    """
+    Approximate counts in width * depth counters.
+
+    Error bound: estimate(x) is never below the true count, and with
+    probability at least 1 - delta it is at most true count + epsilon * N,
+    where N is the total of all counts, width = ceil(e / epsilon) and
+    depth = ceil(ln(1 / delta)).
+    """
+
+    def __init__(self, width=2048, depth=5, seed=0):
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.total = 0
+        self.table = [array('Q', bytes(8 * width)) for _ in range(depth)]
+
+    @classmethod
+    def from_error(cls, epsilon=0.001, delta=0.01, seed=0):
+        """Build a sketch sized for the given error bounds"""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), seed)
+
+    def _columns(self, item):
+        # Two hashes combined as h1 + i*h2 give `depth` independent-enough columns
+        h = _hash64(item, self.seed)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, item, count=1):
+        for row, column in zip(self.table, self._columns(item)):
+            row[column] += count
+        self.total += count
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def estimate(self, item):
+        return min(row[column] for row, column in zip(self.table, self._columns(item)))
+
+    def merge(self, other):
+        """Add another sketch's counts into this one (same size and seed)"""
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("Can only merge sketches with the same width, depth and seed")
+        for row, other_row in zip(self.table, other.table):
+            for i, value in enumerate(other_row):
+                if value:
+                    row[i] += value
+        self.total += other.total
+        return self
+
+    def to_bytes(self):
+        header = struct.pack('<IIQQ', self.width, self.depth, self.seed, self.total)
+        return header + b''.join(row.tobytes() for row in self.table)
+
+    @classmethod
+    def from_bytes(cls, data):
+        width, depth, seed, total = struct.unpack_from('<IIQQ', data)
+        sketch = cls(width, depth, seed)
+        sketch.total = total
+        offset = struct.calcsize('<IIQQ')
+        for row in sketch.table:
+            row[:] = array('Q', data[offset:offset + 8 * width])
+            offset += 8 * width
+        return sketch
+
+    def memory_bytes(self):
+        return self.width * self.depth * 8
+
+
+class SpaceSaving:
+    """
+    Track the k most frequent items with exactly k counters.
+
+    When a new item arrives and all counters are taken, the item with the
+    smallest count is replaced and the newcomer inherits that count (+1).
+    Error bound: every reported count overestimates the true count by at
+    most N / k, and any item that occurs more than N / k times is kept.
+
+    The smallest counter is found with a min-heap holding one
+    (count, ticket, item) entry per item. Increments do not touch the heap,
+    so an entry's count may be stale (too low); a stale entry that reaches
+    the top is pushed back with the current count. Since counts only grow,
+    the first up-to-date entry popped is the true minimum, and eviction
+    costs O(log k) amortised instead of an O(k) scan.
+    """
+
+    def __init__(self, k=100):
+        self.k = k
+        self.counts = {}
+        self.errors = {}  # how much each count may be overestimated
+        self.total = 0
+        self._heap = []
+        self._tickets = tickets()  # tie-breaker, so items never need to be comparable
+
+    def _rebuild_heap(self):
+        self._heap = [(count, next(self._tickets), item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def _pop_smallest(self):
+        heap, counts = self._heap, self.counts
+        while True:
+            count, _, item = heapq.heappop(heap)
+            if counts[item] == count:
+                return item, count
+            heapq.heappush(heap, (counts[item], next(self._tickets), item))
+
+    def add(self, item, count=1):
+        self.total += count
+        counts = self.counts
+        if item in counts:
+            counts[item] += count
+            return
+        if len(counts) < self.k:
+            floor = 0
+        else:
+            victim, floor = self._pop_smallest()
+            del counts[victim]
+            del self.errors[victim]
+        counts[item] = floor + count
+        self.errors[item] = floor
+        heapq.heappush(self._heap, (floor + count, next(self._tickets), item))
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def top(self, n=None):
+        """Return [(item, count, max_error)] for the n most frequent items"""
+        n = n or self.k
+        best = heapq.nlargest(n, self.counts.items(), key=lambda pair: pair[1])
+        return [(item, count, self.errors[item]) for item, count in best]
+
+    def merge(self, other):
+        """Combine two summaries and keep the k largest counts"""
+        floor_self = min(self.counts.values()) if len(self.counts) >= self.k else 0
+        floor_other = min(other.counts.values()) if len(other.counts) >= other.k else 0
+        counts, errors = {}, {}
+        for item in set(self.counts) | set(other.counts):
+            counts[item] = self.counts.get(item, floor_self) + other.counts.get(item, floor_other)
+            errors[item] = (self.errors.get(item, floor_self)
+                            + other.errors.get(item, floor_other))
+        kept = heapq.nlargest(self.k, counts, key=counts.get)
+        self.counts = {item: counts[item] for item in kept}
+        self.errors = {item: errors[item] for item in kept}
+        self.total += other.total
+        self._rebuild_heap()
+        return self
+
+    def to_bytes(self):
+        """
+        Serialise to JSON bytes.
+
+        Only str items are supported: JSON would silently turn tuple keys
+        into lists and int keys would not survive other encoders, so any
+        other item type raises TypeError instead of round-tripping wrongly.
+        """
+        for item in self.counts:
+            if type(item) is not str:
+                raise TypeError(f"SpaceSaving.to_bytes supports str items only, "
+                                f"got {type(item).__name__}")
+        state = {'k': self.k, 'total': self.total,
+                 'items': [[item, self.counts[item], self.errors[item]] for item in self.counts]}
+        return json.dumps(state).encode()
+
+    @classmethod
+    def from_bytes(cls, data):
+        state = json.loads(data)
+        summary = cls(state['k'])
+        summary.total = state['total']
+        for item, count, error in state['items']:
+            summary.counts[item] = count
+            summary.errors[item] = error
+        summary._rebuild_heap()
+        return summary
+
+
+class HyperLogLog:
+    """
+    Estimate the number of distinct items with 2**p one-byte registers.
+
+    Error bound: the standard error is about 1.04 / sqrt(2**p), so the
+    default p=14 (16 KB) is typically within 1% of the true count.
+    """
+
+    def __init__(self, p=14, seed=0):
+        if not 4 <= p <= 18:
+            raise ValueError("p must be between 4 and 18")
+        self.p = p
+        self.m = 1 << p
+        self.seed = seed
+        self.registers = bytearray(self.m)
+
+    def add(self, item):
+        h = _hash64(item, self.seed)
+        index = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def count(self):
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))  # linear counting for small sets
+        return round(estimate)
+
+    def merge(self, other):
+        """Union with another HyperLogLog (same p and seed)"""
+        if (self.p, self.seed) != (other.p, other.seed):
+            raise ValueError("Can only merge HyperLogLogs with the same p and seed")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def to_bytes(self):
+        return struct.pack('<BQ', self.p, self.seed) + bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data):
+        p, seed = struct.unpack_from('<BQ', data)
+        hll = cls(p, seed)
+        hll.registers = bytearray(data[struct.calcsize('<BQ'):])
+        return hll
+
+    def memory_bytes(self):
+        return self.m
+
+
+def counter_memory_bytes(counter):
+    """Rough memory used by a Counter: the table plus its keys"""
+    return sys.getsizeof(counter) + sum(sys.getsizeof(key) for key in counter)
+
+
+if __name__ == "__main__":
+    random.seed(1)
+    # A skewed stream: a few very common words plus a long tail of user ids
+    stream = [f"word{int(random.paretovariate(1.1))}" if random.random() < 0.7
+              else f"user{random.randrange(10 ** 7)}" for _ in range(200_000)]
+    exact = Counter(stream)
+
+    print("\n=== Count-Min Sketch ===")
+    cms = CountMinSketch.from_error(epsilon=0.001, delta=0.01)
+    cms.update(stream)
+    for word in ["word1", "word2", "word50"]:
+        print(f"{word}: exact={exact[word]}, estimate={cms.estimate(word)}")
+    print(f"Guaranteed (99%) overestimate at most {0.001 * cms.total:.0f}")
+
+    print("\n=== Space-Saving Top-k ===")
+    heavy = SpaceSaving(k=50)
+    heavy.update(stream)
+    print("Top 5 (item, count, max error):", heavy.top(5))
+    print("Exact top 5:", exact.most_common(5))
+
+    print("\n=== HyperLogLog Distinct Count ===")
+    hll = HyperLogLog(p=12)
+    hll.update(stream)
+    print(f"Distinct words: exact={len(exact)}, estimate={hll.count()}")
+
+    print("\n=== Merging Across Workers ===")
+    half = len(stream) // 2
+    left, right = HyperLogLog(p=12), HyperLogLog(p=12)
+    left.update(stream[:half])
+    right.update(stream[half:])
+    print("Merged HyperLogLog estimate:", left.merge(right).count())
+    cms_left, cms_right = CountMinSketch(2048, 5), CountMinSketch(2048, 5)
+    cms_left.update(stream[:half])
+    cms_right.update(stream[half:])
+    print("Merged Count-Min estimate for word1:", cms_left.merge(cms_right).estimate("word1"))
+    ss_left, ss_right = SpaceSaving(50), SpaceSaving(50)
+    ss_left.update(stream[:half])
+    ss_right.update(stream[half:])
+    print("Merged Space-Saving top 3:", ss_left.merge(ss_right).top(3))
+
+    print("\n=== Serialisation ===")
+    restored = HyperLogLog.from_bytes(hll.to_bytes())
+    print("HyperLogLog round trip:", restored.count() == hll.count(), f"({len(hll.to_bytes())} bytes)")
+    restored_cms = CountMinSketch.from_bytes(cms.to_bytes())
+    print("Count-Min round trip:", restored_cms.estimate("word1") == cms.estimate("word1"))
+    restored_ss = SpaceSaving.from_bytes(heavy.to_bytes())
+    print("Space-Saving round trip:", restored_ss.top(3) == heavy.top(3))
+
+    print("\n=== Memory and Speed vs Counter ===")
+    print(f"Counter:      {counter_memory_bytes(exact) / 1024:8.1f} KB for {len(exact)} keys")
+    print(f"Count-Min:    {cms.memory_bytes() / 1024:8.1f} KB (fixed)")
+    print(f"HyperLogLog:  {hll.memory_bytes() / 1024:8.1f} KB (fixed)")
+    for name, build in [("Counter", lambda: Counter(stream)),
+                        ("Count-Min", lambda: CountMinSketch(2048, 5).update(stream)),
+                        ("Space-Saving", lambda: SpaceSaving(50).update(stream)),
+                        ("HyperLogLog", lambda: HyperLogLog(12).update(stream))]:
+        start = time.perf_counter()
+        build()
+        print(f"{name:<13} {time.perf_counter() - start:.3f} s for {len(stream):,} items")
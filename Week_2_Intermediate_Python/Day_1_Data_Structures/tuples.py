@@ -11,6 +11,8 @@ Tuples are immutable sequences in Python, similar to lists but with key differen
 5. Tuples can be used as dictionary keys (lists cannot)
 """
 
+import math
+
 # Creating tuples
 print("\n=== Creating Tuples ===")
 empty_tuple = ()
@@ -82,7 +84,7 @@ print("RGB color values:", color)
 
 # Returning multiple values from calculations
 def calculate_circle(radius):
-    pi = 3.14159
+    pi = math.pi
     area = pi * radius * radius
     circumference = 2 * pi * radius
     return (area, circumference)
@@ -0,0 +1,193 @@
+"""
+Python Word Counter Tutorial
+
+dictionaries.py counts words with
+    word_frequency[word] = word_frequency.get(word, 0) + 1
+over text.split(), which needs the whole text in memory and does a
+Python-level dictionary update per word.
+This file counts words in files of any size:
+1. Reading files in fixed-size chunks (memory bounded by vocabulary)
+2. Tokenising with a compiled regular expression
+3. Counter.update(), which counts in C
+4. Splitting a file into shards and counting them in parallel processes
+5. Merging partial counts and top-k queries with a heap
+
+Run this file to see the examples and the benchmark.
+"""
+
+import heapq
+import os
+import re
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+WORD_PATTERN = re.compile(r"[\w']+")  # \w is Unicode-aware: café and 東京 are words
+WHITESPACE = re.compile(r"\s")
+BYTES_WHITESPACE = re.compile(rb"\s")
+CHUNK_SIZE = 1 << 20  # read 1 MiB at a time
+
+
+def tokenize(text, pattern=WORD_PATTERN):
+    """Return the lowercase words in text"""
+    return pattern.findall(text.lower())
+
+
+def _cut(block, whitespace, max_carry):
+    """
+    Return the position just after the last whitespace in block.
+
+    If the text after it is max_carry long or more (a "word" that never
+    ends, e.g. binary data), return len(block) instead so the caller's
+    buffer stays bounded; that run is then split in two.
+    """
+    match = whitespace.search(block[::-1])  # first match in reverse = last one
+    cut = len(block) - match.start() if match else 0
+    return cut if len(block) - cut < max_carry else len(block)
+
+
+def iter_chunks(f, chunk_size=CHUNK_SIZE, max_carry=None):
+    """
+    Yield text chunks from an open file without splitting words.
+
+    Each chunk is cut after its last whitespace character (space, tab,
+    newline, ...); the partial word at the end is carried over to the next
+    chunk. At most max_carry characters (default chunk_size) are carried.
+    """
+    max_carry = max_carry or chunk_size
+    leftover = ""
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            break
+        block = leftover + block
+        cut = _cut(block, WHITESPACE, max_carry)
+        leftover = block[cut:]
+        if cut:
+            yield block[:cut]
+    if leftover:
+        yield leftover
+
+
+def count_words(text):
+    """Count words in a string (the dictionaries.py example, but in C)"""
+    return Counter(tokenize(text))
+
+
+def count_file(path, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """Count words in a file, reading it chunk by chunk"""
+    counts = Counter()
+    with open(path, encoding=encoding, errors='replace') as f:
+        for chunk in iter_chunks(f, chunk_size):
+            counts.update(tokenize(chunk))
+    return counts
+
+
+def _shard_boundaries(path, shards):
+    """
+    Return byte offsets that split the file into roughly equal shards.
+
+    Each boundary is moved forward to just after the next newline so no
+    line (and therefore no word) is split between two shards.
+    """
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, shards):
+            f.seek(max(size * i // shards, boundaries[-1]))
+            f.readline()
+            boundaries.append(f.tell())
+    boundaries.append(size)
+    return sorted(set(boundaries))
+
+
+def _count_shard(args):
+    """Worker function: count the words between two byte offsets"""
+    path, start, end, chunk_size = args
+    counts = Counter()
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        leftover = b""
+        while remaining > 0:
+            block = leftover + f.read(min(chunk_size, remaining))
+            remaining = end - f.tell()
+            cut = _cut(block, BYTES_WHITESPACE, chunk_size) if remaining > 0 else len(block)
+            while 0 < cut < len(block) and block[cut] & 0xC0 == 0x80:
+                cut -= 1  # a forced cut must not split a UTF-8 character
+            leftover = block[cut:]
+            counts.update(tokenize(block[:cut].decode('utf-8', errors='replace')))
+        if leftover:
+            counts.update(tokenize(leftover.decode('utf-8', errors='replace')))
+    return counts
+
+
+def count_file_parallel(path, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Count words in a large file using several processes.
+
+    The file is split at line boundaries into one shard per worker; each
+    worker returns a Counter and the results are merged. Only the
+    vocabulary is sent between processes, never the text.
+    """
+    workers = workers or os.cpu_count() or 1
+    bounds = _shard_boundaries(path, workers)
+    tasks = [(path, start, end, chunk_size) for start, end in zip(bounds, bounds[1:])]
+    if len(tasks) <= 1:
+        return _count_shard(tasks[0]) if tasks else Counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_counts(executor.map(_count_shard, tasks))
+
+
+def merge_counts(partials):
+    """Merge several Counters (or dicts of counts) into one Counter"""
+    total = Counter()
+    for partial in partials:
+        total.update(partial)
+    return total
+
+
+def top_k(counts, k=10):
+    """
+    Return the k most common (word, count) pairs.
+
+    heapq.nlargest keeps a heap of only k items while scanning, so this
+    costs O(n log k) instead of sorting the whole vocabulary.
+    """
+    return heapq.nlargest(k, counts.items(), key=lambda item: item[1])
+
+
+if __name__ == "__main__":
+    print("\n=== Counting a String ===")
+    text = "hello world hello python world python python"
+    print("Word frequency:", dict(count_words(text)))
+
+    print("\n=== Counting Files in Chunks ===")
+    words = ["log", "error", "warning", "info", "debug", "user", "request", "timeout"]
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "server.log")
+        with open(path, "w") as f:
+            for i in range(300_000):
+                f.write(f"{words[i % 8]} {words[(i * 7) % 5]} line{i % 1000}\n")
+        print(f"File size: {os.path.getsize(path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        counts = count_file(path, chunk_size=64 * 1024)
+        print(f"count_file:          {time.perf_counter() - start:.3f} s")
+
+        start = time.perf_counter()
+        parallel_counts = count_file_parallel(path, workers=4)
+        print(f"count_file_parallel: {time.perf_counter() - start:.3f} s")
+        print("Same result:", counts == parallel_counts)
+
+        start = time.perf_counter()
+        with open(path) as f:
+            word_frequency = {}
+            for word in f.read().lower().split():
+                word_frequency[word] = word_frequency.get(word, 0) + 1
+        print(f"dict.get loop:       {time.perf_counter() - start:.3f} s")
+
+        print("\n=== Top-k With a Heap ===")
+        for word, count in top_k(counts, 5):
+            print(f"{word}: {count}")
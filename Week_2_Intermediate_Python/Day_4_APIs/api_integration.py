@@ -14,6 +14,7 @@ import requests
 import time
 from datetime import datetime
 import json
+from request_metrics import endpoint_template, metrics
 
 class APIClient:
     """Simple API client with rate limiting and error handling"""
@@ -38,12 +39,15 @@ class APIClient:
 
     def get(self, endpoint, params=None):
         """Make a GET request with rate limiting"""
-        self._check_rate_limit()
+        label = endpoint_template(endpoint)  # /posts/1 is recorded as /posts/{id}
+        with metrics.phase('rate_limit_wait', label):
+            self._check_rate_limit()
         url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.get(url, params=params)
+            response = metrics.timed_request(label, requests.get, url, params=params)
             response.raise_for_status()
-            return response.json()
+            with metrics.phase('parse', label, response.status_code):
+                return response.json()
         except requests.exceptions.RequestException as e:
             print(f"Error making request: {e}")
             return None
@@ -167,4 +171,5 @@ print("4. Handle errors gracefully")
 print("5. Use retries with exponential backoff")
 print("6. Transform data to match your needs")
 print("7. Document your API integration")
-print("8. Monitor API usage and responses")
\ No newline at end of file
+print("8. Monitor API usage and responses")
+print("   (see request_metrics.py: metrics.enable(), then metrics.to_prometheus())")
\ No newline at end of file
@@ -15,6 +15,7 @@ import json
 from datetime import datetime, timedelta
 import hmac
 import hashlib
+from request_metrics import endpoint_template, metrics
 
 print("\n=== Basic Authentication ===")
 def basic_auth_request(url, username, password):
@@ -95,12 +96,15 @@ class OAuth2Client:
         # Check if token is expired
         if not self.access_token or \
            (self.token_expires and datetime.now() >= self.token_expires):
-            self.get_access_token()
+            with metrics.phase('token_refresh', endpoint_template(self.token_url)):
+                self.get_access_token()
         
         headers = kwargs.pop('headers', {})
         headers['Authorization'] = f'Bearer {self.access_token}'
         
-        return requests.request(method, url, headers=headers, **kwargs)
+        response = metrics.timed_request(endpoint_template(url), requests.request,
+                                         method, url, headers=headers, **kwargs)
+        return response
 
 # Example OAuth2 usage (with fake credentials)
 print("OAuth 2.0 Example:")
@@ -13,6 +13,7 @@ import requests
 import time
 import logging
 from datetime import datetime
+from request_metrics import endpoint_template, metrics
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -65,15 +66,19 @@ for url in urls:
 print("\n=== Retry Mechanism ===")
 def retry_request(url, max_retries=3, delay=1):
     """Make a request with retry logic"""
+    endpoint = endpoint_template(url)  # /posts/{id}, not one label per URL
     for attempt in range(max_retries):
         try:
-            response = requests.get(url)
+            response = metrics.timed_request(endpoint, requests.get, url)
             response.raise_for_status()
-            return response.json()
+            with metrics.phase('parse', endpoint, response.status_code):
+                return response.json()
         except requests.exceptions.RequestException as e:
             logger.warning(f"Attempt {attempt + 1} failed: {e}")
             if attempt < max_retries - 1:
-                time.sleep(delay * (attempt + 1))  # Exponential backoff
+                # Record our own back-off separately from network time
+                with metrics.phase('retry_sleep', endpoint):
+                    time.sleep(delay * (attempt + 1))  # Exponential backoff
             else:
                 logger.error(f"All retries failed for {url}")
                 raise
@@ -125,14 +130,16 @@ def make_api_request(url, method='get', **kwargs):
         # Add timeout
         kwargs.setdefault('timeout', 10)
         
-        # Make the request
-        response = request_func(url, **kwargs)
+        # Make the request (timed when request_metrics is enabled)
+        endpoint = endpoint_template(url)
+        response = metrics.timed_request(endpoint, request_func, url, **kwargs)
         
         # Check for HTTP errors
         response.raise_for_status()
         
         # Parse response
-        return response.json()
+        with metrics.phase('parse', endpoint, response.status_code):
+            return response.json()
     
     except requests.exceptions.Timeout:
         logger.error(f"Request to {url} timed out")
@@ -0,0 +1,330 @@
+"""
+Python Request Metrics Tutorial
+
+This module shows how to measure where the time goes in an HTTP call.
+Topics covered:
+1. Timing request phases with time.perf_counter
+2. HDR-style (log-linear) latency histograms
+3. Labels for endpoint and status
+4. A pluggable hook that costs almost nothing when disabled
+5. Exporting metrics as Prometheus text or JSON
+6. Keeping label values few: endpoint templates such as /posts/{id}
+
+The other Day 4 files (api_integration.py, error_handling.py and
+authentication.py) import `metrics` from here and record their phases.
+
+Note: requests does not expose DNS, connect and TLS timings separately.
+`response.elapsed` measures the time from sending the request until the
+response headers arrived (network + server time), so we record that as
+the "server" phase and the rest of the call as "transfer".
+"""
+
+import bisect
+import json
+import math
+import re
+import time
+import threading
+from contextlib import contextmanager
+from itertools import accumulate
+from urllib.parse import urlsplit
+
+# Path segments that identify one resource: numbers, UUIDs and long hex ids
+ID_SEGMENT = re.compile(r"\d+|[0-9a-fA-F]{8}(-?[0-9a-fA-F]{4}){3}-?[0-9a-fA-F]{12}|[0-9a-fA-F]{24,}")
+
+# Upper bounds (seconds) of the Prometheus histogram buckets, as in the official clients
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+
+def endpoint_template(url):
+    """
+    Turn a URL into a low-cardinality endpoint label.
+
+    The scheme, host and query string are dropped and id-like path
+    segments become {id}, so https://api.example.com/posts/42?page=2 and
+    /posts/7 are both recorded as /posts/{id}. Using full URLs as labels
+    would create a new histogram for every resource and every query.
+    """
+    path = urlsplit(str(url)).path or "/"
+    return "/".join("{id}" if ID_SEGMENT.fullmatch(segment) else segment
+                    for segment in path.split("/"))
+
+
+def _escape_label(value):
+    """Escape a Prometheus label value (backslash, double quote, newline)"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of durations in seconds.
+
+    Values are stored in buckets whose width grows with the magnitude of
+    the value: every power of two is split into `sub_buckets` equal slices,
+    so the relative error stays below 1 / sub_buckets at every scale
+    while the number of buckets stays small.
+    """
+
+    def __init__(self, lowest=1e-6, sub_buckets=16):
+        self.lowest = lowest  # smallest distinguishable value (1 microsecond)
+        self.sub_buckets = sub_buckets
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket_index(self, value):
+        """Map a value to its bucket index"""
+        scaled = max(value / self.lowest, 1.0)
+        exponent = int(math.log2(scaled))
+        fraction = scaled / (1 << exponent) - 1.0  # in [0, 1)
+        return exponent * self.sub_buckets + int(fraction * self.sub_buckets)
+
+    def _bucket_upper_bound(self, index):
+        """Return the largest value that falls into a bucket"""
+        exponent, sub = divmod(index, self.sub_buckets)
+        return self.lowest * (1 << exponent) * (1 + (sub + 1) / self.sub_buckets)
+
+    def record(self, value):
+        """Record a single duration (in seconds)"""
+        index = self._bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p):
+        """Return the value at percentile p (0-100)"""
+        if self.count == 0:
+            return 0.0
+        target = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._bucket_upper_bound(index), self.max)
+        return self.max
+
+    def cumulative_counts(self, bounds):
+        """
+        Return how many values are at or below each of the sorted bounds.
+
+        A bucket is counted under the first bound at or above its upper
+        bound (or the maximum, if smaller), so a value within the bucket
+        error just below a bound may be counted under the next one.
+        """
+        counts = [0] * len(bounds)
+        for index, n in self.counts.items():
+            position = bisect.bisect_left(bounds, min(self._bucket_upper_bound(index), self.max))
+            if position < len(bounds):
+                counts[position] += n
+        return list(accumulate(counts))
+
+    def summary(self):
+        """Return a dictionary with the most useful statistics"""
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min if self.count else 0.0,
+            'max': self.max,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+        }
+
+
+class _NullPhase:
+    """Shared no-op context manager used while metrics are disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class RequestMetrics:
+    """
+    Collects per-phase timings for HTTP calls.
+
+    Every timing is stored under a key of (phase, endpoint, status).
+    When `enabled` is False, `phase()` returns a shared no-op context
+    manager and `observe()` returns immediately, so the instrumented code
+    pays for one attribute check per call.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+
+    def observe(self, phase, seconds, endpoint='', status=''):
+        """Record a duration that was measured elsewhere"""
+        if not self.enabled:
+            return
+        key = (phase, str(endpoint), str(status))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def phase(self, phase, endpoint='', status=''):
+        """Context manager that times the code inside the with block"""
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._timed(phase, endpoint, status)
+
+    @contextmanager
+    def _timed(self, phase, endpoint, status):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start, endpoint, status)
+
+    def observe_response(self, response, total_seconds, endpoint=''):
+        """
+        Split a finished request into "server" and "transfer" phases.
+
+        `response.elapsed` covers sending the request and waiting for the
+        headers; whatever is left of the total is body download.
+        """
+        if not self.enabled:
+            return
+        status = response.status_code
+        server = response.elapsed.total_seconds()
+        self.observe('server', server, endpoint, status)
+        self.observe('transfer', max(total_seconds - server, 0.0), endpoint, status)
+        self.observe('request', total_seconds, endpoint, status)
+
+    def timed_request(self, endpoint, send, *args, **kwargs):
+        """
+        Return send(*args, **kwargs), e.g. requests.get(url), and record it.
+
+        A request that raises (timeout, refused connection) never produces
+        a response, but its time still counts: it is recorded as a
+        "request" phase with the exception class name as the status, e.g.
+        status="ConnectTimeout", and the exception propagates unchanged.
+        """
+        if not self.enabled:
+            return send(*args, **kwargs)
+        response = None
+        status = 'error'
+        start = time.perf_counter()
+        try:
+            response = send(*args, **kwargs)
+            return response
+        except BaseException as e:
+            status = type(e).__name__
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            if response is None:
+                self.observe('request', elapsed, endpoint, status)
+            else:
+                self.observe_response(response, elapsed, endpoint)
+
+    def to_dict(self):
+        """Return all histograms as plain dictionaries"""
+        # Summarise under the lock too: observe() may be updating a histogram
+        with self._lock:
+            return [
+                {'phase': phase, 'endpoint': endpoint, 'status': status,
+                 **histogram.summary()}
+                for (phase, endpoint, status), histogram in sorted(self.histograms.items())
+            ]
+
+    def to_json(self, indent=2):
+        """Export all metrics as a JSON string"""
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, name='http_client_phase_seconds', buckets=PROMETHEUS_BUCKETS):
+        """
+        Export all metrics in the Prometheus text exposition format.
+
+        Each series is a histogram with cumulative _bucket{le=...} counts
+        for the same sorted bounds, so Prometheus can aggregate across
+        endpoints and compute quantiles with histogram_quantile().
+        """
+        lines = [
+            f"# HELP {name} Duration of HTTP client phases in seconds",
+            f"# TYPE {name} histogram",
+        ]
+        with self._lock:
+            series = [(key, histogram.cumulative_counts(buckets), histogram.count, histogram.total)
+                      for key, histogram in sorted(self.histograms.items())]
+        for key, cumulative, count, total in series:
+            labels = ",".join(f'{label}="{_escape_label(value)}"'
+                              for label, value in zip(('phase', 'endpoint', 'status'), key))
+            for bound, seen in zip(buckets, cumulative):
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {seen}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'{name}_sum{{{labels}}} {total:.6f}')
+            lines.append(f'{name}_count{{{labels}}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+# Global instance used by the Day 4 examples. Disabled by default.
+metrics = RequestMetrics()
+
+
+if __name__ == "__main__":
+    print("\n=== Latency Histogram ===")
+    histogram = LatencyHistogram()
+    for ms in [12, 15, 11, 14, 250, 13, 16, 12, 18, 900]:
+        histogram.record(ms / 1000)
+    print("Summary:", histogram.summary())
+
+    print("\n=== Timing Phases ===")
+    metrics.enable()
+    for attempt in range(3):
+        with metrics.phase('rate_limit_wait', endpoint='/posts/{id}'):
+            time.sleep(0.01)
+        metrics.observe('request', 0.120 + attempt * 0.01, '/posts/{id}', 200)
+    with metrics.phase('retry_sleep', endpoint='/status/500'):
+        time.sleep(0.02)
+
+    def refused(url):
+        raise ConnectionError(f"Could not connect to {url}")
+
+    try:
+        metrics.timed_request('/posts/{id}', refused, 'https://example.invalid/posts/1')
+    except ConnectionError as e:
+        print(f"{e} - still recorded with status=\"ConnectionError\"")
+
+    print("\n=== JSON Export ===")
+    print(metrics.to_json())
+
+    print("\n=== Prometheus Export ===")
+    print(metrics.to_prometheus())
+
+    print("\n=== Endpoint Templates ===")
+    for url in ['https://jsonplaceholder.typicode.com/posts/1?fields=title', '/users/42/todos']:
+        print(url, "->", endpoint_template(url))
+
+    print("\n=== Cost When Disabled ===")
+    metrics.disable()
+    start = time.perf_counter()
+    for _ in range(100000):
+        with metrics.phase('request'):
+            pass
+    print(f"100,000 disabled phases took {time.perf_counter() - start:.4f} seconds")
@@ -0,0 +1,28 @@
+"""
+Shared pytest setup for the tutorial modules.
+
+The tutorials are plain scripts, not packages, so their folders are put on
+sys.path here. Tests that list modules in a module-level BACKEND_MODULES
+can use the `backend` fixture to run once with NumPy and once with each
+module's pure Python fallback.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for folder in ("", "Functions", "Day_1_Data_Structures", "Day_4_APIs"):
+    sys.path.insert(0, os.path.join(ROOT, folder))
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run the test with NumPy (skipped if missing) and with np set to None"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        for module in request.module.BACKEND_MODULES:
+            monkeypatch.setattr(module, "np", None)
+    return request.param
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+import bitsets
+from bitsets import (BitmapMatrix, RoaringBitmap, SetEngine, intersect_all, superset_indices,
+                     union_all, xor_all)
+
+BACKEND_MODULES = [bitsets]
+
+
+def _sample(seed, count, limit=300_000):
+    return set(random.Random(seed).sample(range(limit), count))
+
+
+@pytest.mark.parametrize("count", [50, 100_000])  # array and bitmap containers
+def test_set_operations_match_python_sets(count):
+    a, b = _sample(1, count), _sample(2, count)
+    x, y = RoaringBitmap(a), RoaringBitmap(b)
+    assert list(x) == sorted(a) and len(x) == len(a)
+    assert set(x & y) == a & b
+    assert set(x | y) == a | b
+    assert set(x ^ y) == a ^ b
+    assert set(x - y) == a - b
+    assert (x & y) <= x and x >= (x - y) and not x.issubset(y)
+    value = next(iter(a))
+    assert value in x and -1 not in x and 10 ** 9 not in x
+
+
+def test_many_way_operations_and_supersets():
+    sets = [_sample(seed, 2000, 70_000) for seed in range(4)]
+    bitmaps = [RoaringBitmap(s) for s in sets]
+    assert set(intersect_all(bitmaps)) == set.intersection(*sets)
+    assert set(union_all(bitmaps)) == set.union(*sets)
+    assert set(xor_all(bitmaps)) == sets[0] ^ sets[1] ^ sets[2] ^ sets[3]
+    assert len(intersect_all([])) == 0
+    required = RoaringBitmap([3, 70_000])
+    candidates = [RoaringBitmap([3, 70_000, 5]), RoaringBitmap([3]), RoaringBitmap([70_000, 3])]
+    assert superset_indices(required, candidates) == [0, 2]
+
+
+def test_serialisation_round_trip_and_validation():
+    bitmap = RoaringBitmap(_sample(5, 20_000) | {0, 65_535, 65_536, 2 ** 32})
+    copy = RoaringBitmap.from_bytes(bitmap.to_bytes())
+    assert copy == bitmap and list(copy) == list(bitmap)
+    with pytest.raises(ValueError):
+        RoaringBitmap([1, -1])
+
+
+def test_set_engine_round_trip():
+    engine = SetEngine()
+    python, sql = engine.make({"Python", "SQL"}), engine.make({"SQL"})
+    assert engine.decode(python & sql) == {"SQL"}
+    assert engine.decode(python | sql) == {"Python", "SQL"}
+    assert superset_indices(sql, [python, engine.make({"Go"})]) == [0]
+
+
+def test_large_values_round_trip():
+    bitmap = RoaringBitmap([1, 2 ** 48, 2 ** 63 + 5, 2 ** 64 - 1])
+    copy = RoaringBitmap.from_bytes(bitmap.to_bytes())
+    assert list(copy) == [1, 2 ** 48, 2 ** 63 + 5, 2 ** 64 - 1]
+    with pytest.raises(ValueError):
+        RoaringBitmap([2 ** 64])
+
+
+def test_operators_return_not_implemented_for_other_types():
+    bitmap = RoaringBitmap([1, 2])
+    for operation in ("__and__", "__or__", "__xor__", "__sub__", "__le__", "__ge__"):
+        assert getattr(bitmap, operation)({1}) is NotImplemented
+    with pytest.raises(TypeError):
+        bitmap & {1}
+    assert bitmap.issubset([1, 2, 3]) and bitmap.issuperset({2})
+
+
+def test_bitmap_matrix_matches_the_list_path(backend):
+    rng = random.Random(7)
+    candidates = [RoaringBitmap(rng.sample(range(300), rng.randint(0, 60))
+                                + rng.sample(range(200_000, 200_100), 2)) for _ in range(500)]
+    matrix = BitmapMatrix(candidates)
+    assert len(matrix) == 500
+    for required in ([], [3], [5, 17, 250], [200_050], [3, 200_001], [299, 10 ** 6], [1000]):
+        required = RoaringBitmap(required)
+        assert superset_indices(required, matrix) == superset_indices(required, candidates)
+    assert superset_indices(RoaringBitmap([1]), BitmapMatrix([])) == []
+    assert superset_indices(RoaringBitmap(), BitmapMatrix([RoaringBitmap()])) == [0]
@@ -0,0 +1,57 @@
+import pytest
+
+import column_table
+from column_table import CategoryColumn, Query, Table
+
+BACKEND_MODULES = [column_table]
+PEOPLE = [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 17},
+          {"name": "Charlie", "age": 30}, {"name": "David", "age": 15}]
+
+
+def test_queries_match_filter(backend):
+    table = Table.from_dicts(PEOPLE)
+    adults = table.where("age", ">=", 18)
+    assert adults.to_dicts() == [p for p in PEOPLE if p["age"] >= 18]
+    assert adults.select("name").to_dicts() == [{"name": "Alice"}, {"name": "Charlie"}]
+    assert adults.where("name", "!=", "Alice").count() == 1
+    assert table.where("name", "in", ["Bob", "David"]).count() == 2
+    assert table.select("age").to_dicts() == [{"age": p["age"]} for p in PEOPLE]
+
+
+def test_huge_ints_fall_back_to_a_list_column(backend):
+    rows = [{"id": 2 ** 63, "x": 1.5}, {"id": -5, "x": 2 ** 1100}]
+    table = Table.from_dicts(rows)
+    assert isinstance(table.columns["id"], list) and isinstance(table.columns["x"], list)
+    assert table.where("id", ">", 0).to_dicts() == rows[:1]
+
+
+def test_missing_keys_become_none(backend):
+    table = Table.from_dicts([{"a": 1}, {"b": "x"}])
+    assert table.select("a", "b").to_dicts() == [{"a": 1, "b": None}, {"a": None, "b": "x"}]
+
+
+def test_string_columns_are_dictionary_encoded(backend):
+    table = Table.from_dicts(PEOPLE + [{"name": "Bob", "age": 40}])
+    names = table.columns["name"]
+    assert isinstance(names, CategoryColumn)
+    assert names.categories == ["Alice", "Bob", "Charlie", "David"] and len(names) == 5
+    assert list(names.codes) == [0, 1, 2, 3, 1] and names[4] == "Bob"
+    assert table.where("name", "<", "C").select("name").to_columns() == \
+        {"name": ["Alice", "Bob", "Bob"]}
+    assert table.where("name", "==", "Zoe").to_dicts() == []
+
+
+def test_mixed_string_and_numeric_query_stays_vectorized(monkeypatch):
+    pytest.importorskip("numpy")
+
+    def no_scan(self):
+        raise AssertionError("query fell back to the pure Python scan")
+
+    monkeypatch.setattr(Query, "_fused_scan", no_scan)
+    rows = [{"id": i, "city": ["Oslo", "Lima", None][i % 3], "score": i / 10,
+             "tag": [1, "x"][i % 2]} for i in range(30)]
+    table = Table.from_dicts(rows)
+    query = table.where("city", "==", "Oslo").where("score", ">", 1).where("tag", "==", 1)
+    assert [r["id"] for r in query.to_dicts()] == \
+        [r["id"] for r in rows if r["city"] == "Oslo" and r["score"] > 1 and r["tag"] == 1]
+    assert table.where("city", "in", ["Lima", None]).count() == 20
@@ -0,0 +1,35 @@
+import math
+
+import pytest
+
+from combinatorics import factorial, ncr, ncr_batch, npr, npr_batch
+
+
+def test_factorial_matches_math():
+    for n in [0, 1, 20, 21, 300, 5000]:
+        assert factorial(n) == math.factorial(n)
+    with pytest.raises(ValueError):
+        factorial(-1)
+
+
+def test_ncr_and_npr_match_math():
+    for n, r in [(5, 2), (1000, 3), (52, 5), (3, 5), (0, 0)]:
+        assert ncr(n, r) == math.comb(n, r)
+        assert npr(n, r) == math.perm(n, r)
+
+
+@pytest.mark.parametrize("table_limit", [5000, 0])  # table path and ncr()/npr() path
+def test_batches_match_math(table_limit):
+    ns, rs = [5, 10, 20, 52, 3], [2, 3, 10, 5, 7]
+    assert ncr_batch(ns, rs, table_limit) == [math.comb(n, r) for n, r in zip(ns, rs)]
+    assert npr_batch(ns, rs, table_limit) == [math.perm(n, r) for n, r in zip(ns, rs)]
+    assert ncr_batch([], [], table_limit) == []
+
+
+@pytest.mark.parametrize("table_limit", [5000, 0])
+def test_batches_reject_negative_arguments_on_both_paths(table_limit):
+    for batch in (ncr_batch, npr_batch):
+        with pytest.raises(ValueError):
+            batch([5, 10], [2, -1], table_limit)
+        with pytest.raises(ValueError):
+            batch([-5], [2], table_limit)
@@ -0,0 +1,43 @@
+import pytest
+
+from dedup import BloomFilter, ExactDeduper, unique, unique_approx, unique_exact
+
+
+def test_unique_keeps_first_occurrence():
+    assert list(unique(iter("abracadabra"))) == list("abrcd")
+
+
+def test_exact_matches_equality():
+    items = [1, 1.0, True, "1", b"1", (1, 2), (1.0, 2), 2.5]
+    assert list(unique_exact(items)) == list(unique(items)) == [1, "1", b"1", (1, 2), 2.5]
+
+
+def test_exact_dicts_in_any_key_order():
+    events = [{"user": "alice", "page": "/home"}, {"page": "/home", "user": "alice"}]
+    assert list(unique_exact(events)) == events[:1]
+
+
+def test_exact_rejects_unsupported_keys():
+    with pytest.raises(TypeError):
+        list(unique_exact([object()]))
+
+
+def test_exact_spills_to_disk_in_batches_larger_than_sqlite_limit():
+    numbers = [i % 3000 for i in range(12_000)]
+    with ExactDeduper(max_memory_keys=1000) as deduper:
+        result = list(deduper.filter(numbers, batch_size=2500))
+        assert deduper.spilled > 0
+    assert result == list(range(3000))
+
+
+def test_exact_key_function():
+    events = [{"user": "alice"}, {"user": "bob"}, {"user": "alice"}]
+    assert list(unique_exact(events, key=lambda e: e["user"])) == events[:2]
+
+
+def test_bloom_filter_never_yields_duplicates():
+    items = [i % 500 for i in range(5000)]
+    kept = list(unique_approx(items, capacity=500, error_rate=0.01))
+    assert len(kept) == len(set(kept)) and len(kept) > 480
+    bloom = BloomFilter(100)
+    assert bloom.add("x") and not bloom.add("x") and "x" in bloom
@@ -0,0 +1,58 @@
+import pytest
+
+import dispatch
+from dispatch import (CALCULATOR, ArithmeticOperationError, DispatchTable, DivisionByZeroError,
+                      InvalidOperandError, UnknownOperationError, calculator, make_switch)
+
+BACKEND_MODULES = [dispatch]
+
+
+def test_calculator():
+    assert calculator("add", 5, 3) == 8 and calculator("divide", 6, 3) == 2
+    with pytest.raises(DivisionByZeroError):
+        calculator("divide", 1, 0)
+    with pytest.raises(UnknownOperationError):
+        calculator("power", 2, 3)
+    with pytest.raises(InvalidOperandError):
+        calculator("add", 1, "2")
+
+
+def test_make_switch():
+    switch = make_switch({0: "Zero", 1: "One"}, default="Invalid")
+    assert switch(1) == "One" and switch(4) == "Invalid"
+
+
+def test_evaluate_many_collects_errors_by_position():
+    table = DispatchTable({"add": lambda a, b: a + b, "int": lambda a, b: int(a, b)})
+    result = table.evaluate_many([("add", 1, 2), ("add", 1, "x"), ("int", "z", 10), ("pow", 1, 1)])
+    assert result.values == [3, None, None, None]
+    assert {i: type(e) for i, e in result.errors.items()} == {
+        1: InvalidOperandError, 2: InvalidOperandError, 3: UnknownOperationError}
+
+
+def test_evaluate_columns_same_output_on_both_backends(backend):
+    ops = ["add", "subtract", "multiply", "divide", "modulo", "divide"]
+    result = CALCULATOR.evaluate_columns(ops, [1, 5, 3, 8, 5, 1], [2, 2, 2, 2, 2, 0])
+    assert type(result.values) is list
+    assert result.values == [3.0, 3.0, 6.0, 4.0, None, None]
+    assert all(type(v) is float for v in result.values if v is not None)
+    assert {i: type(e) for i, e in result.errors.items()} == {
+        4: UnknownOperationError, 5: DivisionByZeroError}
+
+
+def test_arithmetic_errors_from_user_operations_are_collected():
+    table = DispatchTable({"div": lambda a, b: a // b, "exp": lambda a, b: a ** b})
+    result = table.evaluate_many([("div", 4, 2), ("div", 1, 0), ("exp", 10.0, 400)])
+    assert result.values == [2, None, None]
+    assert {i: type(e) for i, e in result.errors.items()} == {
+        1: DivisionByZeroError, 2: ArithmeticOperationError}
+    with pytest.raises(ArithmeticOperationError):
+        table.evaluate("exp", 10.0, 400)
+
+
+def test_bad_operand_fails_only_its_row(backend):
+    ops = ["add", "multiply", "divide", "power", "subtract"]
+    result = CALCULATOR.evaluate_columns(ops, [1, "x", 8, 2, None], [2, 3, "4", 2, 1])
+    assert result.values == [3.0, None, 2.0, None, None]
+    assert {i: type(e) for i, e in result.errors.items()} == {
+        1: InvalidOperandError, 3: UnknownOperationError, 4: InvalidOperandError}
@@ -0,0 +1,23 @@
+from itertools import islice
+
+import pytest
+
+from fibonacci_engine import (fibonacci_cached, fibonacci_fast, fibonacci_iterative,
+                              fibonacci_pair, fibonacci_sequence)
+
+
+def test_fast_doubling_matches_the_loop():
+    for n in list(range(50)) + [1000, 4097]:
+        assert fibonacci_fast(n) == fibonacci_iterative(n)
+    assert fibonacci_pair(10) == (55, 89)
+    with pytest.raises(ValueError):
+        fibonacci_fast(-1)
+
+
+def test_sequence_and_cache():
+    assert list(fibonacci_sequence(8)) == [0, 1, 1, 2, 3, 5, 8, 13]
+    assert list(islice(fibonacci_sequence(start=100), 3)) == \
+        [fibonacci_iterative(n) for n in (100, 101, 102)]
+    fibonacci_cached.cache_clear()
+    assert fibonacci_cached(300) == fibonacci_cached(300) == fibonacci_iterative(300)
+    assert fibonacci_cached.cache_info().hits == 1
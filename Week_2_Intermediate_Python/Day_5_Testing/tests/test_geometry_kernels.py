@@ -0,0 +1,24 @@
+import math
+
+import pytest
+
+import geometry_kernels
+from geometry_kernels import calculate_circle, circle_metrics, rectangle_metrics
+
+BACKEND_MODULES = [geometry_kernels]
+
+
+def test_circle_metrics_match_calculate_circle(backend):
+    radii = [1, 2.5, 5]
+    result = circle_metrics(radii)
+    expected = [calculate_circle(r) for r in radii]
+    assert list(result['area']) == pytest.approx([area for area, _ in expected])
+    assert list(result['circumference']) == pytest.approx([c for _, c in expected])
+    assert calculate_circle(1) == (math.pi, 2 * math.pi)
+
+
+def test_rectangle_metrics(backend):
+    result = rectangle_metrics([5, 10, 2], [3, 4, 8])
+    assert list(result['area']) == [15, 40, 16]
+    assert list(result['perimeter']) == [16, 28, 20]
+    assert len(rectangle_metrics([], [])['area']) == 0
@@ -0,0 +1,45 @@
+import pytest
+
+from indexed_records import IndexedCollection
+
+PEOPLE = [{"name": "Ann", "city": "Paris", "age": 31}, {"name": "Bob", "city": "Rome", "age": 25},
+          {"name": "Cid", "city": "Paris", "age": 42}, {"name": "Dee", "city": "Oslo", "age": 25}]
+
+
+@pytest.fixture
+def people():
+    return IndexedCollection(PEOPLE, hash_fields=["city"], sorted_fields=["age"])
+
+
+def test_find_matches_filter(people):
+    assert people.find(city="Paris") == [p for p in PEOPLE if p["city"] == "Paris"]
+    assert people.find(city="Nowhere") == []
+    with pytest.raises(KeyError):
+        people.find(name="Ann")
+
+
+def test_range_is_inclusive(people):
+    assert [p["name"] for p in people.range("age", 25, 31)] == ["Bob", "Dee", "Ann"]
+    assert people.count_range("age", low=30) == 2
+
+
+def test_top_n(people):
+    assert [p["name"] for p in people.top_n("age", 2)] == ["Cid", "Ann"]
+    assert [p["name"] for p in people.top_n("age", 1, largest=False)] == ["Bob"]
+    assert len(people.top_n("age", 10)) == 4
+
+
+@pytest.mark.parametrize("n", [0, -1])
+def test_top_n_with_no_items_requested(people, n):
+    assert people.top_n("age", n) == []
+    assert people.top_n("age", n, largest=False) == []
+
+
+def test_indexes_follow_updates(people):
+    new_id = people.insert({"name": "Eve", "city": "Rome", "age": 50})
+    assert people.top_n("age", 1)[0]["name"] == "Eve"
+    people.update(new_id, city="Oslo", age=20)
+    assert {p["name"] for p in people.find(city="Oslo")} == {"Dee", "Eve"}
+    assert people.top_n("age", 1, largest=False)[0]["name"] == "Eve"
+    people.delete(new_id)
+    assert len(people) == 4 and people.count_range("age") == 4
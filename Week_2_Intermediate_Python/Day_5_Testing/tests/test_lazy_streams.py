@@ -0,0 +1,48 @@
+import lazy_streams
+from lazy_streams import Stream, is_even, square, to_fahrenheit
+
+BACKEND_MODULES = [lazy_streams]
+
+
+def test_stream_matches_eager_pipeline(backend):
+    numbers = range(10_000)
+    stream = Stream(numbers, chunk_size=1000).filter(is_even).map(square)
+    assert stream.to_list() == [x * x for x in numbers if x % 2 == 0]
+    assert stream.sum() == sum(x * x for x in numbers if x % 2 == 0)
+    assert stream.count() == 5000
+
+
+def test_vectorized_stages_give_the_same_answer(backend):
+    stream = (Stream.range(1, 100_001, chunk_size=4096)
+              .filter(lambda x: x % 3 == 0, vectorized=True)
+              .map(lambda x: x * 2, vectorized=True))
+    expected = [x * 2 for x in range(1, 100_001) if x % 3 == 0]
+    assert stream.to_list() == expected and stream.sum() == sum(expected)
+    assert all(type(x) is int for x in stream.take(3))
+
+
+def test_take_and_batch_are_lazy(backend):
+    def endless():
+        n = 0
+        while True:
+            yield n
+            n += 1
+
+    first = Stream(endless(), chunk_size=100).map(to_fahrenheit).take(5).to_list()
+    assert first == [32.0, 33.8, 35.6, 37.4, 39.2]
+    batches = list(Stream(range(7), chunk_size=3).batch(3))
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert Stream(range(50), chunk_size=8).take(10).map(square).count() == 10
+
+
+def test_parallel_stream_keeps_order():
+    stream = Stream(range(20_000), chunk_size=1000).filter(is_even).map(square).parallel(2)
+    assert stream.to_list() == [x * x for x in range(20_000) if x % 2 == 0]
+
+
+def test_sums_past_int64_do_not_wrap(backend):
+    assert Stream.range(2 ** 62, 2 ** 62 + 4).sum() == sum(range(2 ** 62, 2 ** 62 + 4))
+    assert Stream.range(2 ** 63 - 2, 2 ** 63 + 2).to_list() == list(range(2 ** 63 - 2, 2 ** 63 + 2))
+    low, high = 30_000_000 - 65_536, 30_000_000
+    squares = Stream.range(low, high).map(lambda x: x * x, vectorized=True)
+    assert squares.sum() == sum(x * x for x in range(low, high))
@@ -0,0 +1,52 @@
+import pytest
+
+import matrices
+from matrices import CSRMatrix, Matrix, add_lists, matmul_lists, transpose_lists
+
+BACKEND_MODULES = [matrices]
+A = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+B = [[7.0, 8.0], [9.0, 10.0], [11.0, 12.0]]
+
+
+def test_from_lists_round_trip():
+    matrix = Matrix.from_lists(A)
+    assert matrix.shape == (2, 3) and matrix[1, 2] == 6.0
+    assert matrix.to_lists() == A
+    assert matrix.column(1).tolist() == [2.0, 5.0]
+    with pytest.raises(ValueError):
+        Matrix.from_lists([[1.0], [2.0, 3.0]])
+
+
+def test_operations_match_lists(backend):
+    a, b = Matrix.from_lists(A), Matrix.from_lists(B)
+    assert a.T.to_lists() == transpose_lists(A)
+    assert (a @ b).to_lists() == matmul_lists(A, B)
+    assert (a + a).to_lists() == add_lists(A, A)
+    assert (a * 2).to_lists() == (2 * a).to_lists() == add_lists(A, A)
+    assert (Matrix.identity(3) @ b) == b
+    with pytest.raises(ValueError):
+        a @ a
+
+
+def test_results_are_typed_arrays(backend):
+    a = Matrix.from_lists(A)
+    for result in (a.T, a + a, a @ a.T):
+        assert result.data.typecode == "d"
+
+
+def test_blocked_matmul_matches_lists(backend):
+    nested = [[float((i * 7 + j * 3) % 11) for j in range(70)] for i in range(70)]
+    matrix = Matrix.from_lists(nested)
+    assert matrix.matmul(matrix, block_size=16).to_lists() == matmul_lists(nested, nested)
+
+
+def test_sparse_matrix():
+    dense = [[0.0, 2.0, 0.0], [1.0, 0.0, 3.0]]
+    sparse = CSRMatrix.from_lists(dense)
+    assert sparse.nnz == 3 and sparse.to_dense().to_lists() == dense
+    assert sparse.transpose().to_dense().to_lists() == transpose_lists(dense)
+    assert sparse.matvec([1.0, 2.0, 3.0]).tolist() == [4.0, 10.0]
+    assert (sparse @ Matrix.from_lists(B)).to_lists() == matmul_lists(dense, B)
+    assert (Matrix.from_lists(A) @ sparse.transpose()).to_lists() == \
+        matmul_lists(A, transpose_lists(dense))
+    assert (sparse * 2).to_dense().to_lists() == add_lists(dense, dense)
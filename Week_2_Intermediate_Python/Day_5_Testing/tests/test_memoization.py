@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from memoization import LFUCache, LRUCache, TTLCache, memoize
+
+
+def test_lru_and_lfu_eviction_order():
+    lru = LRUCache(maxsize=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+    assert lru.keys() == ["a", "c"] and lru.stats.evictions == 1
+
+    lfu = LFUCache(maxsize=2)
+    lfu.set("a", 1)
+    lfu.set("b", 2)
+    lfu.get("a")
+    lfu.set("c", 3)  # "b" was used least
+    assert set(lfu.keys()) == {"a", "c"}
+    lfu.set("d", 4)  # "c" and "d" were both used once; "c" is older
+    assert set(lfu.keys()) == {"a", "d"}
+
+
+def test_ttl_expiry_and_byte_budget():
+    now = [0.0]
+    cache = TTLCache(ttl=10, clock=lambda: now[0])
+    cache.set("rate", 1.1)
+    now[0] = 9.9
+    assert cache.get("rate") == 1.1
+    now[0] = 10.0
+    assert cache.get("rate", None) is None and cache.stats.expirations == 1
+
+    sized = LRUCache(maxsize=None, max_bytes=10, sizeof=len)
+    sized.set("x", "abcdef")
+    sized.set("y", "ghijk")
+    assert sized.keys() == ["y"] and sized.bytes == 5
+
+
+def test_memoize_normalises_arguments():
+    calls = []
+
+    @memoize(maxsize=None)
+    def area(width, height=1, **options):
+        calls.append((width, height))
+        return width * height
+
+    assert area(2, 3) == area(2, height=3) == area(width=2, height=3) == 6
+    assert area(2) == area(2, 1) == 2
+    assert area(2, 3, unit="m") == area(2, 3, unit="m")
+    assert calls == [(2, 3), (2, 1), (2, 3)]
+    assert area.cache.stats.hits == 4 and area.cache.stats.misses == 3
+    area.cache_clear()
+    assert len(area.cache) == 0
+    with pytest.raises(ValueError):
+        memoize(policy='ttl')(lambda: None)
+
+
+def test_single_flight_computes_once_across_threads():
+    calls = []
+
+    @memoize()
+    def slow(x):
+        calls.append(x)
+        time.sleep(0.05)
+        return x * 2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow(21))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [42] * 8 and calls == [21]
+
+
+def test_async_functions_share_one_computation():
+    calls = []
+
+    @memoize(policy='lfu')
+    async def fetch(user_id):
+        calls.append(user_id)
+        await asyncio.sleep(0.01)
+        return {"id": user_id}
+
+    async def main():
+        return await asyncio.gather(*(fetch(7) for _ in range(5)))
+
+    assert asyncio.run(main()) == [{"id": 7}] * 5 and calls == [7]
+
+
+def test_cancelled_leader_hands_over_to_a_waiter():
+    calls = []
+
+    @memoize()
+    async def fetch(user_id):
+        calls.append(user_id)
+        await asyncio.sleep(0.05)
+        return {"id": user_id}
+
+    async def main():
+        leader = asyncio.create_task(fetch(7))
+        await asyncio.sleep(0.01)  # the leader is now computing
+        waiters = [asyncio.create_task(fetch(7)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+        assert leader.cancelled()
+        return results
+
+    assert asyncio.run(main()) == [{"id": 7}] * 3
+    assert calls == [7, 7]  # the cancelled call and one retry by a waiter
+    assert fetch.cache.stats.misses == 2 and fetch.cache.stats.hits == 2
+
+
+def test_recursion_with_the_same_key_raises_instead_of_deadlocking():
+    @memoize()
+    def loop_forever(n):
+        return loop_forever(n)
+
+    @memoize()
+    async def await_forever(n):
+        return await await_forever(n)
+
+    with pytest.raises(RuntimeError):
+        loop_forever(1)
+    with pytest.raises(RuntimeError):
+        asyncio.run(await_forever(1))
+    assert not loop_forever.cache and not await_forever.cache
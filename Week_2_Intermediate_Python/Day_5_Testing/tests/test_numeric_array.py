@@ -0,0 +1,99 @@
+import pytest
+
+import numeric_array
+from numeric_array import NumericList, NumericView
+
+BACKEND_MODULES = [numeric_array]
+
+
+def test_list_methods():
+    numbers = NumericList([1, 2, 3])
+    numbers.append(4)
+    numbers.insert(0, 0)
+    numbers.extend([5, 6])
+    assert numbers.pop() == 6
+    numbers.remove(3)
+    assert numbers.tolist() == [0, 1, 2, 4, 5] and numbers.typecode == "q"
+    assert NumericList([1, 2.5]).typecode == "d"
+
+
+@pytest.mark.parametrize("index", [slice(None, 3), slice(-3, None), slice(None, None, 2),
+                                   slice(None, None, -1), slice(8, 2, -2), slice(-20, -30, -1),
+                                   slice(5, 5), slice(30, 40), slice(-1, -30, -3)])
+def test_slices_match_lists(index):
+    values = list(range(10))
+    view = NumericList(values)[index]
+    assert isinstance(view, NumericView)
+    assert len(view) == len(values[index])
+    assert view.tolist() == list(view) == view.copy().tolist() == values[index]
+    assert view.memoryview().tolist() == values[index]
+    assert view[::-1].tolist() == values[index][::-1]
+
+
+def test_views_write_through():
+    numbers = NumericList(range(10))
+    evens = numbers[::2]
+    evens[0] = 100
+    evens[1:3] = [20, 40]
+    numbers[::-1][:2] = NumericList([9, 8])
+    assert numbers.tolist() == [100, 1, 20, 3, 40, 5, 6, 7, 8, 9]
+    with pytest.raises(ValueError):
+        evens[:2] = [1, 2, 3]
+
+
+def test_arithmetic(backend):
+    numbers = NumericList([1, 2, 3])
+    assert (numbers + NumericList([4, 5, 6])).tolist() == [5, 7, 9]
+    assert (numbers * 2).tolist() == [2, 4, 6] and (2 * numbers).tolist() == [2, 4, 6]
+    assert (10 - numbers).tolist() == [9, 8, 7] and (numbers - 10).tolist() == [-9, -8, -7]
+    assert (6 / numbers).tolist() == [6.0, 3.0, 2.0] and (numbers / 2).typecode == "d"
+    assert (numbers ** 2).tolist() == [1, 4, 9] and (numbers[::-1] - numbers).tolist() == [2, 0, -2]
+    assert numbers.sum() == 6
+    with pytest.raises(ValueError):
+        numbers + NumericList([1])
+
+
+def test_integer_overflow_raises_on_both_backends(backend):
+    big = NumericList([2 ** 62, 1])
+    with pytest.raises(OverflowError):
+        big * 4
+    with pytest.raises(OverflowError):
+        big + 2 ** 62
+    assert (big + 1).tolist() == [2 ** 62 + 1, 2]
+    assert NumericList([2 ** 62] * 4).sum() == 2 ** 64
+
+
+def test_memoryview_pins_the_buffer():
+    numbers = NumericList([1, 2, 3])
+    buffer = numbers.memoryview()
+    with pytest.raises(BufferError):
+        numbers.append(4)
+    buffer.release()
+    numbers.append(4)
+    assert numbers == [1, 2, 3, 4]
+
+
+def test_views_go_stale_when_the_parent_moves_elements():
+    numbers = NumericList(range(10))
+    tail = numbers[5:]
+    numbers.append(10)  # positions 5-9 still hold the same values
+    assert tail.tolist() == [5, 6, 7, 8, 9]
+    inner = tail[1:3]
+    numbers.insert(0, -1)
+    for stale in (tail, inner):
+        with pytest.raises(RuntimeError):
+            stale.tolist()
+        with pytest.raises(RuntimeError):
+            stale[0] = 1
+    assert numbers[6:].tolist() == [5, 6, 7, 8, 9, 10]
+
+
+def test_division_by_zero_raises_on_both_backends(backend):
+    numbers = NumericList([1, 0, 2])
+    with pytest.raises(ZeroDivisionError):
+        numbers / 0
+    with pytest.raises(ZeroDivisionError):
+        1 / numbers
+    with pytest.raises(ZeroDivisionError):
+        NumericList([1.0, 2.0]) / numbers[:2]
+    assert (numbers[::2] / NumericList([2, 4])).tolist() == [0.5, 0.5]
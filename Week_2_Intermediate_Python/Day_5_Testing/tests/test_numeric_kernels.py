@@ -0,0 +1,27 @@
+import pytest
+
+from numeric_kernels import (LEAF_DIGITS, mod_power, power, power_batch, sum_of_digits,
+                             sum_of_digits_batch, sum_of_digits_linear)
+
+
+def test_power_and_mod_power_match_builtin_pow():
+    for base, exponent in [(2, 0), (3, 1), (7, 13), (-2, 5), (10, 100)]:
+        assert power(base, exponent) == base ** exponent
+        assert mod_power(base, exponent, 1_000_007) == pow(base, exponent, 1_000_007)
+    assert mod_power(5, 3, 1) == 0
+    with pytest.raises(ValueError):
+        power(2, -1)
+    assert power_batch([2, 3], [10, 4]) == [1024, 81]
+    assert power_batch([2, 3], [10, 4], modulus=7) == [1024 % 7, 81 % 7]
+
+
+def test_sum_of_digits_across_chunk_boundaries():
+    # Numbers longer than LEAF_DIGITS are split into chunks; str() refuses very
+    # long ints, so the digit-by-digit loop is the reference
+    numbers = [0, 9, -12345, 10 ** LEAF_DIGITS, 10 ** (3 * LEAF_DIGITS) + 7,
+               int("9" * (2 * LEAF_DIGITS + 17)), 3 ** 20_000]
+    expected = [sum_of_digits_linear(abs(n)) for n in numbers]
+    assert [sum_of_digits(n) for n in numbers] == expected
+    assert sum_of_digits_batch(numbers) == expected
+    assert sum_of_digits_batch([]) == []
+    assert sum_of_digits_linear(12345) == 15
@@ -0,0 +1,81 @@
+import math
+
+import pytest
+
+import packed_tuples
+from packed_tuples import InternedTuples, PackedTuples, rgb_to_gray, rgb_to_hex
+
+BACKEND_MODULES = [packed_tuples]
+
+
+def test_packed_tuples_behave_like_a_list_of_tuples():
+    points = PackedTuples("xy", "d", [(10, 20), (3, 4), (-1, 7)])
+    assert len(points) == 3 and points[1] == (3.0, 4.0) and points[-1] == (-1.0, 7.0)
+    assert list(points) == [(10, 20), (3, 4), (-1, 7)]
+    assert list(points[::2]) == [(10, 20), (-1, 7)]
+    assert points.named(0).y == 20
+    assert points.column("x").tolist() == [10, 3, -1]
+
+
+def test_distances(backend):
+    points = PackedTuples("xy", "d", [(3, 4), (6, 8)])
+    assert list(points.distances_to((0, 0))) == pytest.approx([5, 10])
+    with pytest.raises(ValueError):
+        points.distances_to((0, 0, 0))
+
+
+def test_failed_append_leaves_packed_tuples_unchanged():
+    colours = PackedTuples("rgb", "B", [(1, 2, 3)])
+    with pytest.raises(OverflowError):
+        colours.append((0, 300, 0))
+    with pytest.raises(ValueError):
+        colours.extend([(1, 2)])
+    assert list(colours) == [(1, 2, 3)]
+
+
+def test_failed_append_leaves_interned_tuples_unchanged():
+    image = InternedTuples("rgb", "B")
+    with pytest.raises(OverflowError):
+        image.append((300, 0, 0))
+    assert len(image) == 0 and len(image.palette) == 0 and not image._lookup
+    image.append((255, 0, 0))
+    assert list(image) == [(255, 0, 0)] and image.codes.tolist() == [0]
+
+
+def test_interned_codes_widen_past_256_values():
+    image = InternedTuples("ab", "H", [(i, i) for i in range(300)] * 2)
+    assert image.codes.typecode == "H"
+    assert image[299] == (299, 299) and image[599] == (299, 299)
+    assert len(image.palette) == 300
+
+
+def test_palette_functions(backend):
+    orange, white = (255, 128, 0), (255, 255, 255)
+    image = InternedTuples("rgb", "B", [orange, white, orange])
+    assert list(image.values_by_code(rgb_to_hex)) == ["#ff8000", "#ffffff", "#ff8000"]
+    assert list(image.values_by_code(rgb_to_gray)) == pytest.approx([rgb_to_gray(orange),
+                                                                     255, rgb_to_gray(orange)])
+    halves = image.map_palette(lambda c: tuple(v // 2 for v in c), "rgb", "B")
+    assert halves[1] == (127, 127, 127) and halves.codes == image.codes
+    assert math.isclose(sum(map(sum, halves)), sum(v // 2 for c in image for v in c))
+
+
+def test_assignment_out_of_range_raises():
+    points = PackedTuples("xy", "d", [(1, 2), (3, 4)])
+    points[-1] = (5, 6)
+    for index in (2, 5, -3, -9):
+        with pytest.raises(IndexError):
+            points[index] = (9, 9)
+    assert list(points) == [(1, 2), (5, 6)]
+
+
+def test_map_palette_merges_colliding_results(backend):
+    colours = [(255, 0, 0), (0, 255, 0), (255, 0, 0), (0, 0, 255), (0, 255, 0)]
+    image = InternedTuples("rgb", "B", colours)
+    # red and blue collapse to the same tuple
+    mapped = image.map_palette(lambda c: (c[1], c[0] + c[2]), "ab", "H")
+    assert list(mapped) == [(0, 255), (255, 0), (0, 255), (0, 255), (255, 0)]
+    assert len(mapped.palette) == 2 and mapped._lookup == {(0, 255): 0, (255, 0): 1}
+    assert mapped.codes.tolist() == [0, 1, 0, 0, 1]
+    mapped.append((255, 0))
+    assert len(mapped.palette) == 2 and mapped.codes[-1] == 1
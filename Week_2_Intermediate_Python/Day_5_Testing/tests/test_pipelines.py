@@ -0,0 +1,49 @@
+from itertools import count, islice
+
+import pipelines
+from pipelines import Pipeline, add_one, compose, double, square
+
+BACKEND_MODULES = [pipelines]
+
+
+def test_pipeline_matches_compose():
+    pipeline = Pipeline(square, double, add_one)
+    assert pipeline.source == "lambda x: (((x + 1) * 2) ** 2)"
+    assert [pipeline(x) for x in range(-5, 5)] == [compose(square, double, add_one)(x)
+                                                   for x in range(-5, 5)]
+
+
+def test_only_this_modules_functions_are_inlined():
+    def double(x):  # same name, different behaviour
+        return x * 3
+    pipeline = Pipeline(double, add_one)
+    assert pipeline.source == "lambda x: _f1((x + 1))"
+    assert pipeline(1) == 6
+
+
+def test_mixed_stages_are_called():
+    assert Pipeline(str, square, add_one)(4) == "25"
+
+
+def test_apply_chunk(backend):
+    pipeline = Pipeline(square, double, add_one)
+    assert pipeline.apply_chunk([1, 2, 3]) == [16, 36, 64]
+    assert pipeline.apply_chunk([1.5]) == [25.0]
+    assert pipeline.apply_chunk([]) == []
+
+
+def test_apply_chunk_does_not_overflow(backend):
+    pipeline = Pipeline(square, double, add_one)
+    big = 2 ** 40
+    assert pipeline.apply_chunk([big, 1]) == [(2 * (big + 1)) ** 2, 16]
+
+
+def test_map_batch(backend):
+    pipeline = Pipeline(double)
+    assert list(pipeline.map_batch(range(10), chunk_size=3)) == [2 * x for x in range(10)]
+
+
+def test_map_batch_with_workers_reads_input_lazily():
+    pipeline = Pipeline(square)
+    results = pipeline.map_batch(count(), chunk_size=5, workers=2)  # endless input
+    assert list(islice(results, 12)) == [x * x for x in range(12)]
@@ -0,0 +1,80 @@
+import csv
+from decimal import Decimal
+
+import pytest
+
+import pricing
+from pricing import (calculate_total_cost, stream_totals_from_csv, to_cents, to_rate_ppm,
+                     total_cost_batch, total_cost_cents, total_cost_decimal)
+
+BACKEND_MODULES = [pricing]
+
+
+def test_batch_matches_single_item(backend):
+    prices = [50, 19.99, 100]
+    expected = [calculate_total_cost(p, 0.15, 7.5) for p in prices]
+    assert list(total_cost_batch(prices, 0.15, 7.5)) == pytest.approx(expected)
+
+
+def test_fractional_basis_point_rates_are_exact(backend):
+    assert to_rate_ppm("0.08875") == 88_750
+    assert list(total_cost_cents([100_000], to_rate_ppm(0.08875), 0)) == [108_875]
+
+
+def test_unrepresentable_rate_is_rejected():
+    with pytest.raises(ValueError):
+        to_rate_ppm(1 / 3)
+
+
+def test_cents_match_decimal(backend):
+    prices = ["0.99", "19.99", "1234.56"]
+    cents = [to_cents(p) for p in prices]
+    decimal_totals = total_cost_decimal([Decimal(p) for p in prices], Decimal("0.0825"),
+                                        Decimal("4.99"))
+    totals = total_cost_cents(cents, to_rate_ppm("0.0825"), to_cents("4.99"))
+    assert [Decimal(int(t)) / 100 for t in totals] == decimal_totals
+
+
+def _write_catalogue(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["sku", "price", "tax_rate", "shipping"])
+        writer.writerows(rows)
+
+
+def test_stream_totals_from_csv(tmp_path):
+    path = tmp_path / "catalogue.csv"
+    _write_catalogue(path, [[f"SKU{i}", "10.00", "0.1", ""] for i in range(5)])
+    chunks = list(stream_totals_from_csv(path, chunk_size=2))
+    assert [len(rows) for rows, _ in chunks] == [2, 2, 1]
+    assert all(int(total) == 1600 for _, totals in chunks for total in totals)
+
+
+def test_missing_tax_rate_is_an_error(tmp_path):
+    path = tmp_path / "catalogue.csv"
+    _write_catalogue(path, [["SKU1", "10.00", "0.1", "5"], ["SKU2", "10.00", "", "5"]])
+    with pytest.raises(ValueError, match="Row 2"):
+        list(stream_totals_from_csv(path))
+
+
+def test_both_backends_return_typed_arrays(backend):
+    totals = total_cost_batch([10.0, 20.0], [0.1, 0.2], 0)
+    assert totals.typecode == 'd' and list(totals) == pytest.approx([11.0, 24.0])
+    cents = total_cost_cents([1000, 2000], 100_000, [0, 50])
+    assert cents.typecode == 'q' and list(cents) == [1100, 2250]
+
+
+def test_products_beyond_int64_stay_exact(backend):
+    price = 10 ** 13  # $100 billion: price * rate_ppm leaves int64
+    totals = total_cost_cents([price, 1], to_rate_ppm("0.08875"), 0)
+    assert list(totals) == [price + price * 88_750 // 1_000_000, 1]
+    with pytest.raises(OverflowError):
+        total_cost_cents([2 ** 62], 1_000_000, 0)
+
+
+@pytest.mark.parametrize("amount", ["", "  ", "abc", "NaN", "inf"])
+def test_malformed_amounts_raise_value_error(amount):
+    with pytest.raises(ValueError):
+        to_cents(amount)
+    with pytest.raises(ValueError):
+        to_rate_ppm(amount)
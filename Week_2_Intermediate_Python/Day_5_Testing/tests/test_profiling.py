@@ -0,0 +1,49 @@
+import json
+import threading
+
+from profiling import Profiler
+
+
+def test_stats_merge_all_threads():
+    profiler = Profiler()
+
+    @profiler.profile
+    def add(a, b):
+        return a + b
+
+    def work():
+        for i in range(1000):
+            add(i, 1)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    (name, stats), = profiler.stats().items()
+    assert name.endswith("add") and stats['count'] == 4000
+    assert stats['min_ns'] <= stats['p50_ns'] <= stats['p99_ns'] <= stats['max_ns']
+    assert json.loads(profiler.to_json())[name]['count'] == 4000
+    assert "calls" in profiler.report() and name in profiler.report()
+
+
+def test_disabled_profiler_records_nothing_and_exceptions_are_timed():
+    profiler = Profiler(enabled=False)
+
+    @profiler.profile
+    def fail():
+        raise KeyError("missing")
+
+    @profiler.profile
+    def double(x):
+        return 2 * x
+
+    assert double(4) == 8 and profiler.stats() == {}
+    profiler.enabled = True
+    try:
+        fail()
+    except KeyError:
+        pass
+    assert [s['count'] for s in profiler.stats().values()] == [1]
+    profiler.reset()
+    assert profiler.stats() == {}
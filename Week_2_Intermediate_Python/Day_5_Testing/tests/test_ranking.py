@@ -0,0 +1,62 @@
+import heapq
+import random
+
+import pytest
+
+import ranking
+from ranking import (SortedView, argsort_values, parallel_sort_items, sort_by_value,
+                     sort_by_value_argsort, top_n)
+
+BACKEND_MODULES = [ranking]
+
+TIED = {"a": 2, "b": 1, "c": 2, "d": 3, "e": 1, "f": 2}
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_argsort_matches_sorted_including_ties(backend, reverse):
+    assert list(sort_by_value_argsort(TIED, reverse).items()) == \
+        list(sort_by_value(TIED, reverse).items())
+    rng = random.Random(3)
+    values = [rng.randrange(5) for _ in range(200)]
+    assert argsort_values(values, reverse) == \
+        sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+
+
+def test_argsort_reverse_handles_unsigned_and_strings(backend):
+    assert argsort_values(["b", "a", "b"], reverse=True) == [0, 2, 1]
+    assert argsort_values([0, 2 ** 63, 0], reverse=True) == [1, 0, 2]
+
+
+@pytest.mark.parametrize("largest", [True, False])
+def test_top_n_ties_keep_first_seen_order(largest):
+    expected = sorted(TIED.items(), key=lambda item: item[1], reverse=largest)
+    for n in range(len(TIED) + 2):
+        assert top_n(TIED, n, largest) == expected[:n]
+    pick = heapq.nlargest if largest else heapq.nsmallest
+    assert top_n(TIED, 3, largest) == pick(3, TIED.items(), key=lambda item: item[1])
+
+
+def test_top_n_never_compares_keys():
+    scores = {("x", 1): 5, 7: 5, None: 5}
+    assert top_n(scores, 2) == [(("x", 1), 5), (7, 5)]
+
+
+def test_sorted_view_tracks_updates():
+    scores = {"alice": 91, "bob": 78, "carol": 85, "dave": 97, "erin": 62}
+    view = SortedView(scores, chunk_size=2)
+    view["erin"] = 99
+    view["frank"] = 80
+    del view["dave"]
+    assert view.top(3) == [("erin", 99), ("alice", 91), ("carol", 85)]
+    assert view.bottom(2) == [("bob", 78), ("frank", 80)]
+    assert view.rank("erin") == 0 and view.rank("bob") == 4
+    assert list(view) == ["bob", "frank", "carol", "alice", "erin"]
+
+
+def test_parallel_sort_matches_sorted_with_ties():
+    rng = random.Random(5)
+    floats = {f"k{i}": rng.choice([0.5, 0.25, 1.0]) for i in range(2000)}
+    ints = {f"k{i}": rng.randrange(10) for i in range(2000)}
+    for scores in (floats, ints, TIED):
+        expected = sorted(scores.items(), key=lambda item: item[1])
+        assert list(parallel_sort_items(scores, workers=2, chunks=3)) == expected
@@ -0,0 +1,49 @@
+import pytest
+
+from records import ColumnStore, make_record_type
+
+STUDENT_SPEC = {"name": str, "grades": {"math": int, "science": int}}
+
+
+def test_record_type_round_trip():
+    Student = make_record_type("Student", STUDENT_SPEC)
+    data = {"name": "Alice", "grades": {"math": 95, "science": 98}}
+    alice = Student.from_dict(data)
+    assert alice["grades"]["math"] == 95 and alice.get("email", "none") == "none"
+    assert alice.to_dict() == data and alice == data
+    with pytest.raises(AttributeError):
+        alice.email = "a@example.com"  # __slots__: no per-record dict
+
+
+def test_column_store_round_trip():
+    people = [{"name": "Alice", "grades": {"math": 95, "science": 98}},
+              {"name": "Bob", "grades": {"math": 70, "science": 81}}]
+    store = ColumnStore.from_dicts(STUDENT_SPEC, people)
+    assert store.to_dicts() == people and store[-1] == people[1]
+    assert store.column("grades.math").tolist() == [95, 70]
+
+
+def test_column_store_keeps_bools_and_nulls():
+    spec = {"name": str, "active": bool, "age": int, "score": float}
+    rows = [{"name": "Ann", "active": True, "age": None, "score": 1.5},
+            {"name": None, "active": False, "age": 30, "score": None}]
+    store = ColumnStore.from_dicts(spec, rows)
+    assert store.to_dicts() == rows
+    assert store[0]["active"] is True and store[1]["active"] is False
+    assert store[0]["age"] is None and store[1]["score"] is None
+    assert store.row(0) == rows[0]
+    store.append({"name": "Cy"})  # missing fields are nulls
+    assert store[2] == {"name": "Cy", "active": None, "age": None, "score": None}
+
+
+def test_column_store_rejects_wrong_types_without_partial_rows():
+    store = ColumnStore({"age": int, "score": float})
+    store.append({"age": 3, "score": 2})
+    assert store[0] == {"age": 3, "score": 2.0}
+    for bad in ({"age": True, "score": 1.0}, {"age": "3", "score": 1.0},
+                {"age": 1, "score": "x"}):
+        with pytest.raises(TypeError):
+            store.append(bad)
+    with pytest.raises(OverflowError):
+        store.append({"age": 2 ** 63, "score": 1.0})
+    assert len(store) == 1 and len(store.column("age")) == len(store.column("score")) == 1
@@ -0,0 +1,44 @@
+import operator
+from array import array
+
+import pytest
+
+from reductions import (as_buffer, max_recursive, parallel_reduce, product_recursive,
+                        reduce_range, sum_recursive)
+
+
+def test_recursive_reductions_use_index_ranges():
+    numbers = list(range(1, 1001))
+    assert sum_recursive(numbers) == sum(numbers)
+    assert sum_recursive(numbers, 10, 20) == sum(numbers[10:20])
+    assert product_recursive([1, 2, 3, 4, 5]) == 120
+    assert max_recursive([3, 9, 2, 7] * 50) == 9
+    assert sum_recursive([]) == 0 and product_recursive([]) == 1
+    with pytest.raises(ValueError):
+        max_recursive([])
+
+
+def test_reduce_range_keeps_order_for_associative_combiners():
+    words = [str(i) for i in range(300)]
+    assert reduce_range(words, operator.add) == "".join(words)
+
+
+def test_buffers_and_parallel_reduce():
+    numbers = array('q', range(10_000))
+    assert isinstance(as_buffer(numbers), memoryview) and as_buffer([1]) == [1]
+    assert parallel_reduce(numbers) == sum(range(10_000))
+    assert parallel_reduce(list(range(10_000)), max, workers=2, chunk_size=3000) == 9999
+    with pytest.raises(ValueError):
+        parallel_reduce([])
+
+
+def test_parallel_reduce_accepts_memoryviews():
+    view = memoryview(array('d', range(10_000)))
+    assert parallel_reduce(view, workers=2, chunk_size=3000) == sum(range(10_000))
+    assert parallel_reduce(memoryview(bytes(range(200))), max, workers=2, chunk_size=64) == 199
+
+
+@pytest.mark.parametrize("low, high", [(-1, None), (0, 11), (5, 2)])
+def test_reduce_range_rejects_bounds_outside_the_sequence(low, high):
+    with pytest.raises(ValueError):
+        sum_recursive(list(range(10)), low, high)
@@ -0,0 +1,104 @@
+import threading
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from request_metrics import PROMETHEUS_BUCKETS, LatencyHistogram, RequestMetrics, endpoint_template
+
+
+def test_histogram_percentiles_stay_within_bucket_error():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+    summary = histogram.summary()
+    assert summary['count'] == 100 and summary['min'] == 0.001 and summary['max'] == 0.1
+    assert summary['p50'] == pytest.approx(0.050, rel=1 / 16)
+    assert summary['p99'] == pytest.approx(0.099, rel=1 / 16)
+    assert LatencyHistogram().percentile(50) == 0.0
+
+
+@pytest.mark.parametrize("url, template", [
+    ("https://jsonplaceholder.typicode.com/posts/1?fields=title", "/posts/{id}"),
+    ("/users/42/todos", "/users/{id}/todos"),
+    ("https://api.example.com/items/123e4567-e89b-12d3-a456-426614174000", "/items/{id}"),
+    ("https://example.com", "/"),
+    ("/v2/status", "/v2/status"),
+])
+def test_endpoint_template(url, template):
+    assert endpoint_template(url) == template
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = RequestMetrics()
+    with metrics.phase('request', '/posts/{id}'):
+        pass
+    metrics.observe('request', 0.1)
+    assert metrics.to_dict() == []
+
+
+def test_observe_response_splits_server_and_transfer():
+    metrics = RequestMetrics(enabled=True)
+    response = SimpleNamespace(status_code=200, elapsed=timedelta(milliseconds=80))
+    metrics.observe_response(response, 0.1, '/posts/{id}')
+    rows = {row['phase']: row for row in metrics.to_dict()}
+    assert set(rows) == {'server', 'transfer', 'request'}
+    assert rows['server']['sum'] == pytest.approx(0.08)
+    assert rows['transfer']['sum'] == pytest.approx(0.02)
+    assert rows['request']['status'] == '200'
+
+
+def test_prometheus_escapes_label_values():
+    metrics = RequestMetrics(enabled=True)
+    metrics.observe('parse', 0.01, 'a"b\\c\nd', 200)
+    text = metrics.to_prometheus()
+    assert 'endpoint="a\\"b\\\\c\\nd"' in text
+    # header lines, one _bucket per bound plus +Inf, _sum and _count
+    assert len(text.splitlines()) == 2 + len(PROMETHEUS_BUCKETS) + 1 + 2
+
+
+def test_prometheus_exports_cumulative_histogram_buckets():
+    metrics = RequestMetrics(enabled=True)
+    for seconds in [0.003, 0.02, 0.02, 0.4, 30]:
+        metrics.observe('request', seconds, '/posts/{id}', 200)
+    text = metrics.to_prometheus(buckets=(0.01, 0.1, 1.0))
+    assert '# TYPE http_client_phase_seconds histogram' in text
+    prefix = 'http_client_phase_seconds_bucket{phase="request",endpoint="/posts/{id}",status="200",'
+    for bound, count in [("0.01", 1), ("0.1", 3), ("1.0", 4), ("+Inf", 5)]:
+        assert f'{prefix}le="{bound}"}} {count}' in text
+    assert 'http_client_phase_seconds_count{phase="request",endpoint="/posts/{id}",status="200"} 5' in text
+
+
+def test_failed_requests_are_recorded_with_the_exception_name():
+    metrics = RequestMetrics(enabled=True)
+
+    def timeout(url):
+        raise TimeoutError(url)
+
+    with pytest.raises(TimeoutError):
+        metrics.timed_request('/posts/{id}', timeout, 'https://example.com/posts/1')
+    response = SimpleNamespace(status_code=200, elapsed=timedelta(milliseconds=1))
+    assert metrics.timed_request('/posts/{id}', lambda url: response, '/posts/2') is response
+    rows = [(row['phase'], row['status']) for row in metrics.to_dict()]
+    assert ('request', 'TimeoutError') in rows and ('request', '200') in rows
+
+
+def test_export_while_recording_from_threads():
+    metrics = RequestMetrics(enabled=True)
+    done = threading.Event()
+
+    def record():
+        while not done.is_set():
+            metrics.observe('request', 0.01, '/posts/{id}', 200)
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        for _ in range(200):
+            for row in metrics.to_dict():
+                assert row['count'] >= 1 and row['min'] <= row['p50'] <= row['max']
+    finally:
+        done.set()
+        for thread in threads:
+            thread.join()
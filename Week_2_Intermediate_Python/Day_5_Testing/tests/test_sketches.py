@@ -0,0 +1,94 @@
+import random
+from collections import Counter
+
+import pytest
+
+from sketches import CountMinSketch, HyperLogLog, SpaceSaving
+
+
+def _zipf_stream(n, seed=1):
+    rng = random.Random(seed)
+    words = [f"word{i}" for i in range(1, 2001)]
+    weights = [1 / i for i in range(1, 2001)]
+    return rng.choices(words, weights, k=n)
+
+
+def test_count_min_never_underestimates():
+    stream = _zipf_stream(20_000)
+    sketch = CountMinSketch(width=256, depth=4)
+    sketch.update(stream)
+    exact = Counter(stream)
+    assert all(sketch.estimate(item) >= count for item, count in exact.items())
+    assert CountMinSketch.from_bytes(sketch.to_bytes()).table == sketch.table
+
+
+def test_space_saving_matches_a_brute_force_minimum_eviction():
+    stream = _zipf_stream(20_000)
+    summary = SpaceSaving(k=20)
+    counts, errors = {}, {}
+    for item in stream:
+        summary.add(item)
+        if item in counts:
+            counts[item] += 1
+        elif len(counts) < 20:
+            counts[item], errors[item] = 1, 0
+        else:
+            floor = min(counts.values())
+            victims = [key for key, value in counts.items() if value == floor]
+            # ties may be broken differently, but the evicted item must be a minimum
+            victim = next(key for key in victims if key not in summary.counts)
+            del counts[victim], errors[victim]
+            counts[item], errors[item] = floor + 1, floor
+    assert summary.counts == counts and summary.errors == errors
+    assert len(summary._heap) == 20
+
+
+def test_space_saving_keeps_heavy_hitters():
+    stream = _zipf_stream(50_000)
+    summary = SpaceSaving(k=50)
+    summary.update(stream)
+    exact = Counter(stream).most_common(3)
+    top = summary.top(3)
+    assert [item for item, _, _ in top] == [item for item, _ in exact]
+    for (_, count, error), (_, true_count) in zip(top, exact):
+        assert count - error <= true_count <= count
+
+
+def test_space_saving_works_after_merge_and_round_trip():
+    stream = _zipf_stream(10_000)
+    left, right = SpaceSaving(k=10), SpaceSaving(k=10)
+    left.update(stream[::2])
+    right.update(stream[1::2])
+    left.merge(right)
+    copy = SpaceSaving.from_bytes(left.to_bytes())
+    assert copy.counts == left.counts and copy.errors == left.errors and copy.total == 10_000
+    for summary in (left, copy):
+        summary.update(["new1", "new2"])
+        assert len(summary.counts) == 10 and "new2" in summary.counts
+
+
+def test_space_saving_rejects_items_json_cannot_round_trip():
+    summary = SpaceSaving(k=4)
+    summary.update([("a", 1), ("b", 2)])  # tuples are fine to count
+    with pytest.raises(TypeError):
+        summary.to_bytes()
+
+
+def test_hyperloglog_estimate_and_merge():
+    left, right = HyperLogLog(p=12), HyperLogLog(p=12)
+    left.update(range(0, 30_000))
+    right.update(range(20_000, 50_000))
+    left.merge(right)
+    assert left.count() == pytest.approx(50_000, rel=0.05)
+    with pytest.raises(ValueError):
+        HyperLogLog(p=3)
+
+
+def test_equal_items_hash_alike_and_types_stay_apart():
+    sketch = CountMinSketch(width=1 << 16, depth=4)
+    sketch.update([1, 1.0, True])
+    assert sketch.estimate(1) == 3 and sketch.estimate(1.0) == 3
+    assert sketch.estimate("1") == 0
+    hll = HyperLogLog()
+    hll.update([1, 1.0, "1", b"1"])
+    assert round(hll.count()) == 3
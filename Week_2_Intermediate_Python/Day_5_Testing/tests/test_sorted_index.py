@@ -0,0 +1,44 @@
+import bisect
+
+import pytest
+
+import sorted_index
+from sorted_index import SortedIndex, binary_search
+
+BACKEND_MODULES = [sorted_index]
+NUMBERS = [1, 3, 5, 7, 9, 11, 13, 15]
+
+
+@pytest.fixture
+def index():
+    return SortedIndex(NUMBERS, typecode="q", chunk_size=4)
+
+
+def test_point_queries_match_binary_search(index):
+    for value in range(-1, 17):
+        assert index.index(value) == binary_search(NUMBERS, value)
+        assert (value in index) == (value in NUMBERS)
+    assert index[0] == 1 and index[-1] == 15
+
+
+def test_inserts_keep_order(index):
+    for value in [10, 0, 16, 10, 4, 4, 4]:
+        index.insert(value)
+    assert list(index) == sorted(NUMBERS + [10, 0, 16, 10, 4, 4, 4])
+    assert index.count_range(4, 10) == 8
+
+
+def test_batch_queries_match_single_queries(index, backend):
+    probes = [0, 1, 6, 7, 15, 16]
+    assert list(index.index_batch(probes)) == [index.index(v) for v in probes]
+    assert list(index.lower_bound_batch(probes)) == [bisect.bisect_left(NUMBERS, v) for v in probes]
+    assert list(index.upper_bound_batch(probes)) == [bisect.bisect_right(NUMBERS, v) for v in probes]
+    assert list(index.count_range_batch([0, 5, 9], [4, 11, 2])) == [2, 4, 0]
+
+
+def test_fractional_probes_are_not_truncated(index, backend):
+    assert list(index.index_batch([7.5, 7.0, 2 ** 70])) == [-1, 3, -1]
+
+
+def test_empty_index(backend):
+    assert list(SortedIndex(typecode="q").index_batch([1, 2])) == [-1, -1]
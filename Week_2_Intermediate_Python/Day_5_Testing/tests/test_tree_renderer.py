@@ -0,0 +1,45 @@
+import io
+
+from tree_renderer import (iter_binary_tree, iter_directory_structure, iter_filesystem,
+                           print_binary_tree, write_lines)
+
+
+def _print_directory_structure(structure, prefix=""):
+    """recursion.py's recursive version, returning lines instead of printing"""
+    lines = []
+    for name, contents in structure.items():
+        lines.append(prefix + "├── " + name)
+        if contents:
+            lines.extend(_print_directory_structure(contents, prefix + "│   "))
+    return lines
+
+
+def test_binary_tree_matches_the_recursive_version(capsys):
+    for depth in range(6):
+        print_binary_tree(depth)
+        expected = capsys.readouterr().out.splitlines()
+        assert list(iter_binary_tree(depth)) == expected
+
+
+def test_directory_structure_matches_the_recursive_version():
+    structure = {"project": {"src": {"main.py": None, "utils": {"io.py": None}},
+                             "README.md": None, "empty": {}},
+                 "notes.txt": None}
+    assert list(iter_directory_structure(structure)) == _print_directory_structure(structure)
+
+
+def test_filesystem_limits(tmp_path):
+    (tmp_path / "a" / "deep").mkdir(parents=True)
+    (tmp_path / "a" / "deep" / "file.txt").write_text("x")
+    (tmp_path / ".hidden").write_text("x")
+    lines = list(iter_filesystem(tmp_path))
+    assert lines[0] == tmp_path.name and not any(".hidden" in line for line in lines)
+    assert any(line.endswith("file.txt") for line in lines)
+    assert not any("file.txt" in line for line in iter_filesystem(tmp_path, max_depth=1))
+    assert list(iter_filesystem(tmp_path, max_entries=1))[-1].endswith("(entry limit reached)")
+
+
+def test_write_lines_in_chunks():
+    stream = io.StringIO()
+    assert write_lines(iter_binary_tree(4), stream, chunk_lines=7) == 3 * 15  # three lines per node
+    assert stream.getvalue().splitlines() == list(iter_binary_tree(4))
@@ -0,0 +1,36 @@
+import io
+
+from word_counter import count_file, count_file_parallel, count_words, iter_chunks, top_k
+
+
+def test_unicode_words_are_counted():
+    counts = count_words("Café CAFÉ 東京 don't")
+    assert counts == {"café": 2, "東京": 1, "don't": 1}
+
+
+def test_iter_chunks_splits_on_any_whitespace():
+    text = "alpha\tbeta\r\ngamma delta　epsilon"
+    chunks = list(iter_chunks(io.StringIO(text), chunk_size=4, max_carry=20))
+    assert "".join(chunks) == text
+    words = [word for chunk in chunks for word in chunk.split()]
+    assert words == text.split()
+
+
+def test_iter_chunks_caps_the_carried_text():
+    text = "x" * 1000
+    chunks = list(iter_chunks(io.StringIO(text), chunk_size=10, max_carry=50))
+    assert "".join(chunks) == text
+    assert max(map(len, chunks)) < 60
+
+
+def test_count_file_matches_parallel(tmp_path):
+    path = tmp_path / "words.txt"
+    lines = [f"café\tword{i % 7}\r\n東京 line{i % 3}" for i in range(2000)]
+    path.write_text("\n".join(lines), encoding="utf-8")
+    expected = count_words(path.read_text(encoding="utf-8"))
+    assert count_file(path, chunk_size=100) == expected
+    assert count_file_parallel(path, workers=3, chunk_size=100) == expected
+
+
+def test_top_k():
+    assert top_k(count_words("a b b c c c"), 2) == [("c", 3), ("b", 2)]
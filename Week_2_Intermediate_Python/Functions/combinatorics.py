@@ -0,0 +1,229 @@
+"""
+Python Combinatorics Tutorial
+
+recursion.py computes factorial(n) as n * factorial(n - 1). That recurses
+n levels deep (factorial(5000) raises RecursionError) and multiplies one
+huge number by one small number n times. This file builds faster,
+stack-safe versions and uses them for combinations and permutations:
+1. Binary splitting - multiply numbers in a balanced product tree
+2. Prime swing - Luschny's factorial algorithm for large n
+3. Cached tables for small n
+4. Batch nCr / nPr over lists of inputs
+5. Benchmarking against a one-at-a-time multiplication loop
+
+Every recursive helper here only goes log2(n) levels deep.
+
+Run this file to see the examples and the benchmark.
+"""
+
+import math
+import os
+import sys
+from functools import lru_cache
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import benchmark
+
+SMALL_LIMIT = 256  # factorials up to this n are kept in a table
+
+
+def product_range(low, high):
+    """
+    Return low * (low + 1) * ... * (high - 1) using binary splitting.
+
+    Splitting the range in half keeps both operands of every multiplication
+    about the same size, which is much faster for big integers than a
+    running product. The recursion depth is only log2(high - low).
+    """
+    if high - low <= 8:
+        result = 1
+        for value in range(low, high):
+            result *= value
+        return result
+    middle = (low + high) // 2
+    return product_range(low, middle) * product_range(middle, high)
+
+
+def product_tree(values):
+    """Multiply a list of numbers pairwise, level by level, without recursion"""
+    values = list(values)
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def primes_up_to(n):
+    """Return all primes <= n with the sieve of Eratosthenes"""
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(n) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [i for i, is_prime in enumerate(sieve) if is_prime]
+
+
+def _swing(n, primes):
+    """
+    Return the swinging factorial n! / ((n // 2)!)**2.
+
+    Its prime factorisation can be read off directly, so it is built as a
+    product of prime powers instead of n separate multiplications.
+    """
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        exponent, q = 0, n
+        while q:
+            q //= p
+            exponent += q & 1
+        if exponent:
+            factors.append(p ** exponent if exponent > 1 else p)
+    return product_tree(factors)
+
+
+@lru_cache(maxsize=None)
+def _small_factorials():
+    """Build the table [0!, 1!, ..., SMALL_LIMIT!] once"""
+    table = [1]
+    for i in range(1, SMALL_LIMIT + 1):
+        table.append(table[-1] * i)
+    return tuple(table)
+
+
+def factorial_product_tree(n):
+    """Return n! with a binary-splitting product tree"""
+    if n < 0:
+        raise ValueError("factorial is not defined for negative numbers")
+    return product_range(2, n + 1)
+
+
+def factorial(n):
+    """
+    Return n! using a cached table for small n and prime swing above it.
+
+    n! = ((n // 2)!)**2 * swing(n), applied to n, n // 2, n // 4, ...
+    """
+    if n < 0:
+        raise ValueError("factorial is not defined for negative numbers")
+    if n <= SMALL_LIMIT:
+        return _small_factorials()[n]
+    primes = primes_up_to(n)
+    # Walk down n, n//2, n//4, ... then build the result back up
+    chain = []
+    while n > SMALL_LIMIT:
+        chain.append(n)
+        n //= 2
+    result = _small_factorials()[n]
+    for value in reversed(chain):
+        result = result * result * _swing(value, primes)
+    return result
+
+
+def ncr(n, r):
+    """Return the number of combinations "n choose r" (0 if r > n)"""
+    if r < 0 or n < 0:
+        raise ValueError("n and r must be non-negative")
+    if r > n:
+        return 0
+    if n <= SMALL_LIMIT:
+        table = _small_factorials()
+        return table[n] // (table[r] * table[n - r])
+    r = min(r, n - r)
+    return product_range(n - r + 1, n + 1) // factorial(r)
+
+
+def npr(n, r):
+    """Return the number of permutations of r items taken from n"""
+    if r < 0 or n < 0:
+        raise ValueError("n and r must be non-negative")
+    if r > n:
+        return 0
+    return product_range(n - r + 1, n + 1)
+
+
+def _factorial_table(limit):
+    """Return [0!, 1!, ..., limit!] built with one multiplication per entry"""
+    table = list(_small_factorials()[:limit + 1])
+    for i in range(len(table), limit + 1):
+        table.append(table[-1] * i)
+    return table
+
+
+def _batch_pairs(ns, rs):
+    """Pair up the arguments, rejecting negatives like ncr() and npr() do"""
+    pairs = list(zip(ns, rs))
+    if any(n < 0 or r < 0 for n, r in pairs):
+        raise ValueError("n and r must be non-negative")
+    return pairs
+
+
+def ncr_batch(ns, rs, table_limit=5000):
+    """
+    Return [ncr(n, r) for n, r in zip(ns, rs)].
+
+    When all n are at most table_limit, one factorial table is built and
+    every answer is two lookups and a division. Like ncr(), a negative n
+    or r raises ValueError whichever path is taken.
+    """
+    pairs = _batch_pairs(ns, rs)
+    if not pairs:
+        return []
+    largest = max(n for n, _ in pairs)
+    if largest > table_limit:
+        return [ncr(n, r) for n, r in pairs]
+    table = _factorial_table(largest)
+    return [table[n] // (table[r] * table[n - r]) if r <= n else 0
+            for n, r in pairs]
+
+
+def npr_batch(ns, rs, table_limit=5000):
+    """Return [npr(n, r) for n, r in zip(ns, rs)] using one shared table"""
+    pairs = _batch_pairs(ns, rs)
+    if not pairs:
+        return []
+    largest = max(n for n, _ in pairs)
+    if largest > table_limit:
+        return [npr(n, r) for n, r in pairs]
+    table = _factorial_table(largest)
+    return [table[n] // table[n - r] if r <= n else 0 for n, r in pairs]
+
+
+def factorial_linear(n):
+    """Return n! with a plain loop (the iterative version of recursion.py)"""
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
+
+
+if __name__ == "__main__":
+    print("\n=== Stack-safe Factorial ===")
+    print("factorial(10):", factorial(10))
+    print("factorial(5000) has", factorial(5000).bit_length(), "bits - no RecursionError")
+
+    print("\n=== Combinations and Permutations ===")
+    print("ncr(5, 2):", ncr(5, 2))
+    print("npr(5, 2):", npr(5, 2))
+    print("ncr(1000, 3):", ncr(1000, 3))
+
+    print("\n=== Batch Queries ===")
+    ns = [5, 10, 20, 52]
+    rs = [2, 3, 10, 5]
+    print("ncr_batch:", ncr_batch(ns, rs))
+    print("npr_batch:", npr_batch(ns, rs))
+
+    print("\n=== Benchmark ===")
+    for n in [20_000, 100_000]:
+        print(f"n = {n:,}")
+        print(f"  loop:         {benchmark(factorial_linear, n):.4f} s")
+        print(f"  product tree: {benchmark(factorial_product_tree, n):.4f} s")
+        print(f"  prime swing:  {benchmark(factorial, n):.4f} s")
+        print(f"  math.factorial (C): {benchmark(math.factorial, n):.4f} s")
@@ -0,0 +1,302 @@
+"""
+Python Dispatch Tables Tutorial
+
+The calculator exercise (exercises/function_exercises.py) and switch_case
+in Day_1_Data_Structures/dictionaries.py both use a dictionary of
+functions as a "switch" statement, but they rebuild that dictionary on
+every call and report problems as strings like "Error: Division by zero".
+This file shows how to do the same thing for bulk evaluation:
+1. Building the dispatch table once
+2. Typed exceptions instead of error strings
+3. Bulk evaluation of (operation, a, b) triples
+4. NumPy ufunc backends for whole columns (when NumPy is installed)
+5. Counting how often each operation runs
+
+Run this file to see the examples and the benchmark.
+"""
+
+import math
+import operator
+import os
+import sys
+import time
+from collections import Counter, namedtuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import np  # np is None without NumPy; the pure Python path still works
+
+
+class OperationError(Exception):
+    """Base class for errors raised while evaluating an operation"""
+    def __init__(self, message, operation=None):
+        self.message = message
+        self.operation = operation
+        super().__init__(self.message)
+
+
+class UnknownOperationError(OperationError):
+    """The operation name is not in the dispatch table"""
+
+
+class DivisionByZeroError(OperationError):
+    """A division had zero as its divisor"""
+
+
+class InvalidOperandError(OperationError):
+    """The operands do not suit the operation (a TypeError or ValueError)"""
+
+
+class ArithmeticOperationError(OperationError):
+    """The operation raised another ArithmeticError, such as OverflowError"""
+
+
+# Exceptions from the operation itself that are reported as OperationErrors
+OPERAND_ERRORS = (TypeError, ValueError, ArithmeticError)
+
+
+def _divide(a, b):
+    if b == 0:
+        raise DivisionByZeroError("Division by zero", "divide")
+    return a / b
+
+
+def _wrap(error, operation):
+    """Return the OperationError for an exception raised by an operation"""
+    if isinstance(error, ZeroDivisionError):
+        return DivisionByZeroError("Division by zero", operation)
+    if isinstance(error, ArithmeticError):
+        return ArithmeticOperationError(str(error), operation)
+    return InvalidOperandError(str(error), operation)
+
+
+def _float_operands(operations, column, errors):
+    """
+    Convert one operand column to floats, row by row.
+
+    A value that float() rejects becomes NaN and its row gets an
+    InvalidOperandError in errors, so one bad operand does not fail the
+    whole batch.
+    """
+    floats = []
+    for position, (operation, value) in enumerate(zip(operations, column)):
+        try:
+            floats.append(float(value))
+        except (TypeError, ValueError, OverflowError) as error:
+            errors.setdefault(position, InvalidOperandError(
+                f"Invalid operand {value!r}: {error}", operation))
+            floats.append(math.nan)
+    return floats
+
+
+# values: list of results (None where an error occurred)
+# errors: {position: OperationError}; TypeError, ValueError and
+#         ArithmeticError from the operation itself are wrapped by _wrap()
+BatchResult = namedtuple('BatchResult', ['values', 'errors'])
+
+
+class DispatchTable:
+    """
+    Maps operation names to two-argument functions.
+
+    The table is built once. evaluate() raises typed errors; the batch
+    methods collect errors by position so every result has the same type.
+    """
+
+    def __init__(self, operations, ufuncs=None):
+        self.operations = dict(operations)
+        self.ufuncs = dict(ufuncs or {})
+        self.counts = Counter()
+
+    def evaluate(self, operation, a, b):
+        """Evaluate one operation, raising an OperationError on failure"""
+        func = self.operations.get(operation)
+        if func is None:
+            raise UnknownOperationError(f"Invalid operation: {operation}", operation)
+        self.counts[operation] += 1
+        try:
+            return func(a, b)
+        except OPERAND_ERRORS as error:
+            raise _wrap(error, operation) from error
+
+    def evaluate_many(self, triples):
+        """Evaluate (operation, a, b) triples one by one"""
+        values, errors = [], {}
+        operations = self.operations
+        counts = self.counts
+        for position, (operation, a, b) in enumerate(triples):
+            func = operations.get(operation)
+            if func is None:
+                errors[position] = UnknownOperationError(
+                    f"Invalid operation: {operation}", operation)
+                values.append(None)
+                continue
+            counts[operation] += 1
+            try:
+                values.append(func(a, b))
+            except OperationError as error:
+                errors[position] = error
+                values.append(None)
+            except OPERAND_ERRORS as error:
+                errors[position] = _wrap(error, operation)
+                values.append(None)
+        return BatchResult(values, errors)
+
+    def evaluate_columns(self, operations, a, b):
+        """
+        Evaluate whole columns: operations[i] applied to a[i] and b[i].
+
+        Operands are converted to float, and values is a list of floats
+        with None where an error occurred, whichever backend runs. An
+        operand that cannot be converted only fails its own row. With
+        NumPy, rows are grouped by operation and each group is computed
+        with a single ufunc call; without it this is evaluate_many().
+        """
+        if np is None or not self.ufuncs:
+            operations = list(operations)
+            errors = {}
+            a = _float_operands(operations, a, errors)
+            b = _float_operands(operations, b, errors)
+            if not errors:
+                return self.evaluate_many(zip(operations, a, b))
+            rows = [i for i in range(len(operations)) if i not in errors]
+            result = self.evaluate_many((operations[i], a[i], b[i]) for i in rows)
+            values = [None] * len(operations)
+            for position, value in zip(rows, result.values):
+                values[position] = value
+            errors.update((rows[i], error) for i, error in result.errors.items())
+            return BatchResult(values, errors)
+        errors = {}
+        try:
+            a = np.asarray(a, dtype=float)
+        except (TypeError, ValueError, OverflowError):
+            a = np.asarray(_float_operands(operations, a, errors))
+        try:
+            b = np.asarray(b, dtype=float)
+        except (TypeError, ValueError, OverflowError):
+            b = np.asarray(_float_operands(operations, b, errors))
+        operations = np.asarray(operations)
+        values = np.full(len(a), np.nan)
+        valid = np.ones(len(a), dtype=bool)
+        valid[list(errors)] = False
+        handled = ~valid  # rows with a bad operand are already reported
+        for name, ufunc in self.ufuncs.items():
+            mask = (operations == name) & valid
+            count = int(mask.sum())
+            if not count:
+                continue
+            handled |= mask
+            self.counts[name] += count
+            if name == 'divide':
+                zero = mask & (b == 0)
+                for position in np.flatnonzero(zero):
+                    errors[int(position)] = DivisionByZeroError("Division by zero", name)
+                mask &= ~zero
+            values[mask] = ufunc(a[mask], b[mask])
+        for position in np.flatnonzero(~handled):
+            operation = str(operations[position])
+            if operation in self.operations:
+                result = self.evaluate_many([(operation, float(a[position]), float(b[position]))])
+                if result.values[0] is not None:
+                    values[position] = result.values[0]
+                errors.update({int(position): e for e in result.errors.values()})
+            else:
+                errors[int(position)] = UnknownOperationError(
+                    f"Invalid operation: {operation}", operation)
+        values = values.tolist()
+        for position in errors:
+            values[position] = None
+        return BatchResult(values, errors)
+
+
+CALCULATOR = DispatchTable(
+    {
+        "add": operator.add,
+        "subtract": operator.sub,
+        "multiply": operator.mul,
+        "divide": _divide,
+    },
+    ufuncs={
+        "add": np.add,
+        "subtract": np.subtract,
+        "multiply": np.multiply,
+        "divide": np.divide,
+    } if np is not None else None,
+)
+
+
+def calculator(operation, a, b):
+    """The calculator exercise, using the prebuilt table"""
+    return CALCULATOR.evaluate(operation, a, b)
+
+
+def make_switch(cases, default=None):
+    """
+    Build a switch_case-style function once.
+
+    The returned function looks its argument up in `cases`, which is
+    created a single time instead of on every call.
+    """
+    lookup = dict(cases).get
+    def switch(argument):
+        return lookup(argument, default)
+    return switch
+
+
+def calculator_rebuilt(operation, a, b):
+    """The original exercise solution, which rebuilds the dict each call"""
+    operations = {
+        "add": lambda x, y: x + y,
+        "subtract": lambda x, y: x - y,
+        "multiply": lambda x, y: x * y,
+        "divide": lambda x, y: x / y if y != 0 else "Error: Division by zero"
+    }
+    return operations.get(operation, lambda x, y: "Invalid operation")(a, b)
+
+
+if __name__ == "__main__":
+    print("\n=== Prebuilt Dispatch Table ===")
+    print("calculator('add', 5, 3):", calculator("add", 5, 3))
+    print("calculator('multiply', 4, 2):", calculator("multiply", 4, 2))
+
+    print("\n=== Typed Errors ===")
+    for operation, a, b in [("divide", 1, 0), ("power", 2, 3)]:
+        try:
+            calculator(operation, a, b)
+        except OperationError as error:
+            print(f"{type(error).__name__}: {error.message}")
+
+    print("\n=== Switch Built Once ===")
+    switch_case = make_switch({0: "Zero", 1: "One", 2: "Two"}, default="Invalid")
+    print("Switch case for 1:", switch_case(1))
+    print("Switch case for 4:", switch_case(4))
+
+    print("\n=== Bulk Evaluation ===")
+    triples = [("add", 1, 2), ("divide", 6, 3), ("divide", 1, 0), ("modulo", 5, 2)]
+    result = CALCULATOR.evaluate_many(triples)
+    print("Values:", result.values)
+    print("Errors:", {i: type(e).__name__ for i, e in result.errors.items()})
+
+    print("\n=== Column Evaluation ===")
+    ops = ["add", "subtract", "multiply", "divide"] * 3
+    result = CALCULATOR.evaluate_columns(ops, list(range(12)), [2] * 11 + [0])
+    print("Backend:", "NumPy ufuncs" if np else "pure Python")
+    print("Values:", list(result.values))
+    print("Errors:", {i: type(e).__name__ for i, e in result.errors.items()})
+    print("Operation counts:", dict(CALCULATOR.counts))
+
+    print("\n=== Benchmark (1,000,000 triples) ===")
+    names = ["add", "subtract", "multiply", "divide"]
+    big = [(names[i % 4], i, (i % 7) + 1) for i in range(1_000_000)]
+
+    start = time.perf_counter()
+    [calculator_rebuilt(op, a, b) for op, a, b in big]
+    print(f"Rebuilding the dict every call: {time.perf_counter() - start:.3f} s")
+
+    start = time.perf_counter()
+    CALCULATOR.evaluate_many(big)
+    print(f"evaluate_many:                  {time.perf_counter() - start:.3f} s")
+
+    ops, a_values, b_values = zip(*big)
+    start = time.perf_counter()
+    CALCULATOR.evaluate_columns(ops, a_values, b_values)
+    print(f"evaluate_columns:               {time.perf_counter() - start:.3f} s")
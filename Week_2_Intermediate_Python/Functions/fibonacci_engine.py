@@ -0,0 +1,104 @@
+"""
+Python Fibonacci Engine Tutorial
+
+recursion.py shows the classic doubly recursive fibonacci(n). It is a nice
+example of recursion, but it takes exponential time and hits the recursion
+limit for large n. This file shows faster ways to get the same numbers:
+1. Fast doubling - O(log n) steps for a single large n
+2. A streaming generator for whole sequences
+3. A bounded memo cache for repeated small-n queries
+4. Benchmarking the approaches against each other
+
+Run this file to see the examples and the benchmark.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import benchmark
+
+
+def fibonacci_pair(n):
+    """
+    Return the pair (F(n), F(n+1)) using fast doubling.
+
+    Uses the identities
+        F(2k)   = F(k) * (2*F(k+1) - F(k))
+        F(2k+1) = F(k)**2 + F(k+1)**2
+    and walks the bits of n from the most significant one, so there is no
+    recursion and only about log2(n) big-integer multiplications.
+    """
+    if n < 0:
+        raise ValueError("n must be a non-negative integer")
+    a, b = 0, 1  # F(0), F(1)
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)  # F(2k)
+        d = a * a + b * b       # F(2k+1)
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fibonacci_fast(n):
+    """Return the nth Fibonacci number in O(log n) arithmetic steps"""
+    return fibonacci_pair(n)[0]
+
+
+def fibonacci_sequence(count=None, start=0):
+    """
+    Yield Fibonacci numbers F(start), F(start+1), ...
+
+    If count is None the generator never stops, so use it with
+    itertools.islice or a for loop that breaks.
+    """
+    a, b = fibonacci_pair(start)
+    produced = 0
+    while count is None or produced < count:
+        yield a
+        a, b = b, a + b
+        produced += 1
+
+
+@lru_cache(maxsize=1024)
+def fibonacci_cached(n):
+    """
+    Return F(n), remembering up to 1024 recent answers.
+
+    Good for workloads that ask for the same small values over and over.
+    The cache is bounded, so memory does not grow without limit; use
+    fibonacci_cached.cache_info() to see hits and misses.
+    """
+    return fibonacci_fast(n)
+
+
+def fibonacci_iterative(n):
+    """Return F(n) with a simple loop - O(n) additions"""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+if __name__ == "__main__":
+    print("\n=== Fast Doubling ===")
+    for n in [0, 1, 2, 10, 50, 100]:
+        print(f"fibonacci_fast({n}) = {fibonacci_fast(n)}")
+
+    print("\n=== Streaming Sequence ===")
+    print("First 10:", list(fibonacci_sequence(10)))
+    print("5 values starting at F(90):", list(fibonacci_sequence(5, start=90)))
+
+    print("\n=== Bounded Memo Cache ===")
+    for n in [30, 30, 40, 30]:
+        fibonacci_cached(n)
+    print("Cache info:", fibonacci_cached.cache_info())
+
+    print("\n=== Benchmark ===")
+    print(f"iterative F(10,000): {benchmark(fibonacci_iterative, 10_000, repeat=3):.4f} s")
+    print(f"fast      F(10,000): {benchmark(fibonacci_fast, 10_000, repeat=3):.6f} s")
+    print(f"fast      F(1,000,000): {benchmark(fibonacci_fast, 10 ** 6, repeat=3):.4f} s")
+    print("(F(1,000,000) has 208,988 digits; the naive version never finishes)")
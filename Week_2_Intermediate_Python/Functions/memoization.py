@@ -0,0 +1,436 @@
+"""
+Python Memoization Tutorial
+
+Memoization means remembering the results of a function so repeated calls
+with the same arguments are answered from a cache. functools.lru_cache is
+the built-in tool, but it has no expiry time, no memory budget, no custom
+keys and only basic statistics.
+This file builds a small memoization library:
+1. Cache policies: LRU, LFU and TTL (time to live)
+2. Size limits by number of entries and by (approximate) bytes
+3. Key normalisation for *args/**kwargs (f(1, b=2) and f(1, 2) match)
+4. Single-flight: concurrent callers with the same key compute once
+5. async def functions
+6. Hit-rate statistics
+
+Run this file to see the examples.
+"""
+
+import asyncio
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from functools import wraps
+
+
+class CacheStats:
+    """Counters shared by every cache policy"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self):
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'expirations': self.expirations,
+                'hit_rate': round(self.hit_rate, 4)}
+
+    def __repr__(self):
+        return f"CacheStats({self.as_dict()})"
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Evicts the least recently used entry when a limit is exceeded"""
+
+    def __init__(self, maxsize=128, max_bytes=None, sizeof=sys.getsizeof):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.bytes = 0
+        self.stats = CacheStats()
+        self._data = OrderedDict()  # key -> (value, size)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def keys(self):
+        return list(self._data)
+
+    def get(self, key, default=_MISSING):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def set(self, key, value):
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if key in self._data:
+            self.bytes -= self._data.pop(key)[1]
+        self._data[key] = (value, size)
+        self.bytes += size
+        self._enforce_limits()
+
+    def _over_limit(self):
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            return True
+        return self.max_bytes is not None and self.bytes > self.max_bytes
+
+    def _enforce_limits(self):
+        while self._data and self._over_limit():
+            self._evict()
+
+    def _evict(self):
+        _, (_, size) = self._data.popitem(last=False)
+        self.bytes -= size
+        self.stats.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+        self.bytes = 0
+
+
+class TTLCache(LRUCache):
+    """An LRU cache whose entries also expire `ttl` seconds after being stored"""
+
+    def __init__(self, ttl, maxsize=128, max_bytes=None, sizeof=sys.getsizeof,
+                 clock=time.monotonic):
+        super().__init__(maxsize, max_bytes, sizeof)
+        self.ttl = ttl
+        self.clock = clock
+        self._expires = {}
+
+    def get(self, key, default=_MISSING):
+        expires = self._expires.get(key)
+        if expires is not None and expires <= self.clock():
+            self.bytes -= self._data.pop(key)[1]
+            del self._expires[key]
+            self.stats.expirations += 1
+            return default
+        return super().get(key, default)
+
+    def set(self, key, value):
+        self._expires[key] = self.clock() + self.ttl
+        super().set(key, value)
+
+    def _evict(self):
+        key, (_, size) = self._data.popitem(last=False)
+        self._expires.pop(key, None)
+        self.bytes -= size
+        self.stats.evictions += 1
+
+    def clear(self):
+        super().clear()
+        self._expires.clear()
+
+
+class LFUCache(LRUCache):
+    """
+    Evicts the least frequently used entry (oldest first among ties).
+
+    Keys are grouped by use count in `_by_count`, so finding the
+    eviction victim does not need a scan of the whole cache.
+    """
+
+    def __init__(self, maxsize=128, max_bytes=None, sizeof=sys.getsizeof):
+        super().__init__(maxsize, max_bytes, sizeof)
+        self._counts = {}
+        self._by_count = defaultdict(OrderedDict)
+        self._min_count = 0
+
+    def _touch(self, key):
+        count = self._counts[key]
+        bucket = self._by_count[count]
+        del bucket[key]
+        if not bucket:
+            del self._by_count[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._by_count[count + 1][key] = None
+
+    def get(self, key, default=_MISSING):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        self._touch(key)
+        return entry[0]
+
+    def set(self, key, value):
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if key in self._data:
+            self.bytes -= self._data[key][1]
+            self._data[key] = (value, size)
+            self.bytes += size
+            self._touch(key)
+        else:
+            self._data[key] = (value, size)
+            self.bytes += size
+            self._counts[key] = 1
+            self._by_count[1][key] = None
+            self._min_count = 1
+        self._enforce_limits()
+
+    def _evict(self):
+        while self._min_count not in self._by_count:
+            self._min_count += 1
+        bucket = self._by_count[self._min_count]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._by_count[self._min_count]
+        del self._counts[key]
+        self.bytes -= self._data.pop(key)[1]
+        self.stats.evictions += 1
+
+    def clear(self):
+        super().clear()
+        self._counts.clear()
+        self._by_count.clear()
+        self._min_count = 0
+
+
+def make_key(signature, args, kwargs, key_func=None):
+    """
+    Turn a call's arguments into a hashable cache key.
+
+    The arguments are bound to the function's signature with defaults
+    applied, so f(1, 2), f(1, b=2) and f(a=1, b=2) share one key. Extra
+    **kwargs are sorted by name. key_func, if given, receives the bound
+    arguments as a dict and returns the key instead.
+    """
+    if signature is None:
+        return args, tuple(sorted(kwargs.items()))
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    if key_func is not None:
+        return key_func(dict(bound.arguments))
+    parts = []
+    for name, value in bound.arguments.items():
+        kind = signature.parameters[name].kind
+        if kind is inspect.Parameter.VAR_KEYWORD:
+            value = tuple(sorted(value.items()))
+        parts.append(value)
+    return tuple(parts)
+
+
+def memoize(policy='lru', maxsize=128, ttl=None, max_bytes=None, key=None):
+    """
+    Decorator that caches a function's results.
+
+    policy:    'lru', 'lfu' or 'ttl' (ttl requires the ttl argument)
+    maxsize:   maximum number of entries (None for unlimited)
+    max_bytes: approximate memory budget, measured with sys.getsizeof
+    key:       optional function (bound arguments dict -> key)
+
+    Works for normal and async functions. The decorated function gets
+    .cache (with .stats) and .cache_clear() attributes.
+
+    Concurrent calls with the same key wait for the one that is computing
+    it. If that call is cancelled, one of the waiters computes the value
+    instead. A call that recursively calls itself with the same key (in
+    the same thread or task) raises RuntimeError instead of waiting for
+    itself forever.
+    """
+    def decorator(func):
+        if policy == 'lru':
+            cache = LRUCache(maxsize, max_bytes)
+        elif policy == 'lfu':
+            cache = LFUCache(maxsize, max_bytes)
+        elif policy == 'ttl':
+            if ttl is None:
+                raise ValueError("policy='ttl' needs a ttl in seconds")
+            cache = TTLCache(ttl, maxsize, max_bytes)
+        else:
+            raise ValueError(f"Unknown cache policy: {policy!r}")
+        try:
+            signature = inspect.signature(func)
+        except (TypeError, ValueError):
+            signature = None
+        lock = threading.Lock()
+        # key -> (threading.Event, thread id) or (asyncio.Future, task) of the computing call
+        in_flight = {}
+
+        def recursion_error():
+            return RuntimeError(f"{func.__qualname__} called itself with the same "
+                                f"arguments while computing them")
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_key = make_key(signature, args, kwargs, key)
+                task = asyncio.current_task()
+                while True:
+                    value = cache.get(cache_key)
+                    if value is not _MISSING:
+                        cache.stats.hits += 1
+                        return value
+                    entry = in_flight.get(cache_key)
+                    if entry is None:
+                        break
+                    pending, owner = entry
+                    if owner is task:
+                        raise recursion_error()
+                    value = await asyncio.shield(pending)
+                    if value is not _MISSING:
+                        cache.stats.hits += 1
+                        return value
+                    # The computing call was cancelled: the first waiter to get
+                    # here finds no entry and computes the value itself
+                cache.stats.misses += 1
+                pending = asyncio.get_running_loop().create_future()
+                in_flight[cache_key] = (pending, task)
+                try:
+                    value = await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    pending.set_result(_MISSING)  # waiters retry instead of being cancelled
+                    raise
+                except BaseException as error:
+                    pending.set_exception(error)
+                    pending.exception()  # mark as retrieved if nobody waits
+                    raise
+                else:
+                    cache.set(cache_key, value)
+                    pending.set_result(value)
+                    return value
+                finally:
+                    del in_flight[cache_key]
+            wrapper = async_wrapper
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                cache_key = make_key(signature, args, kwargs, key)
+                thread = threading.get_ident()
+                while True:
+                    with lock:
+                        value = cache.get(cache_key)
+                        if value is not _MISSING:
+                            cache.stats.hits += 1
+                            return value
+                        entry = in_flight.get(cache_key)
+                        if entry is None:
+                            cache.stats.misses += 1
+                            event = threading.Event()
+                            in_flight[cache_key] = (event, thread)
+                            break
+                        event, owner = entry
+                        if owner == thread:
+                            raise recursion_error()
+                    # Another thread is computing this key: wait, then re-check
+                    event.wait()
+                try:
+                    value = func(*args, **kwargs)
+                    with lock:
+                        cache.set(cache_key, value)
+                    return value
+                finally:
+                    with lock:
+                        del in_flight[cache_key]
+                    event.set()
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+if __name__ == "__main__":
+    print("\n=== LRU Memoization ===")
+
+    @memoize(maxsize=256)
+    def fibonacci(n):
+        """Recursive fibonacci from recursion.py - now linear time"""
+        if n <= 1:
+            return n
+        return fibonacci(n-1) + fibonacci(n-2)
+
+    print("fibonacci(80):", fibonacci(80))
+    print("Stats:", fibonacci.cache.stats)
+
+    print("\n=== Key Normalisation ===")
+
+    @memoize()
+    def super_function(*args, scale=1, **kwargs):
+        return sum(args) * scale + len(kwargs)
+
+    super_function(1, 2, name="Alice", age=25)
+    super_function(1, 2, age=25, name="Alice", scale=1)  # same call, different order
+    print("Stats after two equivalent calls:", super_function.cache.stats)
+
+    print("\n=== LFU and Byte Budgets ===")
+
+    @memoize(policy='lfu', maxsize=2)
+    def square(x):
+        return x * x
+
+    for x in [1, 1, 1, 2, 3, 1]:
+        square(x)
+    print("Keys kept by LFU:", square.cache.keys())  # (1,) was used most, (2,) was evicted
+
+    @memoize(max_bytes=2_000, maxsize=None)
+    def make_text(n):
+        return "x" * n
+
+    for n in range(10):
+        make_text(500)
+        make_text(n * 100)
+    print(f"Byte-limited cache holds {make_text.cache.bytes} bytes "
+          f"in {len(make_text.cache)} entries")
+
+    print("\n=== TTL Expiry ===")
+
+    @memoize(policy='ttl', ttl=0.05)
+    def current_rate(currency):
+        return time.time()
+
+    first = current_rate("EUR")
+    print("Cached within TTL:", current_rate("EUR") == first)
+    time.sleep(0.06)
+    print("Recomputed after TTL:", current_rate("EUR") != first)
+
+    print("\n=== Single-flight Across Threads ===")
+    calls = []
+
+    @memoize()
+    def slow_lookup(user_id):
+        calls.append(user_id)
+        time.sleep(0.05)
+        return {'id': user_id}
+
+    threads = [threading.Thread(target=slow_lookup, args=(42,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print("8 threads, computations performed:", len(calls))
+
+    print("\n=== Async Functions ===")
+
+    @memoize(policy='ttl', ttl=60)
+    async def fetch_user(user_id):
+        await asyncio.sleep(0.05)
+        return {'id': user_id}
+
+    async def main():
+        results = await asyncio.gather(*(fetch_user(7) for _ in range(5)))
+        return results, fetch_user.cache.stats
+
+    print("Async results and stats:", asyncio.run(main()))
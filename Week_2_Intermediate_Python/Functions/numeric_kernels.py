@@ -0,0 +1,177 @@
+"""
+Python Numeric Kernels Tutorial
+
+The solutions in exercises/function_exercises.py compute power(base, exp)
+with one recursive call per step and sum_of_digits(n) with one recursive
+call (and one big-integer % and //) per digit. Both hit the recursion
+limit for large inputs and take quadratic time on big numbers.
+This file shows faster kernels for the same tasks:
+1. Exponentiation by squaring - O(log exponent) multiplications
+2. Modular exponentiation (the algorithm behind pow(b, e, m))
+3. Digit sums through divide-and-conquer base-10**k conversion
+4. Batch versions over lists of inputs
+5. Benchmarks at 10**5-digit sizes
+
+Run this file to see the examples and the benchmark.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import benchmark
+
+LEAF_DIGITS = 1000  # chunks this small are converted with str()
+
+
+def power(base, exponent):
+    """
+    Return base ** exponent by repeated squaring, without recursion.
+
+    Each bit of the exponent costs one squaring and (if the bit is set)
+    one extra multiplication, so 2**1_000_000 needs about 40 steps.
+    """
+    if exponent < 0:
+        raise ValueError("exponent must be non-negative")
+    result = 1
+    while exponent:
+        if exponent & 1:
+            result *= base
+        base *= base
+        exponent >>= 1
+    return result
+
+
+def mod_power(base, exponent, modulus):
+    """
+    Return (base ** exponent) % modulus without building the huge power.
+
+    Every intermediate result is reduced modulo `modulus`, so the numbers
+    never grow beyond modulus**2. This is what pow(base, exponent, modulus)
+    does internally in C.
+    """
+    if modulus == 1:
+        return 0
+    if exponent < 0:
+        raise ValueError("exponent must be non-negative")
+    result = 1
+    base %= modulus
+    while exponent:
+        if exponent & 1:
+            result = result * base % modulus
+        base = base * base % modulus
+        exponent >>= 1
+    return result
+
+
+def _powers_of_ten(n):
+    """Return [10**LEAF_DIGITS, 10**(2*LEAF_DIGITS), 10**(4*LEAF_DIGITS), ...] up to n"""
+    powers = [10 ** LEAF_DIGITS]
+    while powers[-1] * powers[-1] <= n:
+        powers.append(powers[-1] * powers[-1])
+    return powers
+
+
+def _chunks_base_10k(n, powers):
+    """
+    Yield base-10**LEAF_DIGITS chunks of n using divide and conquer.
+
+    n is split as divmod(n, 10**(LEAF_DIGITS * 2**i)) with the largest
+    power that fits, so big divisions are done a few times on big numbers
+    instead of once per digit. The explicit stack keeps it non-recursive.
+    """
+    stack = [(n, len(powers) - 1)]
+    while stack:
+        value, level = stack.pop()
+        while level >= 0 and value < powers[level]:
+            level -= 1
+        if level < 0:
+            yield value
+            continue
+        high, low = divmod(value, powers[level])
+        stack.append((low, level - 1))
+        stack.append((high, level - 1))
+
+
+def sum_of_digits(n):
+    """
+    Return the sum of the decimal digits of n.
+
+    Small chunks are turned into strings; subtracting ord('0') from every
+    byte gives the digit values, and sum() over bytes runs in C.
+    """
+    n = abs(n)
+    if n < 10 ** LEAF_DIGITS:
+        text = str(n).encode()
+        return sum(text) - 48 * len(text)
+    total = 0
+    for chunk in _chunks_base_10k(n, _powers_of_ten(n)):
+        text = str(chunk).encode()
+        total += sum(text) - 48 * len(text)
+    return total
+
+
+def power_batch(bases, exponents, modulus=None):
+    """Return [power(b, e)] (or [pow(b, e, modulus)]) for every pair"""
+    if modulus is None:
+        return [power(b, e) for b, e in zip(bases, exponents)]
+    return [pow(b, e, modulus) for b, e in zip(bases, exponents)]
+
+
+def sum_of_digits_batch(numbers):
+    """Return [sum_of_digits(n) for n in numbers], sharing the powers of ten"""
+    numbers = [abs(n) for n in numbers]
+    if not numbers:
+        return []
+    powers = _powers_of_ten(max(numbers))
+    results = []
+    for n in numbers:
+        total = 0
+        for chunk in _chunks_base_10k(n, powers):
+            text = str(chunk).encode()
+            total += sum(text) - 48 * len(text)
+        results.append(total)
+    return results
+
+
+def power_linear(base, exponent):
+    """One multiplication per step (the loop form of the exercise solution)"""
+    result = 1
+    for _ in range(exponent):
+        result *= base
+    return result
+
+
+def sum_of_digits_linear(n):
+    """One % and one // per digit (the loop form of the exercise solution)"""
+    total = 0
+    while n:
+        total += n % 10
+        n //= 10
+    return total
+
+
+if __name__ == "__main__":
+    print("\n=== Exponentiation by Squaring ===")
+    print("power(2, 3):", power(2, 3))
+    print("power(3, 40):", power(3, 40))
+    print("mod_power(2, 10**18, 1_000_000_007):", mod_power(2, 10 ** 18, 1_000_000_007))
+    print("matches pow():", mod_power(2, 10 ** 18, 1_000_000_007) == pow(2, 10 ** 18, 1_000_000_007))
+
+    print("\n=== Digit Sums ===")
+    print("sum_of_digits(123):", sum_of_digits(123))
+    big = power(7, 120_000)  # about 101,000 digits
+    print("sum_of_digits(7 ** 120000):", sum_of_digits(big))
+
+    print("\n=== Batch Versions ===")
+    print("power_batch:", power_batch([2, 3, 10], [10, 5, 3]))
+    print("power_batch mod 97:", power_batch([2, 3, 10], [10, 5, 3], modulus=97))
+    print("sum_of_digits_batch:", sum_of_digits_batch([123, 9999, 10 ** 20 - 1]))
+
+    print("\n=== Benchmark ===")
+    print(f"power(3, 200_000) loop:      {benchmark(power_linear, 3, 200_000):.3f} s")
+    print(f"power(3, 200_000) squaring:  {benchmark(power, 3, 200_000):.3f} s")
+    for digits in [10_000, 20_000, 100_000]:
+        number = 10 ** digits - 1
+        print(f"{digits:,} digits: per-digit loop {benchmark(sum_of_digits_linear, number):.3f} s, "
+              f"chunked {benchmark(sum_of_digits, number):.4f} s")
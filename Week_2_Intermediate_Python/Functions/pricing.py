@@ -0,0 +1,218 @@
+"""
+Python Batch Pricing Tutorial
+
+basic_functions.py prices one item per call:
+    calculate_total_cost(price, tax_rate=0.1, shipping=5.0)
+Repricing a whole catalogue that way means millions of function calls,
+and float math can be off by a cent (0.1 + 0.2 != 0.3).
+This file extends the idea to batches:
+1. Pricing whole columns of prices, tax rates and shipping at once
+2. NumPy vectorisation when NumPy is installed
+3. Exact money: integer cents (fixed point) or decimal.Decimal
+4. Streaming catalogue-sized CSV files in chunks
+5. Benchmarking the batch path against a Python loop
+
+Run this file to see the examples and the benchmark.
+"""
+
+import csv
+import os
+import sys
+import tempfile
+from array import array
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from itertools import islice, repeat
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import benchmark as best_time, np  # np is None without NumPy; list comprehensions are used instead
+
+CENT = Decimal("0.01")
+RATE_SCALE = 1_000_000  # tax rates in fixed point are stored in parts per million
+INT64_LIMIT = 2 ** 63
+
+
+def calculate_total_cost(price, tax_rate=0.1, shipping=5.0):
+    """The single-item version from basic_functions.py"""
+    tax = price * tax_rate
+    total = price + tax + shipping
+    return total
+
+
+def _column(value, length):
+    """Return value as a list, repeating scalars to the given length"""
+    if isinstance(value, (int, float, Decimal)):
+        return repeat(value, length)
+    return value
+
+
+def total_cost_batch(prices, tax_rates=0.1, shipping=5.0):
+    """
+    Return price + price * tax_rate + shipping for every item, as array('d').
+
+    tax_rates and shipping may be single numbers or one value per item.
+    With NumPy this is three array operations for the whole batch; pass
+    array('d') columns to skip converting Python lists on every call.
+    """
+    if np is not None:
+        prices = np.asarray(prices, dtype=float)
+        totals = prices * (1 + np.asarray(tax_rates, dtype=float)) + np.asarray(shipping, dtype=float)
+        return array('d', np.broadcast_to(totals, prices.shape).tobytes())
+    n = len(prices)
+    return array('d', [p + p * t + s for p, t, s in
+                       zip(prices, _column(tax_rates, n), _column(shipping, n))])
+
+
+def _decimal(value, what):
+    """Decimal(str(value)), with malformed input reported as ValueError"""
+    try:
+        return Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValueError(f"Not a valid {what}: {value!r}") from None
+
+
+def to_cents(amount):
+    """Convert a price such as 19.99 or "19.99" to integer cents exactly"""
+    cents = _decimal(amount, "price") * 100
+    if not cents.is_finite():
+        raise ValueError(f"Not a valid price: {amount!r}")
+    return int(cents.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def to_rate_ppm(rate):
+    """
+    Convert a tax rate such as 0.08875 to parts per million (88750).
+
+    Rates with more than six decimal places cannot be stored exactly and
+    raise ValueError instead of being rounded to a different rate.
+    """
+    scaled = _decimal(rate, "tax rate") * RATE_SCALE
+    if not scaled.is_finite():
+        raise ValueError(f"Not a valid tax rate: {rate!r}")
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"Tax rate {rate!r} has more than 6 decimal places")
+    return int(scaled)
+
+
+def total_cost_cents(price_cents, rate_ppm, shipping_cents):
+    """
+    Return exact totals in integer cents, as array('q').
+
+    Tax is price_cents * rate_ppm / 1_000_000 rounded half up to a whole cent,
+    done with integer arithmetic only, so the results are exact and
+    identical on every machine. All three arguments may be columns.
+
+    NumPy multiplies in int64, which wraps around silently, so it is only
+    used when the largest price times the largest rate fits; otherwise
+    the products are Python ints. Totals beyond int64 raise OverflowError.
+    """
+    half = RATE_SCALE // 2
+    if np is not None:
+        prices = np.asarray(price_cents, dtype=np.int64)
+        rates = np.asarray(rate_ppm, dtype=np.int64)
+        shipping = np.asarray(shipping_cents, dtype=np.int64)
+        if _fits_int64(prices, rates, shipping):
+            totals = prices + (prices * rates + half) // RATE_SCALE + shipping
+            return array('q', np.broadcast_to(totals, prices.shape).tobytes())
+        price_cents, rate_ppm, shipping_cents = prices.tolist(), rates.tolist(), shipping.tolist()
+    n = len(price_cents)
+    return array('q', [p + (p * r + half) // RATE_SCALE + s for p, r, s in
+                       zip(price_cents, _column(rate_ppm, n), _column(shipping_cents, n))])
+
+
+def _largest(values):
+    return max(abs(int(values.min())), abs(int(values.max()))) if values.size else 0
+
+
+def _fits_int64(prices, rates, shipping):
+    """True if price * rate + price + shipping cannot leave int64 for any item"""
+    largest_price = _largest(prices)
+    bound = largest_price * _largest(rates) + RATE_SCALE + largest_price + _largest(shipping)
+    return bound < INT64_LIMIT
+
+
+def total_cost_decimal(prices, tax_rates=Decimal("0.1"), shipping=Decimal("5.00")):
+    """Return exact Decimal totals, with tax rounded half up to the cent"""
+    n = len(prices)
+    return [p + (p * t).quantize(CENT, rounding=ROUND_HALF_UP) + s
+            for p, t, s in zip(prices, _column(tax_rates, n), _column(shipping, n))]
+
+
+def _required(row, field, number):
+    value = row.get(field)
+    if value is None or not value.strip():
+        raise ValueError(f"Row {number} has no {field!r} value")
+    return value
+
+
+def stream_totals_from_csv(path, price_field='price', tax_field='tax_rate',
+                           shipping_field='shipping', chunk_size=100_000):
+    """
+    Yield (rows, totals_in_cents) for each chunk of a catalogue CSV file.
+
+    Only one chunk is in memory at a time, so the file can be larger than
+    RAM. A missing shipping value uses calculate_total_cost's $5.00
+    default, but every row must have a tax rate: a missing or empty one
+    raises ValueError rather than silently charging 10%.
+    """
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        first = 1  # data rows are numbered from 1
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                break
+            prices = [to_cents(row[price_field]) for row in rows]
+            rates = [to_rate_ppm(_required(row, tax_field, number))
+                     for number, row in enumerate(rows, first)]
+            first += len(rows)
+            shipping = [to_cents(row.get(shipping_field) or "5.00") for row in rows]
+            yield rows, total_cost_cents(prices, rates, shipping)
+
+
+def benchmark(n=10_000_000):
+    """Compare a per-item loop with the batch functions on n items"""
+    prices = [(i % 10_000) / 100 for i in range(n)]
+    rates = [0.05 + (i % 4) * 0.025 for i in range(n)]
+    loop_time = best_time(lambda: [calculate_total_cost(p, t, 5.0) for p, t in zip(prices, rates)])
+
+    # A catalogue is stored as columns once; only the kernels are timed
+    price_column, rate_column = array('d', prices), array('d', rates)
+    batch_time = best_time(total_cost_batch, price_column, rate_column, 5.0, repeat=3)
+    cents = array('q', [i % 10_000 for i in range(n)])
+    rate_ppm = array('q', [50_000 + (i % 4) * 25_000 for i in range(n)])
+    cents_time = best_time(total_cost_cents, cents, rate_ppm, 500, repeat=3)
+
+    print(f"{n:,} items ({'NumPy' if np else 'pure Python'} backend)")
+    print(f"  calculate_total_cost loop: {loop_time:.3f} s")
+    print(f"  total_cost_batch (float):  {batch_time:.3f} s ({loop_time / batch_time:.1f}x)")
+    print(f"  total_cost_cents (exact):  {cents_time:.3f} s ({loop_time / cents_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    print("\n=== Batch Pricing (floats) ===")
+    prices = [50, 19.99, 100]
+    print("Totals:", list(total_cost_batch(prices)))
+    print("Per-item tax rates:", list(total_cost_batch(prices, [0.1, 0.15, 0.2], [5.0, 7.5, 0])))
+
+    print("\n=== Exact Money ===")
+    print("Float:   0.1 * 3 =", 0.1 * 3)
+    cents = [to_cents(p) for p in prices]
+    print("Integer cents:", list(total_cost_cents(cents, to_rate_ppm(0.15), to_cents(7.50))))
+    tax = total_cost_cents([100_000], to_rate_ppm("0.08875"), 0)[0] - 100_000
+    print(f"8.875% tax on $1000.00: ${tax / 100:.2f}")
+    decimals = [Decimal("50"), Decimal("19.99"), Decimal("100")]
+    print("Decimal:", total_cost_decimal(decimals, Decimal("0.15"), Decimal("7.50")))
+
+    print("\n=== Streaming a Catalogue CSV ===")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "catalogue.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["sku", "price", "tax_rate", "shipping"])
+            for i in range(25):
+                writer.writerow([f"SKU{i:03}", f"{i * 1.25 + 0.99:.2f}", "0.0825", "4.99"])
+        for rows, totals in stream_totals_from_csv(path, chunk_size=10):
+            print(f"Chunk of {len(rows)} rows, first total: ${totals[0] / 100:.2f}")
+
+    print("\n=== Benchmark ===")
+    benchmark(1_000_000)  # call benchmark() for the full 10,000,000 items
@@ -0,0 +1,206 @@
+"""
+Python Profiling Decorator Tutorial
+
+The timer_decorator exercise (exercises/function_exercises.py) measures
+with time.time() and prints on every call, and announce_operation in
+advanced_functions.py prints twice per call. That is fine for learning
+decorators, but it makes hot functions very slow.
+This file shows a decorator meant to stay on in real code:
+1. time.perf_counter_ns() - a monotonic, high-resolution clock
+2. Per-function statistics: count, total, min, max and percentiles
+3. Per-thread buffers, so threads never wait for each other
+4. A global on/off switch that costs one attribute check when off
+5. A text report and JSON export
+
+Run this file to see the examples and the benchmark.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+SAMPLES_PER_THREAD = 10_000  # recent durations kept per function per thread
+
+
+class _Stats:
+    """Statistics for one function, owned by exactly one thread"""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'samples')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self.samples = deque(maxlen=SAMPLES_PER_THREAD)
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        if self.min is None or duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        self.samples.append(duration)
+
+
+class Profiler:
+    """
+    Collects timings from functions decorated with @profiler.profile.
+
+    Every thread writes into its own dictionary (found through
+    threading.local), so recording needs no lock. The lock is only taken
+    once per thread to register its buffer, and when building a report.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._local = threading.local()
+        self._buffers = []
+        self._lock = threading.Lock()
+
+    def _buffer(self):
+        buffer = getattr(self._local, 'stats', None)
+        if buffer is None:
+            buffer = self._local.stats = {}
+            with self._lock:
+                self._buffers.append(buffer)
+        return buffer
+
+    def profile(self, func):
+        """Decorator that records how long every call to func takes"""
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = time.perf_counter_ns() - start
+                buffer = self._buffer()
+                stats = buffer.get(name)
+                if stats is None:
+                    stats = buffer[name] = _Stats()
+                stats.add(duration)
+        return wrapper
+
+    def reset(self):
+        """Forget everything recorded so far"""
+        with self._lock:
+            for buffer in self._buffers:
+                buffer.clear()
+
+    def stats(self):
+        """
+        Merge all threads' buffers into one summary per function.
+
+        Times are in nanoseconds. Percentiles are computed from the most
+        recent SAMPLES_PER_THREAD calls in each thread.
+        """
+        merged = {}
+        with self._lock:
+            buffers = [dict(buffer) for buffer in self._buffers]
+        for buffer in buffers:
+            for name, stats in buffer.items():
+                entry = merged.setdefault(name, {'count': 0, 'total_ns': 0,
+                                                 'min_ns': None, 'max_ns': 0,
+                                                 'samples': []})
+                entry['count'] += stats.count
+                entry['total_ns'] += stats.total
+                if entry['min_ns'] is None or stats.min < entry['min_ns']:
+                    entry['min_ns'] = stats.min
+                entry['max_ns'] = max(entry['max_ns'], stats.max)
+                entry['samples'].extend(stats.samples)
+        for entry in merged.values():
+            samples = sorted(entry.pop('samples'))
+            entry['mean_ns'] = entry['total_ns'] / entry['count']
+            for p in (50, 90, 99):
+                index = min(len(samples) - 1, int(len(samples) * p / 100))
+                entry[f'p{p}_ns'] = samples[index]
+        return merged
+
+    def to_json(self, indent=2):
+        """Return the statistics as a JSON string"""
+        return json.dumps(self.stats(), indent=indent)
+
+    def report(self):
+        """Return the statistics as a readable table (times in microseconds)"""
+        lines = [f"{'function':<40} {'calls':>8} {'total':>10} {'mean':>8} "
+                 f"{'min':>8} {'p50':>8} {'p99':>8} {'max':>8}"]
+        rows = sorted(self.stats().items(), key=lambda item: item[1]['total_ns'],
+                      reverse=True)
+        for name, s in rows:
+            lines.append(
+                f"{name:<40} {s['count']:>8} {s['total_ns'] / 1000:>10.1f} "
+                f"{s['mean_ns'] / 1000:>8.2f} {s['min_ns'] / 1000:>8.2f} "
+                f"{s['p50_ns'] / 1000:>8.2f} {s['p99_ns'] / 1000:>8.2f} "
+                f"{s['max_ns'] / 1000:>8.2f}")
+        return "\n".join(lines)
+
+
+# Shared profiler for the examples; profiler.enabled = False turns it off
+profiler = Profiler()
+profile = profiler.profile
+
+
+if __name__ == "__main__":
+    print("\n=== Profiling Functions ===")
+
+    @profile
+    def add_numbers(a, b):
+        return a + b
+
+    @profile
+    def slow_function():
+        time.sleep(0.01)
+        return "Done!"
+
+    for i in range(1000):
+        add_numbers(i, i)
+    for _ in range(5):
+        slow_function()
+    print(profiler.report())
+
+    print("\n=== Multiple Threads ===")
+    threads = [threading.Thread(target=lambda: [add_numbers(1, 2) for _ in range(10_000)])
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    calls = profiler.stats()[f"{__name__}.add_numbers"]['count']
+    print("add_numbers calls recorded across threads:", calls)
+
+    print("\n=== JSON Export ===")
+    print(profiler.to_json()[:200], "...")
+
+    print("\n=== Overhead ===")
+    def plain(a, b):
+        return a + b
+
+    n = 1_000_000
+    start = time.perf_counter()
+    for i in range(n):
+        plain(i, i)
+    base = time.perf_counter() - start
+
+    profiler.enabled = False
+    start = time.perf_counter()
+    for i in range(n):
+        add_numbers(i, i)
+    disabled = time.perf_counter() - start
+
+    profiler.enabled = True
+    start = time.perf_counter()
+    for i in range(n):
+        add_numbers(i, i)
+    enabled = time.perf_counter() - start
+
+    print(f"Undecorated:        {base:.3f} s")
+    print(f"Profiler disabled:  {disabled:.3f} s")
+    print(f"Profiler enabled:   {enabled:.3f} s")
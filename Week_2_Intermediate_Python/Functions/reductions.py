@@ -0,0 +1,175 @@
+"""
+Python Reductions Tutorial
+
+recursion.py sums a list with
+    numbers[0] + sum_recursive(numbers[1:])
+Every call copies the rest of the list, so the total work is O(n**2) and
+the recursion goes n levels deep (it fails past ~1000 items).
+This file keeps the same recursive idea but fixes both problems:
+1. Recursing over index ranges instead of slices (no copies)
+2. Divide and conquer so the depth is log2(n), not n
+3. memoryview support for array.array / bytes buffers
+4. User-supplied combiners (sum, product, max, ...)
+5. Parallel reduction over chunks with a process pool
+6. Benchmarking against sum_iterative and the built-in sum()
+
+Run this file to see the examples and the benchmark.
+"""
+
+import operator
+import os
+import sys
+from array import array, typecodes
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import benchmark
+
+LEAF_SIZE = 64  # ranges this small are reduced with a simple loop
+
+
+def reduce_range(numbers, combine, low=0, high=None, initial=None):
+    """
+    Reduce numbers[low:high] with combine(a, b) without copying anything.
+
+    The range is split in half until it is small enough to loop over, so
+    the recursion depth is about log2(n / LEAF_SIZE). combine must be
+    associative (like +, *, max) for the split to give the right answer.
+    `initial` is returned for an empty range. Unlike slicing, bounds are
+    not clipped: 0 <= low <= high <= len(numbers) must hold, otherwise
+    ValueError is raised (a negative low would silently wrap around).
+    """
+    if high is None:
+        high = len(numbers)
+    if not 0 <= low <= high <= len(numbers):
+        raise ValueError(f"reduce_range() bounds low={low}, high={high} are outside "
+                         f"0 <= low <= high <= {len(numbers)}")
+    if low == high:
+        if initial is None:
+            raise ValueError("reduce_range() of an empty range with no initial value")
+        return initial
+    return _reduce_range(numbers, combine, low, high)
+
+
+def _reduce_range(numbers, combine, low, high):
+    """The recursion behind reduce_range(), for a valid non-empty range"""
+    if high - low <= LEAF_SIZE:
+        result = numbers[low]
+        for i in range(low + 1, high):
+            result = combine(result, numbers[i])
+        return result
+    middle = (low + high) // 2
+    left = _reduce_range(numbers, combine, low, middle)
+    right = _reduce_range(numbers, combine, middle, high)
+    return combine(left, right)
+
+
+def sum_recursive(numbers, low=0, high=None):
+    """Sum numbers[low:high] recursively, using index ranges"""
+    return reduce_range(numbers, operator.add, low, high, initial=0)
+
+
+def product_recursive(numbers, low=0, high=None):
+    """Multiply numbers[low:high] recursively, using index ranges"""
+    return reduce_range(numbers, operator.mul, low, high, initial=1)
+
+
+def max_recursive(numbers, low=0, high=None):
+    """Return the largest value in numbers[low:high]"""
+    return reduce_range(numbers, max, low, high)
+
+
+def as_buffer(numbers):
+    """
+    Return a zero-copy view when numbers supports the buffer protocol.
+
+    array.array, bytes and bytearray become a memoryview, so indexing
+    reads straight from the original memory. Lists are returned as they are.
+    """
+    try:
+        return memoryview(numbers)
+    except TypeError:
+        return numbers
+
+
+def _reduce_chunk(args):
+    """Worker function: reduce one chunk (must live at module level to pickle)"""
+    chunk, combine = args
+    return reduce(combine, chunk)
+
+
+def _picklable(chunk):
+    """
+    Return a chunk that can be sent to a worker process.
+
+    memoryview slices cannot be pickled, so their values are copied into
+    an array.array of the same type (or a list for other formats).
+    """
+    if not isinstance(chunk, memoryview):
+        return chunk
+    if chunk.format in typecodes:
+        return array(chunk.format, chunk.tobytes())
+    return chunk.tolist()
+
+
+def parallel_reduce(numbers, combine=operator.add, workers=4, chunk_size=1_000_000):
+    """
+    Reduce a large sequence by splitting it into chunks and reducing each
+    chunk in a separate process, then combining the partial results.
+
+    combine must be associative and picklable (operator.add, max, or a
+    function defined at module level - not a lambda). Chunks have to be
+    copied to reach the worker processes, so this only pays off for large
+    inputs; small inputs are reduced in the current process.
+    """
+    n = len(numbers)
+    if n == 0:
+        raise ValueError("parallel_reduce() of an empty sequence")
+    if n <= chunk_size or workers <= 1:
+        return reduce_range(as_buffer(numbers), combine)
+    tasks = ((_picklable(numbers[start:start + chunk_size]), combine)
+             for start in range(0, n, chunk_size))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = list(executor.map(_reduce_chunk, tasks))
+    return reduce(combine, partials)
+
+
+def sum_iterative(numbers):
+    """Sum a list using iteration (same as recursion.py)"""
+    total = 0
+    for num in numbers:
+        total += num
+    return total
+
+
+if __name__ == "__main__":
+    print("\n=== Recursive Reductions Without Slicing ===")
+    numbers = [1, 2, 3, 4, 5]
+    print("Numbers:", numbers)
+    print("sum_recursive:", sum_recursive(numbers))
+    print("product_recursive:", product_recursive(numbers))
+    print("max_recursive:", max_recursive(numbers))
+    print("sum of numbers[1:4]:", sum_recursive(numbers, 1, 4))
+
+    print("\n=== Custom Combiners ===")
+    words = ["map", "filter", "reduce", "lambda"]
+    longest = reduce_range(words, lambda a, b: a if len(a) >= len(b) else b)
+    print("Longest word:", longest)
+
+    print("\n=== Large Inputs (no RecursionError) ===")
+    big_list = list(range(1_000_000))
+    print("sum_recursive of 1,000,000 items:", sum_recursive(big_list))
+    big_array = array('d', big_list)
+    print("Using a memoryview over array('d'):", sum_recursive(as_buffer(big_array)))
+
+    print("\n=== Parallel Reduction ===")
+    huge = list(range(4_000_000))
+    print("parallel_reduce:", parallel_reduce(huge, operator.add, workers=4))
+
+    print("\n=== Benchmark (1,000,000 items) ===")
+    print(f"built-in sum():   {benchmark(sum, big_list):.4f} s")
+    print(f"sum_iterative:    {benchmark(sum_iterative, big_list):.4f} s")
+    print(f"sum_recursive:    {benchmark(sum_recursive, big_list):.4f} s")
+    print(f"parallel_reduce:  {benchmark(parallel_reduce, big_list, operator.add, 4, 250_000):.4f} s")
+    print("(The slicing version from recursion.py cannot even run at this size)")
@@ -0,0 +1,247 @@
+"""
+Python Sorted Index Tutorial
+
+recursion.py's binary_search answers one query per call by recursing over
+a Python list. When the same sorted data is probed with millions of keys,
+the per-call overhead dominates. This file shows a sorted index that:
+1. Stores numbers compactly in array.array chunks
+2. Supports incremental inserts (only one small chunk is shifted)
+3. Answers lower/upper-bound, membership and range-count queries
+4. Answers whole batches of queries in one call (NumPy searchsorted
+   when NumPy is installed, the C-level bisect module otherwise)
+5. Benchmarks batch lookups against looping over binary_search
+
+Run this file to see the examples and the benchmark.
+"""
+
+import bisect
+import os
+import random
+import sys
+import time
+from array import array
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for perf_utils.py
+from perf_utils import np  # np is None without NumPy; the bisect fallback still works
+
+
+class SortedIndex:
+    """
+    A sorted collection of numbers stored in fixed-size chunks.
+
+    Each chunk is an array.array kept in sorted order, and `_maxes` holds
+    the last value of every chunk so a query first bisects the chunk list
+    and then bisects inside one chunk. Inserting only shifts the items of
+    one chunk; a chunk that grows past 2 * chunk_size is split in two.
+    """
+
+    def __init__(self, values=(), typecode='d', chunk_size=4096):
+        self.typecode = typecode
+        self.chunk_size = chunk_size
+        data = sorted(values)
+        self._chunks = [array(typecode, data[i:i + chunk_size])
+                        for i in range(0, len(data), chunk_size)]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._offsets = None  # cumulative chunk sizes, rebuilt lazily
+        self._flat = None     # flattened copy for batch queries, rebuilt lazily
+        self._length = len(data)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("SortedIndex index out of range")
+        offsets = self._chunk_offsets()
+        chunk_number = bisect.bisect_right(offsets, position) - 1
+        return self._chunks[chunk_number][position - offsets[chunk_number]]
+
+    def __repr__(self):
+        return f"SortedIndex(len={self._length}, chunks={len(self._chunks)})"
+
+    def _invalidate(self):
+        self._offsets = None
+        self._flat = None
+
+    def _chunk_offsets(self):
+        """Return the position of the first item of every chunk"""
+        if self._offsets is None:
+            offsets, total = [], 0
+            for chunk in self._chunks:
+                offsets.append(total)
+                total += len(chunk)
+            self._offsets = offsets
+        return self._offsets
+
+    def insert(self, value):
+        """Insert a value, keeping everything sorted"""
+        if not self._chunks:
+            self._chunks.append(array(self.typecode, [value]))
+            self._maxes.append(value)
+        else:
+            chunk_number = bisect.bisect_left(self._maxes, value)
+            if chunk_number == len(self._chunks):
+                chunk_number -= 1  # larger than everything: append to last chunk
+            chunk = self._chunks[chunk_number]
+            chunk.insert(bisect.bisect_right(chunk, value), value)
+            self._maxes[chunk_number] = chunk[-1]
+            if len(chunk) > 2 * self.chunk_size:
+                half = len(chunk) // 2
+                self._chunks[chunk_number:chunk_number + 1] = [chunk[:half], chunk[half:]]
+                self._maxes[chunk_number:chunk_number + 1] = [chunk[half - 1], chunk[-1]]
+        self._length += 1
+        self._invalidate()
+
+    def extend(self, values):
+        """Insert many values at once"""
+        for value in values:
+            self.insert(value)
+
+    def _bound(self, value, bisect_func):
+        if not self._chunks:
+            return 0
+        chunk_number = bisect_func(self._maxes, value)
+        if chunk_number == len(self._chunks):
+            return self._length
+        offset = self._chunk_offsets()[chunk_number]
+        return offset + bisect_func(self._chunks[chunk_number], value)
+
+    def lower_bound(self, value):
+        """Return the position of the first item >= value"""
+        return self._bound(value, bisect.bisect_left)
+
+    def upper_bound(self, value):
+        """Return the position of the first item > value"""
+        return self._bound(value, bisect.bisect_right)
+
+    def count_range(self, low, high):
+        """Return how many items satisfy low <= item <= high"""
+        return max(0, self.upper_bound(high) - self.lower_bound(low))
+
+    def __contains__(self, value):
+        position = self.lower_bound(value)
+        return position < self._length and self[position] == value
+
+    def index(self, value):
+        """Return the position of value, or -1 (like binary_search)"""
+        position = self.lower_bound(value)
+        if position < self._length and self[position] == value:
+            return position
+        return -1
+
+    # Batch queries -------------------------------------------------------
+
+    def _flattened(self):
+        """Return all items as one contiguous buffer (cached until an insert)"""
+        if self._flat is None:
+            flat = array(self.typecode)
+            for chunk in self._chunks:
+                flat.extend(chunk)
+            self._flat = np.frombuffer(flat, dtype=flat.typecode) if np else flat
+        return self._flat
+
+    def lower_bound_batch(self, values):
+        """Return lower_bound(v) for every v in values"""
+        flat = self._flattened()
+        if np is not None:
+            return np.searchsorted(flat, values, side='left')
+        return [bisect.bisect_left(flat, v) for v in values]
+
+    def upper_bound_batch(self, values):
+        """Return upper_bound(v) for every v in values"""
+        flat = self._flattened()
+        if np is not None:
+            return np.searchsorted(flat, values, side='right')
+        return [bisect.bisect_right(flat, v) for v in values]
+
+    def index_batch(self, values):
+        """Return the position of every value, or -1 where it is missing"""
+        flat = self._flattened()
+        if np is not None:
+            # Keep the probes' own dtype: casting 7.5 to an int index's dtype
+            # would truncate it to 7 and report a match
+            values = np.asarray(values)
+            if values.dtype.kind in 'biuf':
+                if len(flat) == 0:
+                    return np.full(len(values), -1)
+                positions = np.searchsorted(flat, values, side='left')
+                clipped = np.minimum(positions, len(flat) - 1)
+                found = (positions < len(flat)) & (flat[clipped] == values)
+                return np.where(found, positions, -1)
+            values = values.tolist()  # e.g. ints too large for int64: use bisect
+        n = len(flat)
+        result = []
+        for v in values:
+            position = bisect.bisect_left(flat, v)
+            result.append(position if position < n and flat[position] == v else -1)
+        return result
+
+    def count_range_batch(self, lows, highs):
+        """Return count_range(low, high) for every pair of bounds"""
+        if np is not None:
+            counts = self.upper_bound_batch(highs) - self.lower_bound_batch(lows)
+            return np.maximum(counts, 0)
+        return [max(0, hi - lo) for lo, hi in
+                zip(self.lower_bound_batch(lows), self.upper_bound_batch(highs))]
+
+
+def binary_search(arr, target, low=0, high=None):
+    """Recursive binary search from recursion.py, used for comparison"""
+    if high is None:
+        high = len(arr) - 1
+    if low > high:
+        return -1
+    mid = (low + high) // 2
+    if arr[mid] == target:
+        return mid
+    elif arr[mid] > target:
+        return binary_search(arr, target, low, mid - 1)
+    else:
+        return binary_search(arr, target, mid + 1, high)
+
+
+if __name__ == "__main__":
+    print("\n=== Building a Sorted Index ===")
+    sorted_numbers = [1, 3, 5, 7, 9, 11, 13, 15]
+    index = SortedIndex(sorted_numbers, typecode='q', chunk_size=4)
+    print("Index:", index, list(index))
+    print("Position of 7:", index.index(7))
+    print("Position of 10:", index.index(10))
+
+    print("\n=== Bounds and Range Counts ===")
+    print("lower_bound(8):", index.lower_bound(8))
+    print("upper_bound(9):", index.upper_bound(9))
+    print("Items between 4 and 12:", index.count_range(4, 12))
+
+    print("\n=== Incremental Inserts ===")
+    for value in [10, 0, 16, 10]:
+        index.insert(value)
+    print("After inserts:", list(index), index)
+
+    print("\n=== Batch Queries ===")
+    print("Backend:", "NumPy" if np else "bisect")
+    print("index_batch([7, 10, 2]):", list(index.index_batch([7, 10, 2])))
+    print("count_range_batch:", list(index.count_range_batch([0, 5], [4, 11])))
+
+    print("\n=== Benchmark ===")
+    data = sorted(random.sample(range(10_000_000), 1_000_000))
+    probes = [random.randrange(10_000_000) for _ in range(200_000)]
+    big_index = SortedIndex(data, typecode='q')
+
+    start = time.perf_counter()
+    looped = [binary_search(data, p) for p in probes]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = big_index.index_batch(probes)
+    batch_time = time.perf_counter() - start
+
+    print(f"Looping binary_search: {loop_time:.3f} s")
+    print(f"index_batch:           {batch_time:.3f} s ({loop_time / batch_time:.0f}x faster)")
+    print("Same answers:", list(looped) == list(batched))
@@ -0,0 +1,194 @@
+"""
+Python Tree Renderer Tutorial
+
+recursion.py draws trees with print_binary_tree and
+print_directory_structure. Both recurse and call print() once per line,
+so print_binary_tree(20) (about three million lines) spends nearly all
+its time in interpreter and print() overhead.
+This file renders the same output faster:
+1. Walking the tree iteratively with an explicit stack
+2. Yielding lines from a generator instead of printing them
+3. Writing lines in large chunks through a buffered writer
+4. Rendering a real directory lazily with os.scandir
+5. Depth and entry limits for huge directory trees
+
+Run this file to see the examples and the benchmark.
+"""
+
+import io
+import os
+import sys
+import time
+from itertools import islice
+
+
+def iter_binary_tree(n, prefix=""):
+    """
+    Yield the lines of print_binary_tree(n) without recursion.
+
+    The stack holds either finished lines (str) or subtrees still to be
+    expanded ((depth, prefix) tuples). Items are pushed in reverse order so
+    they come off the stack in the same order the recursive version prints.
+    """
+    stack = [(n, prefix)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+            continue
+        depth, prefix = item
+        if depth == 0:
+            continue
+        stack.append((depth - 1, prefix + "    "))
+        stack.append(prefix + "└── Right")
+        stack.append((depth - 1, prefix + "│   "))
+        yield prefix + "│"
+        yield prefix + "├── Left"
+
+
+def iter_directory_structure(structure, prefix=""):
+    """
+    Yield the lines of print_directory_structure(structure) iteratively.
+
+    structure is a dictionary where keys are names and values are None for
+    files or another dictionary for folders. The stack holds one iterator
+    per open folder, so nothing is copied while walking.
+    """
+    stack = [(iter(structure.items()), prefix)]
+    while stack:
+        entries, prefix = stack[-1]
+        for name, contents in entries:
+            yield prefix + "├── " + name
+            if contents:  # If it's a directory, descend into it next
+                stack.append((iter(contents.items()), prefix + "│   "))
+                break
+        else:
+            stack.pop()
+
+
+def iter_filesystem(root, max_depth=None, max_entries=None, show_hidden=False):
+    """
+    Yield tree lines for a real directory, scanning lazily with os.scandir.
+
+    Only one os.scandir iterator per open directory is alive at a time, so
+    memory stays small even for huge trees. max_depth limits how deep we
+    go (0 = only the root's children); max_entries stops after that many
+    lines in total. Entries that cannot be read are shown with a marker.
+    """
+    def open_dir(path):
+        try:
+            return os.scandir(path)
+        except OSError:
+            return None
+
+    yield os.path.basename(os.path.abspath(root)) or root
+    emitted = 0
+    scanner = open_dir(root)
+    if scanner is None:
+        return
+    stack = [(scanner, "", 0)]
+    try:
+        while stack:
+            scanner, prefix, depth = stack[-1]
+            for entry in scanner:
+                if not show_hidden and entry.name.startswith('.'):
+                    continue
+                if max_entries is not None and emitted >= max_entries:
+                    yield prefix + "└── ... (entry limit reached)"
+                    return
+                emitted += 1
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                yield prefix + "├── " + entry.name + ("/" if is_dir else "")
+                if is_dir and (max_depth is None or depth < max_depth):
+                    child = open_dir(entry.path)
+                    if child is None:
+                        yield prefix + "│   └── [permission denied]"
+                    else:
+                        stack.append((child, prefix + "│   ", depth + 1))
+                        break
+            else:
+                scanner.close()
+                stack.pop()
+    finally:
+        for scanner, _, _ in stack:
+            scanner.close()
+
+
+def write_lines(lines, stream=None, chunk_lines=10_000):
+    """
+    Write lines to a stream in large chunks and return how many were written.
+
+    Instead of one write (and one print) per line, lines are collected
+    into batches and joined into a single string per batch.
+    """
+    if stream is None:
+        stream = sys.stdout
+    lines = iter(lines)
+    total = 0
+    while True:
+        batch = list(islice(lines, chunk_lines))
+        if not batch:
+            break
+        stream.write("\n".join(batch))
+        stream.write("\n")
+        total += len(batch)
+    stream.flush()
+    return total
+
+
+def print_binary_tree(n, prefix=""):
+    """The recursive version from recursion.py, used for comparison"""
+    if n == 0:
+        return
+    print(prefix + "│")
+    print(prefix + "├── Left")
+    print_binary_tree(n-1, prefix + "│   ")
+    print(prefix + "└── Right")
+    print_binary_tree(n-1, prefix + "    ")
+
+
+if __name__ == "__main__":
+    print("\n=== Binary Tree (iterative) ===")
+    write_lines(iter_binary_tree(2))
+
+    print("\n=== Directory Structure (iterative) ===")
+    directory = {
+        "project": {
+            "src": {
+                "main.py": None,
+                "utils.py": None
+            },
+            "tests": {
+                "test_main.py": None
+            },
+            "README.md": None
+        }
+    }
+    write_lines(iter_directory_structure(directory))
+
+    print("\n=== Real Filesystem (lazy os.scandir) ===")
+    write_lines(iter_filesystem(os.path.dirname(os.path.abspath(__file__)),
+                                max_depth=1, max_entries=15))
+
+    print("\n=== Benchmark: binary tree of depth 16 ===")
+    depth = 16
+    sink = io.StringIO()
+    original_stdout = sys.stdout
+    start = time.perf_counter()
+    sys.stdout = sink
+    try:
+        print_binary_tree(depth)
+    finally:
+        sys.stdout = original_stdout
+    recursive_time = time.perf_counter() - start
+
+    sink = io.StringIO()
+    start = time.perf_counter()
+    count = write_lines(iter_binary_tree(depth), sink)
+    streaming_time = time.perf_counter() - start
+    print(f"Lines rendered: {count:,}")
+    print(f"Recursive print():       {recursive_time:.3f} s")
+    print(f"Generator + write_lines: {streaming_time:.3f} s")
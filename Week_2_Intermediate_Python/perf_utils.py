@@ -0,0 +1,38 @@
+"""
+Shared helpers for the performance tutorials
+
+The Functions and Day_1_Data_Structures performance modules all use:
+1. np - NumPy when it is installed, otherwise None (see requirements.txt)
+2. benchmark(func, *args) - the best wall time of one or more calls
+3. timed(func, *args) - a call's result together with its wall time
+
+Modules import them with
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from perf_utils import np, benchmark
+Tests switch a module to its pure Python fallback with
+monkeypatch.setattr(module, 'np', None).
+"""
+
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; every module has a pure Python fallback
+    np = None
+
+
+def benchmark(func, *args, repeat=1):
+    """Return the best wall time (in seconds) of `repeat` calls"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def timed(func, *args):
+    """Call func(*args) once and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start